@@ -0,0 +1,283 @@
+"""Registro das respostas e relatório de análise das perguntas.
+
+Cada resposta dada na interface vira uma linha de um log colunar em
+`analytics/`: um arquivo binário por coluna, só de acréscimos, gravado com
+`array` (o jogo não depende do NumPy):
+
+    sessao.u32      partida (identificador crescente, uma por partida)
+    topico.u16      tópico (posição em topicos.txt)
+    indice.u32      índice da pergunta no banco do tópico
+    escolhida.u8    opção escolhida, na ordem do banco (já desfeito o embaralhamento)
+    correta.u8      1 se acertou
+    latencia.u32    tempo até responder, em milissegundos
+
+Uma queda no meio de uma gravação pode deixar colunas com tamanhos
+diferentes; a leitura usa só as linhas completas em todas.
+
+O relatório (`python analytics.py`) lê as colunas inteiras com NumPy e
+agrega tudo com operações vetoriais (`bincount`, `sort`), sem
+laço em Python por resposta: acerto por pergunta e por tópico, índice de
+discriminação, percentis do tempo de resposta e a opção errada mais
+escolhida. O NumPy só é importado pelo relatório.
+
+Índice de discriminação: as partidas são ordenadas pela taxa de acerto e
+separadas nos 27% melhores e 27% piores; o índice de uma pergunta é o
+acerto dela entre as melhores menos o acerto entre as piores. Perto de
+zero (ou negativo), a pergunta não separa quem sabe de quem não sabe.
+
+Uso:
+    python analytics.py [--limite 20] [--ordenar acerto|discriminacao|respostas]
+"""
+import argparse
+import os
+import sys
+from array import array
+
+ANALYTICS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "analytics")
+
+# Coluna -> código de tipo do `array` (o nome do arquivo diz a largura)
+COLUMNS = {
+    "sessao": ("I", "u32"),
+    "topico": ("H", "u16"),
+    "indice": ("I", "u32"),
+    "escolhida": ("B", "u8"),
+    "correta": ("B", "u8"),
+    "latencia": ("I", "u32"),
+}
+TOPICS_FILE = "topicos.txt"
+SESSION_FILE = "proxima_sessao"
+
+FLUSH_EVERY = 64           # Linhas acumuladas antes de gravar
+UPPER_LOWER = 0.27         # Fração das partidas em cada grupo do índice de discriminação
+PERCENTILES = (50, 90, 99)
+
+
+def column_path(directory, name):
+    return os.path.join(directory, f"{name}.{COLUMNS[name][1]}")
+
+
+class AnswerLog:
+    """Acumula respostas em arrays por coluna e acrescenta aos arquivos em lotes"""
+
+    def __init__(self, directory=ANALYTICS_DIR, flush_every=FLUSH_EVERY):
+        self.directory = directory
+        self.flush_every = flush_every
+        os.makedirs(directory, exist_ok=True)
+        self.columns = {name: array(code) for name, (code, _) in COLUMNS.items()}
+        self.topics = self._load_topics()
+        self.session = None
+
+    def _load_topics(self):
+        path = os.path.join(self.directory, TOPICS_FILE)
+        if not os.path.exists(path):
+            return {}
+        with open(path, encoding="utf-8") as f:
+            return {line.rstrip("\n"): i for i, line in enumerate(f)}
+
+    def _topic_code(self, topic):
+        code = self.topics.get(topic)
+        if code is None:
+            code = self.topics[topic] = len(self.topics)
+            with open(os.path.join(self.directory, TOPICS_FILE), "a", encoding="utf-8") as f:
+                f.write(topic + "\n")
+        return code
+
+    def _next_session(self):
+        path = os.path.join(self.directory, SESSION_FILE)
+        session = 0
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                session = int(f.read().strip() or 0)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(str(session + 1))
+        return session
+
+    def new_session(self):
+        """As próximas respostas são de uma nova partida"""
+        self.session = None
+
+    def record(self, topic, index, option, correct, latency):
+        """Registra uma resposta: `option` na ordem do banco, `latency` em segundos"""
+        if self.session is None:
+            self.session = self._next_session()
+        columns = self.columns
+        columns["sessao"].append(self.session)
+        columns["topico"].append(self._topic_code(topic))
+        columns["indice"].append(index)
+        columns["escolhida"].append(option)
+        columns["correta"].append(1 if correct else 0)
+        columns["latencia"].append(min(int(latency * 1000), 0xFFFFFFFF))
+        if len(columns["sessao"]) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if not self.columns["sessao"]:
+            return
+        for name, values in self.columns.items():
+            with open(column_path(self.directory, name), "ab") as f:
+                values.tofile(f)
+            del values[:]
+
+    def close(self):
+        self.flush()
+
+
+def load_columns(directory=ANALYTICS_DIR):
+    """Colunas como arrays NumPy, cortadas no número de linhas completas"""
+    import numpy as np
+
+    dtypes = {"u32": np.uint32, "u16": np.uint16, "u8": np.uint8}
+    columns = {}
+    for name, (_, suffix) in COLUMNS.items():
+        path = column_path(directory, name)
+        columns[name] = np.fromfile(path, dtype=dtypes[suffix]) if os.path.exists(path) else np.empty(0, dtypes[suffix])
+    rows = min(len(values) for values in columns.values())
+    return {name: values[:rows] for name, values in columns.items()}
+
+
+def group_percentiles(groups, values, n_groups, percentiles=PERCENTILES):
+    """Percentis de `values` (inteiros de 32 bits) em cada grupo 0..n_groups-1: matriz n_groups × len(percentiles)"""
+    import numpy as np
+
+    # Uma única ordenação da chave (grupo, valor) em um inteiro: bem mais rápida que `lexsort`
+    sorted_values = np.sort((groups.astype(np.int64) << 32) | values) & 0xFFFFFFFF
+    counts = np.bincount(groups, minlength=n_groups)
+    starts = np.cumsum(counts) - counts
+    result = np.full((n_groups, len(percentiles)), np.nan)
+    present = counts > 0
+    for k, p in enumerate(percentiles):
+        # Percentil pelo posto mais próximo dentro do trecho ordenado de cada grupo
+        offsets = (counts[present] - 1) * p // 100
+        result[present, k] = sorted_values[starts[present] + offsets]
+    return result
+
+
+def analyze(columns, upper_lower=UPPER_LOWER):
+    """Estatísticas por pergunta e por tópico; devolve um dicionário de arrays NumPy"""
+    import numpy as np
+
+    topic = columns["topico"].astype(np.int64)
+    index = columns["indice"].astype(np.int64)
+    correct = columns["correta"].astype(np.float64)
+    selected = columns["escolhida"].astype(np.int64)
+    latency = columns["latencia"]
+
+    # Pergunta = (tópico, índice) numerada de forma densa: o tópico t ocupa [base[t], base[t] + maior índice]
+    n_topics = int(topic.max()) + 1
+    size = np.zeros(n_topics, dtype=np.int64)
+    np.maximum.at(size, topic, index + 1)
+    base = np.cumsum(size) - size
+    question = base[topic] + index
+    n_questions = int(size.sum())
+    answers = np.bincount(question, minlength=n_questions)
+    hits = np.bincount(question, weights=correct, minlength=n_questions)
+
+    # Grupos de cima e de baixo pela taxa de acerto de cada partida (os ids de partida são sequenciais)
+    session = columns["sessao"].astype(np.int64)
+    session -= session.min()
+    session_answers = np.bincount(session)
+    played = np.flatnonzero(session_answers)
+    session_rate = np.bincount(session, weights=correct)[played] / session_answers[played]
+    ranking = played[np.argsort(session_rate, kind="stable")]
+    group_size = int(len(ranking) * upper_lower)
+    group = np.zeros(len(session_answers), dtype=np.int8)
+    if group_size:
+        group[ranking[:group_size]] = -1
+        group[ranking[-group_size:]] = 1
+    row_group = group[session]
+    upper, lower = row_group == 1, row_group == -1
+    with np.errstate(invalid="ignore", divide="ignore"):
+        upper_rate = (np.bincount(question[upper], weights=correct[upper], minlength=n_questions)
+                      / np.bincount(question[upper], minlength=n_questions))
+        lower_rate = (np.bincount(question[lower], weights=correct[lower], minlength=n_questions)
+                      / np.bincount(question[lower], minlength=n_questions))
+
+    # Opção errada mais escolhida: contagem (pergunta, opção) só nas respostas erradas
+    wrong = correct == 0
+    wrong_counts = np.bincount(question[wrong] * 4 + selected[wrong], minlength=n_questions * 4).reshape(-1, 4)
+
+    # Só as perguntas respondidas vão para o relatório
+    asked = np.flatnonzero(answers)
+    question_topic = np.repeat(np.arange(n_topics), size)
+    topic_answers = np.bincount(topic, minlength=n_topics)
+    topics = np.flatnonzero(topic_answers)
+    return {
+        "topic": question_topic[asked],
+        "index": asked - base[question_topic[asked]],
+        "answers": answers[asked],
+        "accuracy": hits[asked] / answers[asked],
+        "discrimination": (upper_rate - lower_rate)[asked],
+        "latency": group_percentiles(question, latency, n_questions)[asked],
+        "wrong_option": wrong_counts.argmax(axis=1)[asked],
+        "wrong_count": wrong_counts.max(axis=1)[asked],
+        "topics": topics,
+        "topic_answers": topic_answers[topics],
+        "topic_accuracy": np.bincount(topic, weights=correct, minlength=n_topics)[topics] / topic_answers[topics],
+        "topic_latency": group_percentiles(topic, latency, n_topics)[topics],
+        "sessions": len(played),
+    }
+
+
+def _topic_names(directory):
+    path = os.path.join(directory, TOPICS_FILE)
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [line.rstrip("\n") for line in f]
+
+
+def print_report(stats, names, registry=None, limit=20, sort="acerto", file=None):
+    import numpy as np
+
+    file = file or sys.stdout
+    header = " ".join(f"p{p:<6}" for p in PERCENTILES)
+    print(f"{stats['topic_answers'].sum()} respostas em {stats['sessions']} partidas\n", file=file)
+    print(f"{'tópico':<16} {'respostas':>10} {'acerto':>7}  tempo (ms) {header}", file=file)
+    for k, code in enumerate(stats["topics"]):
+        latency = " ".join(f"{value:<7.0f}" for value in stats["topic_latency"][k])
+        print(f"{names[code]:<16} {stats['topic_answers'][k]:>10} {stats['topic_accuracy'][k]:>7.1%}  "
+              f"{'':10} {latency}", file=file)
+
+    if sort == "acerto":
+        order = np.argsort(stats["accuracy"], kind="stable")
+    elif sort == "discriminacao":
+        order = np.argsort(np.nan_to_num(stats["discrimination"], nan=np.inf), kind="stable")
+    else:
+        order = np.argsort(-stats["answers"], kind="stable")
+
+    print(f"\n{'pergunta':<20} {'respostas':>9} {'acerto':>7} {'discr.':>6} {header}  errada mais comum", file=file)
+    # Só as linhas exibidas passam por Python (para buscar os textos no banco)
+    for q in order[:limit]:
+        topic = names[stats["topic"][q]]
+        index = int(stats["index"][q])
+        latency = " ".join(f"{value:<7.0f}" for value in stats["latency"][q])
+        discrimination = stats["discrimination"][q]
+        discrimination = "-" if np.isnan(discrimination) else f"{discrimination:+.2f}"
+        wrong = "-"
+        if stats["wrong_count"][q]:
+            option = int(stats["wrong_option"][q])
+            wrong = f"{chr(65 + option)} ({stats['wrong_count'][q]}x)"
+            if registry is not None and topic in registry:
+                wrong += f" {registry.bank(topic)[index].opcoes[option]}"
+        print(f"{topic + ' #' + str(index):<20} {stats['answers'][q]:>9} {stats['accuracy'][q]:>7.1%} "
+              f"{discrimination:>6} {latency}  {wrong}", file=file)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Relatório das respostas registradas pelo jogo (requer NumPy)")
+    parser.add_argument("--pasta", default=ANALYTICS_DIR, help="pasta do log colunar")
+    parser.add_argument("--limite", type=int, default=20, help="perguntas exibidas")
+    parser.add_argument("--ordenar", choices=["acerto", "discriminacao", "respostas"], default="acerto",
+                        help="acerto/discriminação: as piores primeiro; respostas: as mais respondidas")
+    args = parser.parse_args()
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        sys.exit("O relatório precisa do NumPy: pip install numpy")
+
+    columns = load_columns(args.pasta)
+    if not len(columns["sessao"]):
+        sys.exit(f"Nenhuma resposta registrada em {args.pasta}")
+    from topics import default_registry
+    print_report(analyze(columns), _topic_names(args.pasta), default_registry(), args.limite, args.ordenar)
@@ -0,0 +1,133 @@
+"""Formato binário compilado para os bancos de perguntas.
+
+O compilador transforma os bancos em um arquivo compacto e o jogo o abre com
+`mmap`, decodificando uma pergunta só quando ela é sorteada. Assim o tempo de
+inicialização e a memória residente não crescem junto com o banco.
+
+Layout do arquivo (inteiros little-endian):
+
+    cabeçalho     magic "TRVB", versão, nº de tópicos, nº de strings,
+                  posição da tabela de strings
+    tópicos       para cada tópico: id do nome, nº de perguntas, posição
+                  dos registros
+    registros     para cada pergunta: id da pergunta, ids das 4 opções e o
+                  índice da resposta correta (largura fixa)
+    offsets       posição de cada string dentro do bloco de texto (n + 1)
+    texto         strings UTF-8 concatenadas, cada uma guardada uma só vez
+
+Uso:
+    python bankfile.py questions.bin [pasta_dos_shards]
+"""
+import mmap
+import struct
+import sys
+
+from question import Question
+
+MAGIC = b"TRVB"
+VERSION = 1
+
+HEADER = struct.Struct("<4sHHII")
+TOPIC = struct.Struct("<III")
+RECORD = struct.Struct("<IIIIIBxxx")
+OFFSET = struct.Struct("<I")
+
+
+def compile_bank(banks, path):
+    """Compila {tópico: sequência de `Question`} para o arquivo binário em `path`"""
+    strings = []
+    string_ids = {}
+
+    def intern(text):
+        sid = string_ids.get(text)
+        if sid is None:
+            sid = string_ids[text] = len(strings)
+            strings.append(text.encode("utf-8"))
+        return sid
+
+    topics = []
+    records = []
+    records_start = HEADER.size + TOPIC.size * len(banks)
+    for name, questions in banks.items():
+        topics.append((intern(name), len(questions), records_start + RECORD.size * len(records)))
+        for question in questions:
+            opcoes = question.opcoes
+            if len(opcoes) != 4:
+                raise ValueError(f"Pergunta com {len(opcoes)} opções: {question.pergunta!r}")
+            records.append(RECORD.pack(intern(question.pergunta),
+                                       *(intern(option) for option in opcoes),
+                                       question.resposta_correta))
+
+    strings_pos = records_start + RECORD.size * len(records)
+    offsets = [0]
+    for data in strings:
+        offsets.append(offsets[-1] + len(data))
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(topics), len(strings), strings_pos))
+        for topic in topics:
+            f.write(TOPIC.pack(*topic))
+        f.writelines(records)
+        f.writelines(OFFSET.pack(offset) for offset in offsets)
+        f.writelines(strings)
+
+
+class MappedBank:
+    """Banco compilado aberto com mmap; os tópicos são decodificados sob demanda"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, n_topics, n_strings, strings_pos = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} não é um banco de perguntas compilado")
+        if version != VERSION:
+            raise ValueError(f"{path}: versão {version} não suportada (esperada {VERSION})")
+
+        self._offsets_pos = strings_pos
+        self._text_pos = strings_pos + OFFSET.size * (n_strings + 1)
+
+        self.topics = {}
+        for i in range(n_topics):
+            name_id, count, records_pos = TOPIC.unpack_from(self._mm, HEADER.size + TOPIC.size * i)
+            self.topics[self.string(name_id)] = MappedTopic(self, count, records_pos)
+
+    def string(self, sid):
+        """Decodifica a string de id `sid`"""
+        start, end = struct.unpack_from("<II", self._mm, self._offsets_pos + OFFSET.size * sid)
+        return self._mm[self._text_pos + start:self._text_pos + end].decode("utf-8")
+
+    def topic(self, name):
+        return self.topics[name]
+
+    def close(self):
+        self._mm.close()
+
+
+class MappedTopic:
+    """Sequência somente leitura com as perguntas de um tópico do banco compilado"""
+
+    def __init__(self, bank, count, records_pos):
+        self._bank = bank
+        self._count = count
+        self._records_pos = records_pos
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        pergunta, a, b, c, d, resposta = RECORD.unpack_from(self._bank._mm, self._records_pos + RECORD.size * index)
+        string = self._bank.string
+        return Question(string(pergunta), (string(a), string(b), string(c), string(d)), resposta)
+
+
+if __name__ == "__main__":
+    from bankloader import BANKS_DIR, ShardedBanks
+
+    if len(sys.argv) not in (2, 3):
+        sys.exit("Uso: python bankfile.py <saida.bin> [pasta_dos_shards]")
+    shards = ShardedBanks(sys.argv[2] if len(sys.argv) == 3 else BANKS_DIR)
+    compile_bank(dict(shards.items()), sys.argv[1])
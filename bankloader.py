@@ -0,0 +1,120 @@
+"""Carregamento dos bancos de perguntas a partir de arquivos externos.
+
+Cada tópico fica em um arquivo próprio (shard) dentro de `banks/`, em JSON
+Lines (`<tópico>.jsonl`, um objeto por linha) ou CSV (`<tópico>.csv`, com as
+colunas pergunta, opcao_a, opcao_b, opcao_c, opcao_d e resposta_correta).
+Os registros são validados enquanto o arquivo é lido, e o shard de um
+tópico só é lido quando o tópico é usado pela primeira vez.
+"""
+import csv
+import json
+import os
+
+from question import Question, QuestionStore
+
+BANKS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "banks")
+
+SHARD_EXTENSIONS = (".jsonl", ".csv")
+CSV_FIELDS = ["pergunta", "opcao_a", "opcao_b", "opcao_c", "opcao_d", "resposta_correta"]
+
+
+def validate_question(record, where):
+    """Valida um registro de pergunta e o devolve como `Question`; `where` identifica a linha nos erros"""
+    if not isinstance(record, dict):
+        raise ValueError(f"{where}: registro deve ser um objeto")
+
+    pergunta = record.get("pergunta")
+    if not isinstance(pergunta, str) or not pergunta.strip():
+        raise ValueError(f"{where}: 'pergunta' ausente ou vazia")
+
+    opcoes = record.get("opcoes")
+    if not isinstance(opcoes, list) or len(opcoes) != 4 or not all(isinstance(o, str) and o.strip() for o in opcoes):
+        raise ValueError(f"{where}: 'opcoes' deve ter exatamente 4 textos")
+
+    resposta = record.get("resposta_correta")
+    if isinstance(resposta, str) and resposta.strip().isdigit():
+        resposta = int(resposta)
+    if not isinstance(resposta, int) or isinstance(resposta, bool) or not 0 <= resposta < len(opcoes):
+        raise ValueError(f"{where}: 'resposta_correta' deve ser um índice entre 0 e 3")
+
+    return Question(pergunta, opcoes, resposta)
+
+
+def _iter_jsonl(path):
+    with open(path, encoding="utf-8") as f:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            where = f"{path}:{lineno}"
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"{where}: JSON inválido ({e})") from None
+            yield validate_question(record, where)
+
+
+def _iter_csv(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        missing = set(CSV_FIELDS) - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"{path}: colunas ausentes: {', '.join(sorted(missing))}")
+        for row in reader:
+            record = {
+                "pergunta": row["pergunta"],
+                "opcoes": [row["opcao_a"], row["opcao_b"], row["opcao_c"], row["opcao_d"]],
+                "resposta_correta": row["resposta_correta"],
+            }
+            yield validate_question(record, f"{path}:{reader.line_num}")
+
+
+def iter_questions(path):
+    """Gera as perguntas de um shard JSONL ou CSV, validando cada registro"""
+    if path.endswith(".jsonl"):
+        return _iter_jsonl(path)
+    if path.endswith(".csv"):
+        return _iter_csv(path)
+    raise ValueError(f"{path}: formato de banco desconhecido (use .jsonl ou .csv)")
+
+
+class ShardedBanks:
+    """Mapeia tópico -> `QuestionStore`, lendo o shard do tópico no primeiro acesso"""
+
+    def __init__(self, directory=BANKS_DIR):
+        self.directory = directory
+        # Só listamos os nomes dos arquivos; nenhum shard é lido aqui
+        self.paths = {}
+        for entry in sorted(os.scandir(directory), key=lambda e: e.name):
+            topic, ext = os.path.splitext(entry.name)
+            if ext in SHARD_EXTENSIONS and entry.is_file():
+                if topic in self.paths:
+                    raise ValueError(f"{directory}: tópico '{topic}' tem mais de um shard")
+                self.paths[topic] = entry.path
+        self._loaded = {}
+        # Chamados com (tópico, perguntas) logo depois que um shard é lido (ex.: índice de busca)
+        self.on_load = []
+
+    def __contains__(self, topic):
+        return topic in self.paths
+
+    def __iter__(self):
+        return iter(self.paths)
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __getitem__(self, topic):
+        questions = self._loaded.get(topic)
+        if questions is None:
+            questions = QuestionStore(iter_questions(self.paths[topic]))
+            questions.compact()
+            self._loaded[topic] = questions
+            for callback in self.on_load:
+                callback(topic, questions)
+        return questions
+
+    def items(self):
+        return ((topic, self[topic]) for topic in self.paths)
+
+    def is_loaded(self, topic):
+        return topic in self._loaded
@@ -0,0 +1,67 @@
+"""Mede como o `cluster.Supervisor` escala com o número de processos.
+
+Para cada quantidade de processos, mede duas coisas:
+  - local: cada processo joga partidas sintéticas sozinho (limite do motor)
+  - lotes: o supervisor envia comandos em lotes (inclui o custo de IPC)
+
+Uso:
+    python bench/bench_cluster.py [--max-workers 8] [--sessoes 200] [--respostas 200]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cluster import Supervisor  # noqa: E402
+
+
+def bench_local(supervisor, sessions, answers):
+    start = time.perf_counter()
+    total = supervisor.simulate(sessions, answers)
+    return total / (time.perf_counter() - start)
+
+
+def bench_batched(supervisor, sessions, answers):
+    session_ids = [f"s{i}" for i in range(sessions * supervisor.workers)]
+    for session_id in session_ids:
+        supervisor.submit("entrar", session_id)
+    supervisor.flush()
+
+    total = 0
+    start = time.perf_counter()
+    choosing = set()
+    for _ in range(answers):
+        # Quem acertou na rodada anterior escolhe o tópico; os demais respondem
+        answered = [sid for sid in session_ids if sid not in choosing]
+        for session_id in choosing:
+            supervisor.submit("topico", session_id, "kpop")
+        for session_id in answered:
+            supervisor.submit("responder", session_id, 0)
+        replies = supervisor.flush()[len(choosing):]
+        total += len(answered)
+        choosing = {sid for sid, result in zip(answered, replies) if result[1] == "topic_choice"}
+    return total / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Escalabilidade do cluster de sessões")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--sessoes", type=int, default=200, help="sessões por processo")
+    parser.add_argument("--respostas", type=int, default=200, help="respostas por sessão")
+    args = parser.parse_args()
+
+    print(f"{'processos':>9} {'local resp/s':>14} {'escala':>7} {'lotes resp/s':>14} {'escala':>7}")
+    base_local = base_batched = None
+    workers = 1
+    while workers <= args.max_workers:
+        with Supervisor(workers) as supervisor:
+            local = bench_local(supervisor, args.sessoes, args.respostas)
+            batched = bench_batched(supervisor, args.sessoes, max(1, args.respostas // 10))
+        base_local = base_local or local
+        base_batched = base_batched or batched
+        print(f"{workers:>9} {local:>14.0f} {local / base_local:>6.2f}x {batched:>14.0f} {batched / base_batched:>6.2f}x")
+        workers *= 2
+        if workers > args.max_workers and workers // 2 != args.max_workers:
+            workers = args.max_workers
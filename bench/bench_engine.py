@@ -0,0 +1,189 @@
+"""Benchmark das regras do jogo com jogadores simulados, sem interface.
+
+Cada jogador simulado responde certo com a probabilidade configurada, escolhe
+um tópico ao acaso depois de cada acerto e reinicia a partida no game over
+(o mesmo que `restart_game_silent` faz na interface). Os bancos são
+sintéticos e gerados sob demanda a partir do índice, então um banco de 10⁷
+perguntas não ocupa memória.
+
+Para cada tamanho de banco, em um interpretador novo (o pico de RSS é do
+processo inteiro), mede:
+  - respostas por segundo
+  - memória por resposta, com `tracemalloc` em uma amostra: pico transitório
+    de bytes alocados e blocos que continuam vivos depois da resposta
+  - pico de RSS do processo (`resource`)
+
+Uso:
+    python bench/bench_engine.py [--tamanhos 100 10000000] [--precisao 0.5 0.9]
+                                 [--respostas 200000] [--saida resultados.json]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from engine import GameEngine  # noqa: E402
+from question import Question  # noqa: E402
+from topics import Topic, TopicRegistry  # noqa: E402
+
+DEFAULT_SIZES = [10 ** k for k in range(2, 8)]
+TOPICS = ("alfa", "beta")
+
+
+class SyntheticBank:
+    """Banco de `size` perguntas montadas a partir do índice, sem nada guardado em memória"""
+
+    def __init__(self, topic, size):
+        self.topic = topic
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.size:
+            raise IndexError(index)
+        return Question(f"{self.topic} #{index}?", (f"A{index}", f"B{index}", f"C{index}", f"D{index}"),
+                        (index * 2654435761 >> 7) % 4)
+
+
+def synthetic_registry(size):
+    return TopicRegistry([Topic(topic) for topic in TOPICS],
+                         {topic: SyntheticBank(topic, size) for topic in TOPICS})
+
+
+class SimulatedPlayer:
+    def __init__(self, engine, accuracy, rng):
+        self.engine = engine
+        self.accuracy = accuracy
+        self.rng = rng
+        self.games = 0
+
+    def step(self):
+        """Uma ação do jogador; devolve True se foi uma resposta"""
+        engine = self.engine
+        state = engine.game_state
+        if state == "question":
+            correct = engine.current_question.resposta_correta
+            if self.rng.random() < self.accuracy:
+                engine.answer(correct)
+            else:
+                engine.answer((correct + 1 + self.rng.randrange(3)) % 4)
+            return True
+        if state == "topic_choice":
+            engine.choose_topic(self.rng.choice(TOPICS))
+        else:
+            self.games += 1
+            engine.restart()
+        return False
+
+
+def run(size, accuracy, answers, sample, seed):
+    """Mede um tamanho de banco e uma precisão; devolve o dicionário de resultados"""
+    rng = random.Random(seed)
+    engine = GameEngine(synthetic_registry(size), rng=random.Random(seed))
+    player = SimulatedPlayer(engine, accuracy, rng)
+    engine.next_question()
+
+    done = 0
+    start = time.perf_counter()
+    while done < answers:
+        if player.step():
+            done += 1
+    elapsed = time.perf_counter() - start
+
+    # Amostra com tracemalloc: é lento demais para a medição de vazão
+    tracemalloc.start()
+    peaks = 0
+    before = tracemalloc.take_snapshot()
+    done = 0
+    while done < sample:
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        if player.step():
+            done += 1
+            peaks += tracemalloc.get_traced_memory()[1] - current
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+
+    # ru_maxrss é em KiB no Linux e em bytes no macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != "darwin":
+        rss *= 1024
+
+    return {
+        "tamanho": size,
+        "precisao": accuracy,
+        "respostas": answers,
+        "partidas": player.games,
+        "segundos": elapsed,
+        "respostas_por_s": answers / elapsed,
+        "bytes_pico_por_resposta": peaks / sample,
+        "blocos_retidos_por_resposta": retained / sample,
+        "pico_rss_bytes": rss,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, check=True,
+                              capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Vazão e memória das regras do jogo com jogadores simulados")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="perguntas por tópico de cada banco sintético")
+    parser.add_argument("--precisao", type=float, nargs="+", default=[0.7],
+                        help="probabilidade de acerto dos jogadores")
+    parser.add_argument("--respostas", type=int, default=200_000, help="respostas medidas por execução")
+    parser.add_argument("--amostra", type=int, default=2_000, help="respostas medidas com tracemalloc")
+    parser.add_argument("--semente", type=int, default=1)
+    parser.add_argument("--saida", help="grava os resultados em JSON neste arquivo")
+    parser.add_argument("--uma", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.uma:
+        # Processo filho: um tamanho e uma precisão
+        print(json.dumps(run(args.tamanhos[0], args.precisao[0], args.respostas, args.amostra, args.semente)))
+        sys.exit(0)
+
+    results = []
+    print(f"{'tamanho':>10} {'precisão':>8} {'resp/s':>12} {'bytes/resp':>11} {'retidos/resp':>12} {'pico RSS':>10}")
+    for size in args.tamanhos:
+        for accuracy in args.precisao:
+            out = subprocess.run([sys.executable, __file__, "--uma", "--tamanhos", str(size),
+                                  "--precisao", str(accuracy), "--respostas", str(args.respostas),
+                                  "--amostra", str(args.amostra), "--semente", str(args.semente)],
+                                 check=True, capture_output=True, text=True).stdout
+            result = json.loads(out)
+            results.append(result)
+            print(f"{size:>10} {accuracy:>8.2f} {result['respostas_por_s']:>12,.0f} "
+                  f"{result['bytes_pico_por_resposta']:>11.0f} {result['blocos_retidos_por_resposta']:>12.3f} "
+                  f"{result['pico_rss_bytes'] / 2 ** 20:>8.1f} MB")
+
+    if args.saida:
+        report = {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "parametros": {"respostas": args.respostas, "amostra": args.amostra, "semente": args.semente},
+            "resultados": results,
+        }
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+            f.write("\n")
+        print(f"resultados gravados em {args.saida}")
@@ -0,0 +1,125 @@
+"""Benchmark de regressão do carregamento de `main.py`.
+
+Mede, cada vez em um interpretador novo:
+  - tempo de import de `main` (sem abrir janela)
+  - tamanho do bytecode de cada módulo do jogo
+  - tempo até a primeira pergunta no motor (`GameEngine` + `next_question`)
+
+e verifica que nenhuma classe define o mesmo método mais de uma vez (o
+`main.py` já chegou a ter o corpo da classe copiado quatro vezes). Sai com
+código 1 se algo piorar além da tolerância em relação a
+`bench/baseline_startup.json`.
+
+Uso:
+    python bench/bench_startup.py             # compara com a linha de base
+    python bench/bench_startup.py --update    # grava uma nova linha de base
+"""
+import argparse
+import ast
+import json
+import marshal
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(ROOT, "bench", "baseline_startup.json")
+
+MODULES = ["main.py", "startup.py", "layout.py", "engine.py", "topics.py", "bankloader.py", "bankfile.py",
+           "question.py", "sampler.py"]
+
+# Tempo varia entre máquinas e execuções; tamanho de bytecode é determinístico
+TIME_TOLERANCE = 1.5
+SIZE_TOLERANCE = 1.10
+
+IMPORT_MAIN = "import time; t = time.perf_counter(); import main; print(time.perf_counter() - t)"
+FIRST_QUESTION = (
+    "import time; t = time.perf_counter()\n"
+    "from engine import GameEngine\n"
+    "GameEngine().next_question()\n"
+    "print(time.perf_counter() - t)"
+)
+
+
+def run_timed(code, repeat):
+    """Mediana de `repeat` execuções de `code` em interpretadores novos"""
+    samples = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True,
+                             capture_output=True, text=True).stdout
+        samples.append(float(out.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+def bytecode_size(filename):
+    with open(os.path.join(ROOT, filename), encoding="utf-8") as f:
+        return len(marshal.dumps(compile(f.read(), filename, "exec")))
+
+
+def duplicate_definitions(filename):
+    """Métodos definidos mais de uma vez na mesma classe: [(classe, método, linhas)]"""
+    with open(os.path.join(ROOT, filename), encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename)
+    duplicates = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            lines = {}
+            for item in node.body:
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    lines.setdefault(item.name, []).append(item.lineno)
+            duplicates.extend((node.name, name, found) for name, found in lines.items() if len(found) > 1)
+    return duplicates
+
+
+def measure(repeat):
+    return {
+        "import_main_s": run_timed(IMPORT_MAIN, repeat),
+        "first_question_s": run_timed(FIRST_QUESTION, repeat),
+        "bytecode_bytes": {name: bytecode_size(name) for name in MODULES},
+    }
+
+
+def compare(results, baseline):
+    """Lista de regressões em relação à linha de base"""
+    failures = []
+    for key in ("import_main_s", "first_question_s"):
+        if key in baseline and results[key] > baseline[key] * TIME_TOLERANCE:
+            failures.append(f"{key}: {results[key] * 1000:.1f} ms (base {baseline[key] * 1000:.1f} ms)")
+    for name, size in results["bytecode_bytes"].items():
+        base = baseline.get("bytecode_bytes", {}).get(name)
+        if base is not None and size > base * SIZE_TOLERANCE:
+            failures.append(f"bytecode de {name}: {size} bytes (base {base} bytes)")
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Regressão do tempo de carregamento")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--update", action="store_true", help="grava os resultados como nova linha de base")
+    args = parser.parse_args()
+
+    failures = [f"{filename}: {cls}.{name} definido nas linhas {', '.join(map(str, lines))}"
+                for filename in MODULES for cls, name, lines in duplicate_definitions(filename)]
+
+    results = measure(args.repeat)
+    print(f"import main:        {results['import_main_s'] * 1000:8.1f} ms")
+    print(f"primeira pergunta:  {results['first_question_s'] * 1000:8.1f} ms")
+    for name, size in results["bytecode_bytes"].items():
+        print(f"bytecode {name:<14} {size:8d} bytes")
+
+    if args.update:
+        with open(BASELINE, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+            f.write("\n")
+        print(f"linha de base gravada em {BASELINE}")
+    elif os.path.exists(BASELINE):
+        with open(BASELINE, encoding="utf-8") as f:
+            failures.extend(compare(results, json.load(f)))
+
+    if failures:
+        print("\nREGRESSÃO:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("\nsem regressões")
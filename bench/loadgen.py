@@ -0,0 +1,143 @@
+"""Gerador de carga para o servidor multijogador (`server.py`).
+
+Abre conexões ociosas (para verificar quantas o servidor mantém) e clientes
+ativos que respondem perguntas sem parar, acertando com a probabilidade
+informada (o gabarito vem dos mesmos bancos usados pelo servidor). Ao
+final, mostra respostas por segundo e a latência entre o envio de uma
+resposta e a chegada do resultado.
+
+Uso:
+    python server.py &
+    python bench/loadgen.py --clientes 200 --ociosos 10000 --duracao 10
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from topics import default_registry  # noqa: E402
+
+
+def answer_key(topics):
+    """Mapeia o texto de cada pergunta ao índice da resposta correta"""
+    key = {}
+    for topic in topics:
+        bank = topics.bank(topic.id)
+        for i in range(len(bank)):
+            question = bank[i]
+            key[question.pergunta] = question.resposta_correta
+    return key
+
+
+def send(writer, message):
+    writer.write(json.dumps(message).encode("utf-8") + b"\n")
+
+
+async def read_message(reader):
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError("servidor fechou a conexão")
+    message = json.loads(line)
+    if message["tipo"] == "erro":
+        raise RuntimeError(message["mensagem"])
+    return message
+
+
+async def read_question(reader):
+    """Lê a pergunta e a mensagem de estado que sempre vem logo depois"""
+    question = await read_message(reader)
+    await read_message(reader)
+    return question
+
+
+async def active_client(args, key, topic_ids, deadline, latencies, rng):
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    try:
+        send(writer, {"op": "entrar", "sala": f"sala-{rng.randrange(args.salas)}"})
+        question = await read_question(reader)
+        while time.monotonic() < deadline:
+            correct = key.get(question["pergunta"], 0)
+            if rng.random() < args.precisao:
+                opcao = correct
+            else:
+                opcao = rng.choice([i for i in range(4) if i != correct])
+
+            start = time.perf_counter()
+            send(writer, {"op": "responder", "opcao": opcao})
+            result = await read_message(reader)
+            latencies.append(time.perf_counter() - start)
+
+            if result["estado"] == "topic_choice":
+                send(writer, {"op": "topico", "topico": rng.choice(topic_ids)})
+            question = await read_question(reader)
+    finally:
+        writer.close()
+
+
+async def idle_client(args, opened, stop):
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    try:
+        send(writer, {"op": "entrar", "sala": "ociosos"})
+        await read_question(reader)
+        opened.append(writer)
+        await stop.wait()
+    finally:
+        writer.close()
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+async def run(args):
+    topics = default_registry()
+    key = answer_key(topics)
+    topic_ids = list(topics.order)
+
+    stop = asyncio.Event()
+    opened = []
+    idle = []
+    # Abre as conexões ociosas em lotes para não estourar o backlog do servidor
+    for start in range(0, args.ociosos, 500):
+        batch = [asyncio.ensure_future(idle_client(args, opened, stop))
+                 for _ in range(start, min(args.ociosos, start + 500))]
+        idle.extend(batch)
+        while len(opened) < min(args.ociosos, start + 500) and not any(t.done() for t in batch):
+            await asyncio.sleep(0.01)
+    failed = [t for t in idle if t.done() and t.exception()]
+    print(f"conexões ociosas abertas: {len(opened)} (falhas: {len(failed)})")
+
+    latencies = []
+    deadline = time.monotonic() + args.duracao
+    began = time.perf_counter()
+    await asyncio.gather(*(active_client(args, key, topic_ids, deadline, latencies, random.Random(i))
+                           for i in range(args.clientes)))
+    elapsed = time.perf_counter() - began
+
+    stop.set()
+    await asyncio.gather(*idle, return_exceptions=True)
+
+    latencies.sort()
+    print(f"respostas: {len(latencies)} em {elapsed:.2f}s -> {len(latencies) / elapsed:.0f} respostas/s")
+    print(f"latência p50: {percentile(latencies, 0.50) * 1000:.2f} ms | "
+          f"p99: {percentile(latencies, 0.99) * 1000:.2f} ms | "
+          f"máx: {(latencies[-1] if latencies else 0) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gerador de carga para server.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--clientes", type=int, default=100, help="clientes respondendo sem parar")
+    parser.add_argument("--ociosos", type=int, default=0, help="conexões abertas sem jogar")
+    parser.add_argument("--salas", type=int, default=10)
+    parser.add_argument("--precisao", type=float, default=0.7, help="probabilidade de acerto")
+    parser.add_argument("--duracao", type=float, default=10.0, help="segundos de carga")
+    asyncio.run(run(parser.parse_args()))
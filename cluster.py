@@ -0,0 +1,164 @@
+"""Distribuição de sessões de jogo entre vários processos.
+
+Uma única instância do CPython fica limitada pelo GIL; o `Supervisor`
+espalha as sessões por processos trabalhadores usando o hash do id da
+sessão, então todas as jogadas de uma sessão caem sempre no mesmo
+processo. Os bancos de perguntas não são copiados para cada processo: todos
+abrem o mesmo banco compilado (`bankfile.py`) com `mmap`, e o sistema
+operacional compartilha as páginas entre eles.
+
+Os comandos são enviados em lotes, um lote por processo a cada `flush()`,
+para diluir o custo da comunicação entre processos.
+"""
+import multiprocessing
+import os
+import random
+import tempfile
+import zlib
+
+from bankfile import MappedBank, compile_bank
+from engine import GameEngine
+from topics import BANK_FILE, compiled_bank_is_current, load_registry
+
+
+def _state(session, correct=None):
+    return (correct, session.game_state, session.score, session.lives,
+            session.current_topic, session.current_index)
+
+
+def _apply(sessions, topics, command):
+    """Executa um comando (op, id da sessão, argumento) e devolve o estado da sessão"""
+    op, session_id, arg = command
+    if op == "entrar":
+        session = sessions[session_id] = GameEngine(topics)
+        session.next_question()
+        return _state(session)
+
+    session = sessions[session_id]
+    if op == "responder":
+        result = session.answer(arg)
+        if result.game_over:
+            session.restart()
+        return _state(session, result.correct)
+    if op == "topico":
+        session.choose_topic(arg)
+        return _state(session)
+    if op == "reiniciar":
+        session.restart()
+        return _state(session)
+    if op == "sair":
+        del sessions[session_id]
+        return None
+    raise ValueError(f"operação desconhecida: {op}")
+
+
+def _simulate(topics, rng, n_sessions, answers, accuracy):
+    """Joga `answers` respostas em cada uma de `n_sessions` sessões locais"""
+    topic_ids = topics.order
+    sessions = [GameEngine(topics) for _ in range(n_sessions)]
+    for session in sessions:
+        session.next_question()
+    for _ in range(answers):
+        for session in sessions:
+            correct = session.current_question.resposta_correta
+            result = session.answer(correct if rng.random() < accuracy else (correct + 1) % 4)
+            if result.game_over:
+                session.restart()
+            elif result.correct:
+                session.choose_topic(rng.choice(topic_ids))
+    return n_sessions * answers
+
+
+def _worker(conn, bank_file, seed):
+    topics = load_registry(MappedBank(bank_file).topics)
+    rng = random.Random(seed)
+    sessions = {}
+    while True:
+        batch = conn.recv()
+        if batch is None:
+            break
+        if batch[0] == "simular":
+            conn.send(_simulate(topics, rng, *batch[1]))
+            continue
+        results = []
+        for command in batch[1]:
+            try:
+                results.append(_apply(sessions, topics, command))
+            except (KeyError, ValueError) as e:
+                results.append(e)
+        conn.send(results)
+    conn.close()
+
+
+class Supervisor:
+    def __init__(self, workers=None, bank_file=None):
+        self.workers = workers or os.cpu_count() or 1
+        self._temp_bank = None
+        if bank_file is None:
+            bank_file = BANK_FILE
+            if not compiled_bank_is_current(bank_file):
+                # Sem banco compilado (ou desatualizado): compila os shards uma vez para todos os processos
+                fd, bank_file = tempfile.mkstemp(suffix=".bin")
+                os.close(fd)
+                topics = load_registry()
+                compile_bank({topic.id: topics.bank(topic.id) for topic in topics}, bank_file)
+                self._temp_bank = bank_file
+        self.bank_file = bank_file
+
+        self._conns = []
+        self._processes = []
+        for i in range(self.workers):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_worker, args=(child, bank_file, i), daemon=True)
+            process.start()
+            child.close()
+            self._conns.append(parent)
+            self._processes.append(process)
+        self._pending = [[] for _ in range(self.workers)]
+        self._order = []
+
+    def shard(self, session_id):
+        """Processo responsável pela sessão (hash estável entre execuções)"""
+        return zlib.crc32(str(session_id).encode("utf-8")) % self.workers
+
+    def submit(self, op, session_id, arg=None):
+        """Enfileira um comando; os resultados chegam no próximo `flush()`"""
+        worker = self.shard(session_id)
+        self._order.append((worker, len(self._pending[worker])))
+        self._pending[worker].append((op, session_id, arg))
+
+    def flush(self):
+        """Envia os lotes pendentes e devolve os resultados na ordem de `submit()`.
+
+        Cada resultado é uma tupla (acertou, estado, pontos, vidas, tópico,
+        índice da pergunta), `None` para "sair" ou a exceção do comando.
+        """
+        busy = [i for i, batch in enumerate(self._pending) if batch]
+        for i in busy:
+            self._conns[i].send(("comandos", self._pending[i]))
+        replies = {i: self._conns[i].recv() for i in busy}
+        results = [replies[worker][position] for worker, position in self._order]
+        self._pending = [[] for _ in range(self.workers)]
+        self._order = []
+        return results
+
+    def simulate(self, sessions_per_worker, answers, accuracy=0.7):
+        """Cada processo joga partidas sintéticas localmente; devolve o total de respostas"""
+        for conn in self._conns:
+            conn.send(("simular", (sessions_per_worker, answers, accuracy)))
+        return sum(conn.recv() for conn in self._conns)
+
+    def close(self):
+        for conn in self._conns:
+            conn.send(None)
+            conn.close()
+        for process in self._processes:
+            process.join()
+        if self._temp_bank is not None:
+            os.remove(self._temp_bank)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,191 @@
+"""Detecção de perguntas quase duplicadas com MinHash e LSH.
+
+Cada pergunta vira um conjunto de shingles: trechos de `SHINGLE` caracteres
+do texto da pergunta seguido das opções, normalizado como na busca (sem
+acentos nem maiúsculas, pontuação vira espaço). A similaridade de Jaccard
+entre dois conjuntos é estimada pela fração de posições iguais nas
+assinaturas MinHash.
+
+A assinatura usa uma única função de hash ("one permutation hashing"): o
+crc32 de cada shingle escolhe uma das `SIGNATURE` faixas e o resto do hash
+disputa o mínimo da faixa; faixas vazias copiam a próxima faixa preenchida.
+Assim cada pergunta custa O(nº de shingles), e não O(nº de shingles ×
+tamanho da assinatura) como no MinHash com várias permutações.
+
+Para não comparar todos os pares, as assinaturas são cortadas em `BANDS`
+bandas e só perguntas que caem no mesmo balde em alguma banda viram
+candidatas (LSH); a similaridade estimada dos candidatos decide.
+
+Uso:
+    python dedup.py                          # todos os bancos do jogo
+    python dedup.py banks/kpop.jsonl --limiar 0.4
+    python main.py --validar-duplicatas      # avisa ao carregar cada banco
+"""
+import argparse
+import re
+import sys
+import time
+import warnings
+import zlib
+from operator import eq
+
+from bankfile import MappedBank
+from bankloader import iter_questions
+from question import QuestionStore
+from search import fold
+
+SHINGLE = 5
+SIGNATURE = 64
+BANDS = 16
+ROWS = SIGNATURE // BANDS
+THRESHOLD = 0.5
+
+_BIN_BITS = (SIGNATURE - 1).bit_length()
+_EMPTY = 1 << 32
+_NON_WORD = re.compile(r"\W+")
+
+
+class DuplicateQuestionWarning(UserWarning):
+    """Duas perguntas do mesmo banco parecem ser a mesma"""
+
+
+def shingles(question):
+    """Hashes (crc32) dos trechos de `SHINGLE` caracteres da pergunta e das opções"""
+    text = _NON_WORD.sub(" ", fold(" ".join((question.pergunta,) + question.opcoes))).strip().encode("utf-8")
+    if len(text) <= SHINGLE:
+        return {zlib.crc32(text)}
+    return {zlib.crc32(text[i:i + SHINGLE]) for i in range(len(text) - SHINGLE + 1)}
+
+
+def signature(hashes):
+    """Assinatura MinHash de `SIGNATURE` posições com uma única função de hash"""
+    bins = [_EMPTY] * SIGNATURE
+    mask = SIGNATURE - 1
+    for h in hashes:
+        b = h & mask
+        value = h >> _BIN_BITS
+        if value < bins[b]:
+            bins[b] = value
+    # Densificação: faixa vazia recebe o valor da próxima faixa preenchida (dando a volta),
+    # marcado com a distância para não coincidir por acaso com a própria faixa
+    if _EMPTY in bins:
+        result = list(bins)
+        nearest = None
+        for b in range(2 * SIGNATURE - 1, -1, -1):
+            if bins[b & mask] != _EMPTY:
+                nearest = b
+            elif b < SIGNATURE and nearest is not None:
+                result[b] = bins[nearest & mask] + ((nearest - b) << 32)
+        bins = result
+    return tuple(bins)
+
+
+def similarity(a, b):
+    """Jaccard estimado a partir de duas assinaturas"""
+    return sum(map(eq, a, b)) / SIGNATURE
+
+
+class DuplicateFinder:
+    """Acumula assinaturas e encontra pares parecidos pelos baldes LSH"""
+
+    def __init__(self, threshold=THRESHOLD):
+        self.threshold = threshold
+        self.keys = []
+        self.signatures = []
+        self.buckets = {}
+
+    def add(self, key, question):
+        """Registra `question` com o identificador `key`; devolve os pares (chave, similaridade) já vistos"""
+        sig = signature(shingles(question))
+        n = len(self.keys)
+        candidates = set()
+        for band in range(BANDS):
+            start = band * ROWS
+            bucket = self.buckets.setdefault((band, sig[start:start + ROWS]), [])
+            candidates.update(bucket)
+            bucket.append(n)
+        self.keys.append(key)
+        self.signatures.append(sig)
+        matches = []
+        for other in sorted(candidates):
+            score = similarity(sig, self.signatures[other])
+            if score >= self.threshold:
+                matches.append((self.keys[other], score))
+        return matches
+
+    def add_all(self, items):
+        """Registra [(chave, pergunta)]; devolve todos os pares (chave_a, chave_b, similaridade)"""
+        pairs = []
+        for key, question in items:
+            pairs.extend((other, key, score) for other, score in self.add(key, question))
+        return pairs
+
+
+def find_duplicates(questions, threshold=THRESHOLD):
+    """Pares (i, j, similaridade) de perguntas parecidas em uma sequência"""
+    return DuplicateFinder(threshold).add_all((i, questions[i]) for i in range(len(questions)))
+
+
+def warn_duplicates(topic, questions, threshold=THRESHOLD):
+    """Emite um `DuplicateQuestionWarning` para cada par parecido do banco de `topic`"""
+    for i, j, score in find_duplicates(questions, threshold):
+        warnings.warn(f"{topic}: perguntas {i} e {j} parecem duplicadas (similaridade {score:.2f}): "
+                      f"{questions[i].pergunta!r} / {questions[j].pergunta!r}",
+                      DuplicateQuestionWarning, stacklevel=2)
+
+
+def validate_on_load(registry, threshold=THRESHOLD):
+    """Verifica duplicatas em cada banco de `registry` quando ele for carregado"""
+    banks = registry.banks
+    if hasattr(banks, "on_load"):
+        banks.on_load.append(lambda topic, questions: warn_duplicates(topic, questions, threshold))
+        # Bancos já carregados (ex.: pelo índice de busca do --filtro) não passam mais pelo gancho
+        for topic in registry.order:
+            if banks.is_loaded(topic):
+                warn_duplicates(topic, banks[topic], threshold)
+    else:
+        # Banco compilado: não há carregamento tardio, verifica tudo agora
+        for topic in registry.order:
+            warn_duplicates(topic, banks[topic], threshold)
+
+
+def _sources(paths):
+    """[(nome, perguntas)] dos arquivos de banco dados na linha de comando"""
+    sources = []
+    for path in paths:
+        if path.endswith(".bin"):
+            sources.extend(MappedBank(path).topics.items())
+        else:
+            sources.append((path, QuestionStore(iter_questions(path))))
+    return sources
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Encontra perguntas quase duplicadas (MinHash + LSH)")
+    parser.add_argument("bancos", nargs="*", help="shards .jsonl/.csv ou banco compilado .bin (padrão: bancos do jogo)")
+    parser.add_argument("--limiar", type=float, default=THRESHOLD, help="similaridade mínima (0 a 1)")
+    args = parser.parse_args()
+
+    if args.bancos:
+        sources = _sources(args.bancos)
+    else:
+        from topics import default_registry
+        registry = default_registry()
+        sources = [(topic, registry.bank(topic)) for topic in registry.order]
+
+    # Um único localizador: duplicatas entre bancos diferentes também aparecem
+    finder = DuplicateFinder(args.limiar)
+    banks = dict(sources)
+    start = time.perf_counter()
+    total = 0
+    pairs = []
+    for name, questions in sources:
+        total += len(questions)
+        pairs.extend(finder.add_all(((name, i), questions[i]) for i in range(len(questions))))
+    elapsed = time.perf_counter() - start
+
+    for (name_a, i), (name_b, j), score in sorted(pairs, key=lambda pair: -pair[2]):
+        print(f"{score:.2f}  {name_a} #{i}: {banks[name_a][i].pergunta}")
+        print(f"      {name_b} #{j}: {banks[name_b][j].pergunta}")
+    print(f"{len(pairs)} par(es) parecido(s) entre {total} perguntas em {elapsed:.2f}s", file=sys.stderr)
+    sys.exit(1 if pairs else 0)
@@ -0,0 +1,168 @@
+"""Seleção adaptativa de perguntas pela dificuldade observada.
+
+Cada pergunta acumula quantas vezes foi acertada e errada. A dificuldade
+estimada é a taxa de erro suavizada, e o peso de uma pergunta no sorteio
+cai conforme ela se afasta da dificuldade alvo. Os pesos ficam em uma
+árvore de Fenwick: sortear e atualizar o peso após uma resposta custam
+O(log n), sem reconstruir nada.
+
+As estatísticas são gravadas em um arquivo binário compacto (dois inteiros
+de 32 bits por pergunta) e carregadas na próxima execução.
+"""
+import math
+import os
+import random
+import struct
+from array import array
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "difficulty.bin")
+
+MAGIC = b"TRVD"
+VERSION = 1
+HEADER = struct.Struct("<4sHH")
+TOPIC = struct.Struct("<HI")
+
+MIN_WEIGHT = 0.02   # Mesmo as perguntas longe do alvo ainda aparecem de vez em quando
+
+
+class FenwickTree:
+    """Somas de prefixo de pesos com atualização e busca em O(log n)"""
+
+    def __init__(self, weights):
+        n = len(weights)
+        self.size = n
+        tree = [0.0] + list(weights)
+        # Construção em O(n): cada nó repassa seu valor ao pai
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+        self._tree = tree
+        self._top = 1 << (n.bit_length() - 1) if n else 0
+
+    def add(self, index, delta):
+        i = index + 1
+        tree = self._tree
+        while i <= self.size:
+            tree[i] += delta
+            i += i & -i
+
+    def total(self):
+        total = 0.0
+        i = self.size
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def find(self, value):
+        """Menor índice cuja soma de prefixo (inclusive) passa de `value`"""
+        pos = 0
+        step = self._top
+        tree = self._tree
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and tree[nxt] <= value:
+                pos = nxt
+                value -= tree[nxt]
+            step >>= 1
+        return min(pos, self.size - 1)
+
+
+class DifficultyStats:
+    """Acertos e erros por pergunta de cada tópico, persistidos em `path`"""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self.topics = {}
+        if os.path.exists(path):
+            self._load()
+
+    def _load(self):
+        with open(self.path, "rb") as f:
+            magic, version, n_topics = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{self.path}: arquivo de estatísticas inválido")
+            for _ in range(n_topics):
+                name_len, count = TOPIC.unpack(f.read(TOPIC.size))
+                name = f.read(name_len).decode("utf-8")
+                correct = array("I")
+                wrong = array("I")
+                correct.fromfile(f, count)
+                wrong.fromfile(f, count)
+                self.topics[name] = (correct, wrong)
+
+    def arrays(self, topic, size):
+        """(acertos, erros) do tópico, com uma posição para cada uma das `size` perguntas"""
+        arrays = self.topics.get(topic)
+        if arrays is None:
+            arrays = self.topics[topic] = (array("I", bytes(4 * size)), array("I", bytes(4 * size)))
+        for values in arrays:
+            if len(values) < size:
+                values.extend(array("I", bytes(4 * (size - len(values)))))
+        return arrays
+
+    def save(self):
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, len(self.topics)))
+            for name, (correct, wrong) in self.topics.items():
+                data = name.encode("utf-8")
+                f.write(TOPIC.pack(len(data), len(correct)))
+                f.write(data)
+                correct.tofile(f)
+                wrong.tofile(f)
+        os.replace(tmp, self.path)
+
+    def sampler_factory(self, target=0.5, rng=random):
+        """Fábrica de `AdaptiveSampler` no formato esperado por `GameEngine`"""
+        def factory(topic, size):
+            correct, wrong = self.arrays(topic, size)
+            return AdaptiveSampler(correct, wrong, size, target, rng)
+        return factory
+
+
+class AdaptiveSampler:
+    """Sorteia perguntas com peso maior perto da dificuldade alvo (0 = fácil, 1 = difícil)"""
+
+    def __init__(self, correct, wrong, size, target=0.5, rng=random, width=0.25):
+        self.correct = correct
+        self.wrong = wrong
+        self.size = size
+        self.target = target
+        self.width = width
+        self.rng = rng
+        self._weights = [self.weight(i) for i in range(size)]
+        self._tree = FenwickTree(self._weights)
+        self._last = None
+
+    def weight(self, index):
+        # Taxa de erro com suavização de Laplace: perguntas novas ficam em 0.5
+        difficulty = (self.wrong[index] + 1) / (self.correct[index] + self.wrong[index] + 2)
+        distance = (difficulty - self.target) / self.width
+        return max(MIN_WEIGHT, math.exp(-0.5 * distance * distance))
+
+    def reset(self):
+        self._last = None
+
+    def draw(self):
+        if self.size <= 0:
+            raise IndexError("não há perguntas para sortear")
+        index = self._tree.find(self.rng.random() * self._tree.total())
+        # Evita repetir a pergunta anterior logo em seguida
+        for _ in range(3):
+            if index != self._last or self.size == 1:
+                break
+            index = self._tree.find(self.rng.random() * self._tree.total())
+        self._last = index
+        return index
+
+    def record(self, index, correct):
+        """Atualiza as estatísticas e o peso da pergunta respondida"""
+        if correct:
+            self.correct[index] += 1
+        else:
+            self.wrong[index] += 1
+        new = self.weight(index)
+        self._tree.add(index, new - self._weights[index])
+        self._weights[index] = new
@@ -0,0 +1,179 @@
+"""Regras do jogo de trivia, sem nenhuma dependência de interface gráfica.
+
+O `GameEngine` guarda pontuação, vidas, tópico atual e o sorteador de
+cada tópico. A interface (ou um servidor, ou um
+benchmark) apenas chama `answer()` e `choose_topic()` e exibe o estado.
+"""
+import random
+from collections import namedtuple
+
+from question import OPTION_ORDERS, OPTION_POSITIONS
+from sampler import LazyPermutation
+from topics import default_registry
+
+# Resultado de uma resposta: se acertou, a pergunta respondida e o estado após a jogada
+AnswerResult = namedtuple("AnswerResult", ["correct", "question", "score", "lives", "game_over"])
+
+
+class GameEngine:
+    MAX_LIVES = 3
+    POINTS_PER_ANSWER = 10
+
+    def __init__(self, topics=None, sampler_factory=None, max_lives=MAX_LIVES, rng=None, shuffle_options=False):
+        """`topics` é um `topics.TopicRegistry`; por padrão, usa `topics.default_registry()`.
+
+        `sampler_factory(tópico, tamanho)` cria o sorteador de cada tópico: um objeto
+        com `draw()`, `reset()` e `record(índice, acertou)`. O padrão é `LazyPermutation`
+        usando `rng`, o gerador da sessão (um `random.Random` próprio, nunca o global),
+        para que uma partida possa ser reproduzida a partir da semente.
+
+        Com `shuffle_options`, cada apresentação de pergunta sorteia uma das 24 ordens
+        das opções (`current_order`); `answer()` recebe a posição exibida. As perguntas
+        em si nunca são copiadas nem alteradas.
+        """
+        self.topics = default_registry() if topics is None else topics
+        self.rng = random.Random() if rng is None else rng
+        self.sampler_factory = sampler_factory or (lambda topic, size: LazyPermutation(size, self.rng))
+        self.max_lives = max_lives
+        self.shuffle_options = shuffle_options
+        # Um sorteador por tópico, criado quando o tópico é usado
+        self.samplers = {}
+        self.reset()
+
+    def reset(self):
+        """Zera o estado do jogo e recomeça o sorteio de cada tópico"""
+        self.current_topic = self.topics.default
+        self.score = 0
+        self.question_count = 0
+        self.lives = self.max_lives
+        self.current_question = None
+        self.current_index = None
+        self.current_order = 0
+        # Acertos e respostas de cada tópico na partida: {tópico: [acertos, respostas]}
+        self.topic_stats = {}
+        for sampler in self.samplers.values():
+            sampler.reset()
+        self.game_state = "question"  # "question", "topic_choice" ou "game_over"
+
+    def get_current_question(self):
+        """Retorna a próxima pergunta do tópico atual, reembaralhando quando o banco acaba"""
+        topic = self.current_topic
+        bank = self.topics.bank(topic)
+        sampler = self.samplers.get(topic)
+        if sampler is None:
+            # Primeiro uso do tópico: só agora o banco é carregado
+            sampler = self.samplers[topic] = self.sampler_factory(topic, len(bank))
+        self.current_index = sampler.draw()
+
+        return bank[self.current_index]
+
+    def next_question(self):
+        """Avança para a próxima pergunta do tópico atual"""
+        self.question_count += 1
+        self.current_question = self.get_current_question()
+        if self.shuffle_options:
+            self.current_order = self.rng.randrange(len(OPTION_ORDERS))
+        self.game_state = "question"
+        return self.current_question
+
+    def displayed_options(self):
+        """Opções da pergunta atual na ordem em que são exibidas"""
+        opcoes = self.current_question.opcoes
+        return tuple(opcoes[i] for i in OPTION_ORDERS[self.current_order])
+
+    def displayed_correct(self):
+        """Posição exibida da resposta correta da pergunta atual"""
+        return OPTION_POSITIONS[self.current_order][self.current_question.resposta_correta]
+
+    def option_index(self, displayed_index):
+        """Índice no banco da opção exibida na posição `displayed_index`"""
+        return OPTION_ORDERS[self.current_order][displayed_index]
+
+    def answer(self, selected_index):
+        """Registra a resposta (posição exibida da opção) e aplica as regras de pontos e vidas.
+
+        Acerto: +10 pontos e o jogo espera a escolha do próximo tópico.
+        Erro: -1 vida; se ainda restarem vidas, troca de tópico e já avança
+        para a próxima pergunta. Sem vidas, o jogo fica em "game_over".
+        """
+        if self.game_state != "question":
+            raise ValueError(f"Não há pergunta aguardando resposta (estado: {self.game_state})")
+
+        question = self.current_question
+        order = OPTION_ORDERS[self.current_order]
+        correct = 0 <= selected_index < len(order) and order[selected_index] == question.resposta_correta
+
+        stats = self.topic_stats.get(self.current_topic)
+        if stats is None:
+            stats = self.topic_stats[self.current_topic] = [0, 0]
+        stats[0] += correct
+        stats[1] += 1
+        sampler = self.samplers.get(self.current_topic)
+        if sampler is not None:
+            # Sessões do servidor sorteiam pela sala e não têm sorteador próprio
+            sampler.record(self.current_index, correct)
+
+        if correct:
+            self.score += self.POINTS_PER_ANSWER
+            self.game_state = "topic_choice"
+        else:
+            self.lives -= 1
+            if self.lives <= 0:
+                self.game_state = "game_over"
+            else:
+                # Trocar automaticamente de tópico
+                self.current_topic = self.topics.next_topic(self.current_topic)
+                self.next_question()
+
+        return AnswerResult(correct, question, self.score, self.lives, self.game_state == "game_over")
+
+    def choose_topic(self, topic):
+        """Escolhe o tópico da próxima pergunta (após um acerto) e avança"""
+        if self.game_state != "topic_choice":
+            raise ValueError(f"Escolha de tópico só após um acerto (estado: {self.game_state})")
+        if topic not in self.topics:
+            raise ValueError(f"Tópico desconhecido: {topic}")
+        self.current_topic = topic
+        return self.next_question()
+
+    def restart(self):
+        """Reinicia o jogo e já sorteia a primeira pergunta"""
+        self.reset()
+        return self.next_question()
+
+    def snapshot(self):
+        """Estado completo da partida, incluindo o estado do gerador e os sorteadores, pronto para `pickle`"""
+        return {
+            "current_topic": self.current_topic,
+            "score": self.score,
+            "question_count": self.question_count,
+            "lives": self.lives,
+            "max_lives": self.max_lives,
+            "current_index": self.current_index,
+            "current_order": self.current_order,
+            "shuffle_options": self.shuffle_options,
+            "topic_stats": self.topic_stats,
+            "game_state": self.game_state,
+            "rng": self.rng.getstate(),
+            "samplers": self.samplers,
+        }
+
+    def restore(self, state):
+        """Volta ao estado salvo por `snapshot()`"""
+        self.current_topic = state["current_topic"]
+        self.score = state["score"]
+        self.question_count = state["question_count"]
+        self.lives = state["lives"]
+        self.max_lives = state["max_lives"]
+        self.current_index = state["current_index"]
+        # Snapshots de antes do embaralhamento das opções não têm estes campos
+        self.current_order = state.get("current_order", 0)
+        self.shuffle_options = state.get("shuffle_options", False)
+        self.topic_stats = state["topic_stats"]
+        self.game_state = state["game_state"]
+        self.rng.setstate(state["rng"])
+        self.samplers = state["samplers"]
+        if self.current_index is None:
+            self.current_question = None
+        else:
+            self.current_question = self.topics.bank(self.current_topic)[self.current_index]
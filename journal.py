@@ -0,0 +1,205 @@
+"""Diário da partida para recuperação após uma queda.
+
+Cada ação do jogador (resposta, escolha de tópico, reinício) é acrescentada
+a um log de escrita antecipada, com a mesma codificação de eventos de
+`replay.py`. O log vai para o sistema operacional a cada evento, e o
+`fsync` é feito em lotes (a cada `sync_every` eventos ou `sync_interval`
+segundos), para não pagar uma ida ao disco por clique.
+
+Para o tempo de recuperação não crescer com a partida, a cada
+`snapshot_every` eventos o estado completo do motor (`GameEngine.snapshot`)
+é gravado em uma nova geração e o log recomeça vazio:
+
+    snapshot-<g>.pkl   estado no início da geração g (gravado com os.replace)
+    journal-<g>.log    cabeçalho de replay.py + eventos desde o snapshot
+
+Recuperar é carregar o snapshot mais recente e reaplicar no máximo
+`snapshot_every` eventos. As gerações antigas são apagadas depois que a
+nova está no disco.
+
+O snapshot guarda também a variante do jogo (`variant`: o que define os
+sorteadores, como o filtro de busca). Uma partida gravada em outra
+variante não é recuperada, e sim descartada: os sorteadores gravados não
+serviriam para a sessão atual.
+"""
+import os
+import pickle
+import re
+import time
+
+from replay import (apply_event, decode_header, encode_header, iter_events, ANSWER, RESTART, SHUFFLE_OPTIONS,
+                    TOPIC, TOPIC_INDEX)
+from spaced import player_directory
+
+JOURNAL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "journal")
+
+SNAPSHOT_EVERY = 500   # Eventos por geração (limita os eventos reaplicados na recuperação)
+SYNC_EVERY = 16        # Eventos por fsync
+SYNC_INTERVAL = 0.5    # Segundos máximos sem fsync quando chegam eventos
+
+GENERATION = re.compile(r"snapshot-(\d+)\.pkl$")
+
+# Referência persistente ao gerador do motor: os sorteadores restaurados voltam a usar o gerador vivo
+RNG_ID = "rng"
+
+
+class _Pickler(pickle.Pickler):
+    def __init__(self, file, rng):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.rng = rng
+
+    def persistent_id(self, obj):
+        return RNG_ID if obj is self.rng else None
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, file, rng):
+        super().__init__(file)
+        self.rng = rng
+
+    def persistent_load(self, pid):
+        if pid != RNG_ID:
+            raise pickle.UnpicklingError(f"referência persistente desconhecida: {pid!r}")
+        return self.rng
+
+
+class Journal:
+    def __init__(self, directory=JOURNAL_DIR, snapshot_every=SNAPSHOT_EVERY, sync_every=SYNC_EVERY,
+                 sync_interval=SYNC_INTERVAL, variant=None):
+        self.directory = directory
+        self.variant = variant
+        self.snapshot_every = snapshot_every
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.engine = None
+        self.file = None
+        self.generation = latest_generation(directory)
+
+    def _path(self, kind, generation):
+        extension = "pkl" if kind == "snapshot" else "log"
+        return os.path.join(self.directory, f"{kind}-{generation}.{extension}")
+
+    def exists(self):
+        """Há uma partida interrompida para recuperar?"""
+        return self.generation is not None
+
+    def recover(self, engine):
+        """Restaura `engine` para o último estado gravado; devolve quantos eventos foram reaplicados.
+
+        Se a partida gravada é de outra variante, o diário é apagado e o
+        retorno é None (`engine` fica como estava).
+        """
+        with open(self._path("snapshot", self.generation), "rb") as f:
+            state = _Unpickler(f, engine.rng).load()
+        if state.get("variante") != self.variant:
+            self._remove(self.generation)
+            self.generation = None
+            return None
+        engine.restore(state)
+        try:
+            with open(self._path("journal", self.generation), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            # Queda entre o snapshot e a criação do log: nada a reaplicar
+            return 0
+        _, topic_ids, _, _, pos = decode_header(data, f.name)
+        events = 0
+        for op, arg in iter_events(data, pos):
+            apply_event(engine, topic_ids, op, arg)
+            events += 1
+        return events
+
+    def start(self, engine):
+        """Começa a registrar as ações de `engine` a partir do seu estado atual"""
+        self.engine = engine
+        engine.log = self
+        self.checkpoint()
+
+    def checkpoint(self):
+        """Grava o estado atual como uma nova geração e recomeça o log"""
+        engine = self.engine
+        generation = 0 if self.generation is None else self.generation + 1
+        os.makedirs(self.directory, exist_ok=True)
+
+        snapshot = self._path("snapshot", generation)
+        with open(snapshot + ".tmp", "wb") as f:
+            state = engine.snapshot()
+            state["variante"] = self.variant
+            _Pickler(f, engine.rng).dump(state)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(snapshot + ".tmp", snapshot)
+
+        if self.file is not None:
+            self.file.close()
+        self.file = open(self._path("journal", generation), "wb")
+        flags = SHUFFLE_OPTIONS if engine.shuffle_options else 0
+        self.file.write(encode_header(0, engine.topics.order, engine.max_lives, flags))
+        self.topic_index = {topic: i for i, topic in enumerate(engine.topics.order)}
+        self.sync()
+
+        # A nova geração já está no disco: as anteriores não são mais necessárias
+        previous, self.generation = self.generation, generation
+        if previous is not None:
+            self._remove(previous)
+        self.events = 0
+
+    def answer(self, selected_index):
+        self._write(bytes((ANSWER, selected_index)))
+
+    def topic(self, topic):
+        self._write(bytes((TOPIC,)) + TOPIC_INDEX.pack(self.topic_index[topic]))
+
+    def restart(self):
+        self._write(bytes((RESTART,)))
+
+    def _write(self, event):
+        self.file.write(event)
+        # Só o flush: uma queda do processo não perde o evento; o fsync vem em lotes
+        self.file.flush()
+        self.events += 1
+        self.pending += 1
+        if self.events >= self.snapshot_every:
+            self.checkpoint()
+        elif self.pending >= self.sync_every or time.monotonic() - self.synced_at >= self.sync_interval:
+            self.sync()
+
+    def sync(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.pending = 0
+        self.synced_at = time.monotonic()
+
+    def close(self, discard=False):
+        """Fecha o diário; com `discard`, apaga a partida (encerrada normalmente, nada a recuperar)"""
+        if self.file is not None:
+            self.sync()
+            self.file.close()
+            self.file = None
+        if discard and self.generation is not None:
+            self._remove(self.generation)
+            self.generation = None
+        if self.engine is not None:
+            self.engine.log = None
+
+    def _remove(self, generation):
+        for kind in ("journal", "snapshot"):
+            try:
+                os.remove(self._path(kind, generation))
+            except FileNotFoundError:
+                pass
+
+
+def player_journal(player, base=JOURNAL_DIR, variant=None):
+    """Diário da partida de `player`, em `journal/<jogador>/`"""
+    return Journal(player_directory(player, base), variant=variant)
+
+
+def latest_generation(directory):
+    """Geração do snapshot mais recente em `directory`, ou None"""
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return None
+    generations = [int(match.group(1)) for match in map(GENERATION.match, names) if match]
+    return max(generations, default=None)
@@ -0,0 +1,54 @@
+"""Agendamento do recálculo de layout da área com scroll.
+
+Os eventos `<Configure>` chegam em rajadas (arrastar a janela, entrar em
+tela cheia, trocar o texto da pergunta). Em vez de recalcular `bbox("all")`
+e recentralizar a cada evento, o `LayoutScheduler` junta todos os pedidos
+que chegam antes de o Tk ficar ocioso em uma única passada (`after_idle`).
+
+Com `verbose`, ele também mostra quantas passadas cada transição de tela
+provocou, para acompanhar o custo de layout de cada troca de pergunta.
+"""
+import sys
+
+
+class LayoutScheduler:
+    def __init__(self, widget, callback, verbose=False):
+        self.widget = widget
+        self.callback = callback
+        self.verbose = verbose
+        self.passes = 0
+        self.requests = 0
+        self._pending = None
+        self._transition = None
+        self._mark = (0, 0)
+
+    def request(self, event=None):
+        """Pede um recálculo; vários pedidos seguidos viram uma única passada"""
+        self.requests += 1
+        if self._pending is None:
+            self._pending = self.widget.after_idle(self._run)
+
+    def _run(self):
+        self._pending = None
+        self.passes += 1
+        self.callback()
+
+    def begin_transition(self, label):
+        """Fecha a contagem da transição anterior e começa a de `label`"""
+        self._report()
+        self._transition = label
+        self._mark = (self.passes, self.requests)
+
+    def close(self):
+        """Mostra a última transição e descarta a passada pendente (ao fechar a janela)"""
+        self._report()
+        self._transition = None
+        if self._pending is not None:
+            self.widget.after_cancel(self._pending)
+            self._pending = None
+
+    def _report(self):
+        if self.verbose and self._transition is not None:
+            passes = self.passes - self._mark[0]
+            requests = self.requests - self._mark[1]
+            print(f"layout: {self._transition}: {passes} passada(s) para {requests} evento(s)", file=sys.stderr)
@@ -0,0 +1,132 @@
+"""Placar persistente das partidas em SQLite.
+
+As partidas terminadas entram em uma fila e são gravadas em lotes por uma
+thread própria (banco em modo WAL), então quem registra a partida (a
+interface, por exemplo) nunca espera pelo disco. O top-K usa o índice por
+pontuação; a posição no ranking soma o histograma de pontuações
+(`pontuacoes`, uma linha por pontuação distinta, atualizado pela thread de
+gravação na mesma transação), então não depende do número de partidas.
+"""
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import Counter
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "leaderboard.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS partidas (
+    id INTEGER PRIMARY KEY,
+    pontos INTEGER NOT NULL,
+    perguntas INTEGER NOT NULL,
+    precisao TEXT NOT NULL,
+    criado_em REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_partidas_pontos ON partidas (pontos DESC, criado_em);
+CREATE TABLE IF NOT EXISTS pontuacoes (
+    pontos INTEGER PRIMARY KEY,
+    partidas INTEGER NOT NULL
+);
+"""
+
+_STOP = object()
+
+
+class Leaderboard:
+    def __init__(self, path=DEFAULT_PATH, batch_size=256, flush_interval=0.5):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._local = threading.local()
+
+        # Cria o esquema antes de liberar leituras em outras threads
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        with conn:
+            # Banco criado antes do histograma: monta a partir das partidas existentes
+            if conn.execute("SELECT 1 FROM pontuacoes LIMIT 1").fetchone() is None:
+                conn.execute("INSERT INTO pontuacoes SELECT pontos, COUNT(*) FROM partidas GROUP BY pontos")
+
+        self._writer = threading.Thread(target=self._write_loop, name="leaderboard-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _write_loop(self):
+        conn = self._connect()
+        while True:
+            item = self._queue.get()
+            batch = [item]
+            # Junta o que chegar em seguida no mesmo lote (até batch_size ou flush_interval)
+            deadline = time.monotonic() + self.flush_interval
+            while item is not _STOP and len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                batch.append(item)
+
+            rows = [row for row in batch if row is not _STOP]
+            if rows:
+                with conn:
+                    conn.executemany(
+                        "INSERT INTO partidas (pontos, perguntas, precisao, criado_em) VALUES (?, ?, ?, ?)",
+                        rows)
+                    conn.executemany(
+                        "INSERT INTO pontuacoes (pontos, partidas) VALUES (?, ?) "
+                        "ON CONFLICT (pontos) DO UPDATE SET partidas = partidas + excluded.partidas",
+                        Counter(row[0] for row in rows).items())
+            for _ in batch:
+                self._queue.task_done()
+            if batch[-1] is _STOP:
+                conn.close()
+                return
+
+    def record(self, score, question_count, topic_stats, timestamp=None):
+        """Enfileira uma partida terminada; `topic_stats` é {tópico: [acertos, respostas]}"""
+        precisao = json.dumps({topic: {"acertos": hits, "respostas": total}
+                               for topic, (hits, total) in topic_stats.items()})
+        self._queue.put((score, question_count, precisao, time.time() if timestamp is None else timestamp))
+
+    def record_game(self, engine):
+        """Registra a partida atual de um `GameEngine`"""
+        self.record(engine.score, engine.question_count, engine.topic_stats)
+
+    def top(self, k=10):
+        """As `k` melhores partidas: lista de (pontos, perguntas, precisão, data)"""
+        rows = self._connect().execute(
+            "SELECT pontos, perguntas, precisao, criado_em FROM partidas "
+            "ORDER BY pontos DESC, criado_em LIMIT ?", (k,)).fetchall()
+        return [(pontos, perguntas, json.loads(precisao), criado_em)
+                for pontos, perguntas, precisao, criado_em in rows]
+
+    def rank(self, score):
+        """Posição que uma partida com `score` pontos ocupa no ranking (1 = melhor)"""
+        (better,) = self._connect().execute(
+            "SELECT COALESCE(SUM(partidas), 0) FROM pontuacoes WHERE pontos > ?", (score,)).fetchone()
+        return better + 1
+
+    def flush(self):
+        """Espera até que todas as partidas enfileiradas estejam no disco"""
+        self._queue.join()
+
+    def close(self):
+        self._queue.put(_STOP)
+        self._writer.join()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -1,658 +1,211 @@
+import time
+
+_STARTED = time.perf_counter()
+
+import argparse
+import os
+import random
+import sys
 import tkinter as tk
 from tkinter import messagebox
-import ttkbootstrap as ttk
-from ttkbootstrap.constants import *
-import random
+from tkinter.constants import BOTH, BOTTOM, LEFT, RIGHT, W, X
+
+from engine import GameEngine
+from layout import LayoutScheduler
+from startup import StartupTimer
+
+# ttkbootstrap é importado só depois que a janela aparece (ver `load_theme`)
+ttk = None
 
 class TriviaGame:
-    def __init__(self):
-        self.root = ttk.Window(themename="superhero")
+    def __init__(self, mode="normal", target_difficulty=0.5, player="jogador", max_lives=GameEngine.MAX_LIVES,
+                 startup=None, layout_stats=False, rapid=False, seed=None, record=None,
+                 journal=False, profile=None, search=None, check_duplicates=False, shuffle=True):
+        self.startup = startup or StartupTimer(_STARTED)
+        self.startup.mark("imports de main.py")
+        
+        # Janela mínima primeiro: o tema, os bancos e a interface completa vêm depois da primeira pintura
+        self.root = tk.Tk()
         self.root.title("Trivia Game - K-pop vs Programação")
         self.root.geometry("900x700")  # Janela maior
         self.root.minsize(800, 600)    # Tamanho mínimo
+        self.root.configure(bg='#2c3e50')
         # Adicionar bind para F11 (fullscreen) e Escape (sair do fullscreen)
         self.root.bind('<F11>', self.toggle_fullscreen)
         self.root.bind('<Escape>', self.exit_fullscreen)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         self.is_fullscreen = False
         
-        # Dicionários de perguntas
-        self.kpop_questions = [
-    # EXO questions
-    {
-        "pergunta": "Em que ano o EXO foi formado e qual agência gerencia o grupo?",
-        "opcoes": ["2010, YG Entertainment", "2012, SM Entertainment", "2014, JYP Entertainment", "2016, Big Hit Entertainment"],
-        "resposta_correta": 1
-    },
-    {
-        "pergunta": "Qual era a estratégia inicial de subgrupos do EXO?",
-        "opcoes": [
-            "EXO-K para Coreia do Sul e EXO-M para China, com músicas em coreano e mandarim",
-            "EXO-A para Ásia e EXO-W para o mundo ocidental",
-            "EXO-L para fãs e EXO-F para família",
-            "EXO-B para baladas e EXO-D para danças"
-        ],
-        "resposta_correta": 0
-    },
-    {
-        "pergunta": "Quantos membros formavam o EXO no debut e quantos permanecem atualmente?",
-        "opcoes": ["12 no debut, 9 atualmente", "10 no debut, 7 atualmente", "9 no debut, 12 atualmente", "14 no debut, 10 atualmente"],
-        "resposta_correta": 0
-    },
-    {
-        "pergunta": "Quais membros chineses deixaram o EXO e em que período isso ocorreu?",
-        "opcoes": [
-            "Kris, Luhan e Tao, entre 2014 e 2015",
-            "Xiumin, Suho e Lay, entre 2013 e 2014",
-            "Baekhyun, Chen e Kai, entre 2015 e 2016",
-            "Chanyeol, D.O. e Sehun, entre 2016 e 2017"
-        ],
-        "resposta_correta": 0
-    },
-    {
-        "pergunta": "Quem é o líder do EXO e qual é o seu “poder mítico”?",
-        "opcoes": ["Suho, poder da água", "Kai, poder do fogo", "D.O., poder da terra", "Lay, poder do vento"],
-        "resposta_correta": 0
-    },
-    {
-        "pergunta": "Qual dos membros do EXO é o mais velho e fazia parte originalmente do EXO-M?",
-        "opcoes": ["Xiumin", "Baekhyun", "Chen", "Sehun"],
-        "resposta_correta": 0
-    },
-    {
-        "pergunta": "Quais são os membros da subunidade EXO-CBX?",
-        "opcoes": [
-            "Chen, Baekhyun e Xiumin",
-            "Suho, D.O. e Sehun",
-            "Chanyeol, Kai e Tao",
-            "Lay, Kris e Luhan"
-        ],
-        "resposta_correta": 0
-    },
-    {
-        "pergunta": "Qual é o nome da segunda subunidade formada por Sehun e Chanyeol?",
-        "opcoes": ["EXO-CBX", "EXO-SC", "SuperM", "EXO-K"],
-        "resposta_correta": 1
-    },
-    {
-        "pergunta": "Qual álbum do EXO foi o primeiro a vender mais de 1 milhão de cópias na Coreia em 12 anos?",
-        "opcoes": ["Overdose", "XOXO", "Exodus", "The War"],
-        "resposta_correta": 1
-    },
-    {
-        "pergunta": "Como se chama o fandom oficial do EXO e qual é o significado da letra 'L'?",
-        "opcoes": [
-            "EXO-L, 'L' significa 'Love' e representa a união entre EXO-K e EXO-M",
-            "EXO-F, 'F' significa 'Família'",
-            "EXO-A, 'A' significa 'Amigos'",
-            "EXO-B, 'B' significa 'Brothers'"
-        ],
-        "resposta_correta": 0
-    },
-    {
-        "pergunta": "O que simboliza a narrativa mitológica do EXO no início da carreira?",
-        "opcoes": [
-            "Seres mitológicos da Terra",
-            "Alienígenas de um exoplaneta com superpoderes individuais",
-            "Robôs futuristas",
-            "Heróis rivais de outra dimensão"
-        ],
-        "resposta_correta": 1
-    },
-    {
-        "pergunta": "Qual dos seguintes não é um poder mítico atribuído a um membro do EXO?",
-        "opcoes": [
-            "Gelo (Xiumin)", "Água (Suho)", "Fogo (Chanyeol)", "Electricidade (Baekhyun)"
-        ],
-        "resposta_correta": 3
-    },
-    {
-        "pergunta": "Qual dos álbuns do EXO foi o mais vendido na Coreia do Sul, ultrapassando 2 milhões de cópias?",
-        "opcoes": ["Exist", "Overdose", "Exodus", "Don't Mess Up My Tempo"],
-        "resposta_correta": 0
-    },
-    {
-        "pergunta": "O que caracteriza o modelo de carreira ‘híbrido’ adotado por membros do EXO?",
-        "opcoes": [
-            "Trazer novos membros para substituir antigos",
-            "Gerenciar atividades solo e grupo por diferentes agências para maior autonomia",
-            "Parar as atividades solo para focar só no grupo",
-            "Fazer todos os contratos diretamente com a SM Entertainment"
-        ],
-        "resposta_correta": 1
-    },
-    {
-        "pergunta": "Quando está previsto o retorno completo do EXO com todos os nove membros após o serviço militar?",
-        "opcoes": ["Final de 2024", "Final de 2025", "Início de 2026", "Nenhuma data prevista"],
-        "resposta_correta": 1
-    },
-
-    # BLACKPINK questions
-    {
-        "pergunta": "Quantos membros compõem o BLACKPINK e quais são seus nomes?",
-        "opcoes": ["Três: Jisoo, Jennie, Rosé", "Quatro: Jisoo, Jennie, Rosé, Lisa", "Cinco: Jisoo, Jennie, Rosé, Lisa, Rose", "Seis: Jisoo, Jennie, Rosé, Lisa, Lisa, Jennie"],
-        "resposta_correta": 1
-    },
-    {
-        "pergunta": "Quando a YG Entertainment confirmou oficialmente o debut do BLACKPINK?",
-        "opcoes": ["Maio de 2016", "Agosto de 2015", "Junho de 2017", "Janeiro de 2016"],
-        "resposta_correta": 0
-    },
-    {
-        "pergunta": "Qual foi a ordem de revelação das integrantes do BLACKPINK em 2016?",
-        "opcoes": [
-            "Jennie, Lisa, Jisoo, Rosé",
-            "Rosé, Jisoo, Lisa, Jennie",
-            "Lisa, Jennie, Rosé, Jisoo",
-            "Jisoo, Rosé, Lisa, Jennie"
-        ],
-        "resposta_correta": 0
-    },
-    {
-        "pergunta": "Quais singles Lançados no debut de BLACKPINK alcançaram o topo da Billboard World Digital Song Sales?",
-        "opcoes": [
-            "'Whistle' em 1º e 'Boombayah' em 2º",
-            "'Playing with Fire' e 'Stay'",
-            "'Ddu-Du Ddu-Du' e 'Kill This Love'",
-            "'Pink Venom' e 'Shut Down'"
-        ],
-        "resposta_correta": 0
-    },
-    {
-        "pergunta": "Qual integrante é conhecida como vocalista líder e também atua como atriz?",
-        "opcoes": ["Jennie", "Jisoo", "Rosé", "Lisa"],
-        "resposta_correta": 1
-    },
-    {
-        "pergunta": "Qual membro do BLACKPINK é reconhecido por ser rapper principal e uma importante ícone de moda de luxo Chanel?",
-        "opcoes": ["Lisa", "Jennie", "Jisoo", "Rosé"],
-        "resposta_correta": 1
-    },
-    {
-        "pergunta": "Lisa tem uma característica única em sua trajetória na YG Entertainment, qual é?",
-        "opcoes": [
-            "Única membro coreana do grupo",
-            "Única traineee aprovada em audição na Tailândia em 2010",
-            "A primeira integrante a lançar um álbum solo",
-            "A única que canta e não dança"
-        ],
-        "resposta_correta": 1
-    },
-    {
-        "pergunta": "Quais gêneros musicais predominam na sonoridade do BLACKPINK?",
-        "opcoes": [
-            "Jazz e blues",
-            "Rock e country",
-            "EDM, pop, hip-hop e trap",
-            "Reggae e samba"
-        ],
-        "resposta_correta": 2
-    },
-    {
-        "pergunta": "Qual álbum do BLACKPINK foi o primeiro grupo feminino de K-pop a estrear em 1º lugar na Billboard 200?",
-        "opcoes": [
-            "Square One",
-            "Square Up",
-            "The Album",
-            "Born Pink"
-        ],
-        "resposta_correta": 3
-    },
-    {
-        "pergunta": "Quais artistas ocidentais já colaboraram com o BLACKPINK em parceria musical?",
-        "opcoes": [
-            "Dua Lipa, Selena Gomez e Lady Gaga",
-            "Beyoncé, Rihanna e Ariana Grande",
-            "Taylor Swift, Adele e Billie Eilish",
-            "Ed Sheeran, Shawn Mendes e Bruno Mars"
-        ],
-        "resposta_correta": 0
-    },
-    {
-        "pergunta": "Que função cada integrante do BLACKPINK desempenha no grupo?",
-        "opcoes": [
-            "Jisoo - Dançarina; Jennie - Vocalista; Rosé - Rapper; Lisa - Vocalista",
-            "Jisoo - Vocalista líder; Jennie - Rapper principal; Rosé - Vocalista principal; Lisa - Dançarina principal e rapper",
-            "Jisoo - Rapper; Jennie - Dançarina; Rosé - Vocalista; Lisa - Produtora",
-            "Todas são vocalistas principais"
-        ],
-        "resposta_correta": 1
-    },
-    {
-        "pergunta": "Quais marcas de luxo cada integrante do BLACKPINK representa como embaixadora global?",
-        "opcoes": [
-            "Jisoo - Dior e Cartier; Jennie - Chanel e Calvin Klein; Rosé - Yves Saint Laurent e Tiffany & Co; Lisa - Louis Vuitton, Céline e Bulgari",
-            "Jisoo - Chanel; Jennie - Dior; Rosé - Cartier; Lisa - Calvin Klein",
-            "Jisoo - Louis Vuitton; Jennie - Tiffany & Co; Rosé - Bulgari; Lisa - Yves Saint Laurent",
-            "Jisoo - Gucci; Jennie - Prada; Rosé - Fendi; Lisa - Versace"
-        ],
-        "resposta_correta": 0
-    },
-    {
-        "pergunta": "Qual recorde digital o BLACKPINK detém no YouTube?",
-        "opcoes": [
-            "Maior número de inscritos para banda pop global",
-            "Canal de artista musical com maior número de inscritos (mais de 96 milhões)",
-            "Vídeo musical mais longo da história",
-            "Primeiro grupo a usar YouTube para debutar"
-        ],
-        "resposta_correta": 1
-    },
-    {
-        "pergunta": "Qual foi o primeiro single em língua coreana a liderar a parada Global Top Songs do Spotify?",
-        "opcoes": [
-            "'Ddu-Du Ddu-Du'",
-            "'Kill This Love'",
-            "'Pink Venom'",
-            "'Boombayah'"
-        ],
-        "resposta_correta": 2
-    },
-    {
-        "pergunta": "Qual novo modelo de negócios as integrantes do BLACKPINK adotaram para suas carreiras solo?",
-        "opcoes": [
-            "Continuar exclusivamente sob a YG Entertainment",
-            "Fundar suas próprias gravadoras ou assinar com outras agências mantendo o grupo coeso",
-            "Desistir das carreiras solo para focar só no grupo",
-            "Mudar para uma gravadora americana, dissolvendo o grupo"
-        ],
-        "resposta_correta": 1
-    },
-
-    # TWICE and General Kpop questions (mixed)
-    {
-        "pergunta": "Qual grupo de K-pop é conhecido pela música 'Dynamite'?",
-        "opcoes": ["BLACKPINK", "BTS", "TWICE", "Red Velvet"],
-        "resposta_correta": 1
-    },
-    {
-        "pergunta": "Em que ano o grupo Girls' Generation (SNSD) debutou?",
-        "opcoes": ["2006", "2007", "2008", "2009"],
-        "resposta_correta": 1
-    },
-    {
-        "pergunta": "Qual é o nome real de G-Dragon do BIGBANG?",
-        "opcoes": ["Kim Jong-kook", "Kwon Ji-yong", "Lee Min-ho", "Park Ji-min"],
-        "resposta_correta": 1
-    },
-    {
-        "pergunta": "Quantos membros tem o grupo BLACKPINK?",
-        "opcoes": ["3", "4", "5", "6"],
-        "resposta_correta": 1
-    },
-    {
-        "pergunta": "Qual grupo feminino é conhecido pela música 'DDU-DU DDU-DU'?",
-        "opcoes": ["TWICE", "Red Velvet", "BLACKPINK", "ITZY"],
-        "resposta_correta": 2
-    },
-    {
-        "pergunta": "O que significa 'maknae' no K-pop?",
-        "opcoes": ["Líder do grupo", "Membro mais velho", "Membro mais novo", "Vocalista principal"],
-        "resposta_correta": 2
-    },
-    {
-        "pergunta": "Qual empresa é responsável pelo BTS?",
-        "opcoes": ["SM Entertainment", "YG Entertainment", "Big Hit Entertainment", "JYP Entertainment"],
-        "resposta_correta": 2
-    },
-    {
-        "pergunta": "Quantos membros tem o grupo EXO atualmente?",
-        "opcoes": ["8", "9", "10", "12"],
-        "resposta_correta": 1
-    },
-    {
-        "pergunta": "Qual é o nome do fandom do TWICE?",
-        "opcoes": ["ONCE", "BLINK", "ARMY", "ReVeluv"],
-        "resposta_correta": 0
-    },
-    {
-        "pergunta": "Em que país nasceu a integrante Lisa do BLACKPINK?",
-        "opcoes": ["Coreia do Sul", "Tailândia", "China", "Japão"],
-        "resposta_correta": 1
-    },
-
-    # TWICE questions
-    {
-        "pergunta": "Quantas integrantes o TWICE tem atualmente e qual foi a razão para essa formação?",
-        "opcoes": [
-            "Sete, escolhidas apenas pelo reality Sixteen",
-            "Nove, com duas integrantes adicionadas após o reality show",
-            "Oito, após uma integrante deixar o grupo",
-            "Dez, com membros incluindo trainees convidados"
-        ],
-        "resposta_correta": 1
-    },
-    {
-        "pergunta": "Qual reality show formou o TWICE e qual foi sua característica principal na seleção?",
-        "opcoes": [
-            "Produce 101, foco apenas em habilidades técnicas",
-            "Sixteen, avaliava canto, dança, carisma e personalidade",
-            "Unpretty Rapstar, competição de rap",
-            "Idol School, votação popular exclusiva"
-        ],
-        "resposta_correta": 1
-    },
-    {
-        "pergunta": "Qual foi a controvérsia na formação final do TWICE após o reality 'Sixteen'?",
-        "opcoes": [
-            "A adição de um integrante masculino ao grupo feminino",
-            "A substituição da líder após o programa",
-            "A ampliação do grupo de sete para nove membros, adicionando eliminadas",
-            "A escolha do nome TWICE por votação dos fãs"
-        ],
-        "resposta_correta": 2
-    },
-    {
-        "pergunta": "Quem foi a integrante escolhida por J.Y. Park para complementar a formação do grupo e qual sua habilidade destacada?",
-        "opcoes": [
-            "Tzuyu, a mais alta e viral em arquearia",
-            "Momo, conhecida como 'máquina de dança'",
-            "Jihyo, a líder com maior período de trainee",
-            "Sana, fluente em coreano e japonesa"
-        ],
-        "resposta_correta": 1
-    },
-    {
-        "pergunta": "Qual música marcou a estreia oficial do TWICE e qual fenômeno diferente seu videoclipe causou?",
-        "opcoes": [
-            "'Like Ooh-Ahh', ganhou popularidade gradual com viral de vídeo de zumbis",
-            "'Cheer Up', desde o início no topo das paradas",
-            "'Fancy', lançamento direto internacional",
-            "'The Feels', primeiro single em inglês"
-        ],
-        "resposta_correta": 0
-    },
-    {
-        "pergunta": "Qual conceito musical o TWICE usou inicialmente e como ele evoluiu em 2019?",
-        "opcoes": [
-            "'Black Swan' para um visual sombrio",
-            "'Color pop', evoluindo para estética chic e madura com 'Fancy'",
-            "'Hip-hop' para EDM progressivo",
-            "'Baladas' para dance pop"
-        ],
-        "resposta_correta": 1
-    },
-    {
-        "pergunta": "Que estratégia o TWICE utilizou para conquistar o mercado global ocidental?",
-        "opcoes": [
-            "Estreia do single em inglês 'The Feels'",
-            "Participação em programas americanos de TV",
-            "Colaborações com artistas americanos",
-            "Tour mundial antes do debut coreano"
-        ],
-        "resposta_correta": 0
-    },
-    {
-        "pergunta": "Qual o nome do fandom do TWICE e qual é o significado por trás desse nome?",
-        "opcoes": [
-            "ONCE, que significa 'Amar uma vez e retribuir duas vezes'",
-            "BLINK, significando piscada e conexão rápida",
-            "ARMY, união e força do exército",
-            "ReVeluv, amor por Red Velvet"
-        ],
-        "resposta_correta": 0
-    },
-    {
-        "pergunta": "Qual foi o marco da turnê 'Ready to Be' em números e país onde o TWICE ficou surpreso com o engajamento?",
-        "opcoes": [
-            "Mais de 2 milhões de fãs em 20 países, surpreendidos na Austrália",
-            "Mais de 1,5 milhão de fãs em 14 países, com passagem notável no Brasil",
-            "1 milhão de fãs somente na Coreia",
-            "5 milhões de fãs no Japão"
-        ],
-        "resposta_correta": 1
-    },
-    {
-        "pergunta": "Quem é a integrante que teve o maior período de trainee no TWICE e também é líder do grupo?",
-        "opcoes": [
-            "Nayeon",
-            "Jihyo",
-            "Chaeyoung",
-            "Dahyun"
-        ],
-        "resposta_correta": 1
-    }
-]
-
-        
-        self.programacao_questions = [
-            {
-                "pergunta": "O que é uma linguagem de programação?",
-                "opcoes": [
-                    "Uma linguagem falada por programadores",
-                    "Um conjunto de instruções que um computador pode entender e executar",
-                    "Um software para criar imagens",
-                    "Um tipo de hardware que processa dados"
-                ],
-                "resposta_correta": 1
-            },
-            {
-                "pergunta": "Qual dessas linguagens é conhecida por ser fácil para iniciantes?",
-                "opcoes": [
-                    "Python",
-                    "Assembly",
-                    "C++",
-                    "Fortran"
-                ],
-                "resposta_correta": 0
-            },
-            {
-                "pergunta": "O que significa dizer que Python é uma linguagem interpretada?",
-                "opcoes": [
-                    "O código é convertido em máquina antes de ser executado",
-                    "O código é traduzido e executado linha por linha pelo interpretador",
-                    "Python não precisa de computador para funcionar",
-                    "É um tipo de linguagem apenas para interpretar textos"
-                ],
-                "resposta_correta": 1
-            },
-            {
-                "pergunta": "Qual é o resultado da função print() em Python?",
-                "opcoes": [
-                    "Executar um cálculo matemático",
-                    "Exibir uma mensagem no console ou tela",
-                    "Criar uma nova variável",
-                    "Armazenar dados em um arquivo"
-                ],
-                "resposta_correta": 1
-            },
-            {
-                "pergunta": "O que são variáveis em programação?",
-                "opcoes": [
-                    "Espaços de armazenamento para valores que podem mudar durante a execução do programa",
-                    "Nomes exclusivos para funções",
-                    "Páginas de documentação de código",
-                    "Erro no programa"
-                ],
-                "resposta_correta": 0
-            },
-            {
-                "pergunta": "O que significa 'indentação' em linguagens como Python?",
-                "opcoes": [
-                    "Uso de espaços ou tabulações para organizar o código e definir blocos de comandos",
-                    "Escrever código em várias linhas",
-                    "Colocar comentários no código",
-                    "Nomear variáveis"
-                ],
-                "resposta_correta": 0
-            },
-            {
-                "pergunta": "O que é um 'loop' em programação?",
-                "opcoes": [
-                    "Uma função que executa comandos aprendidos", 
-                    "Uma estrutura que repete um bloco de código várias vezes", 
-                    "Um tipo de erro no programa", 
-                    "Um programa separado"
-                ],
-                "resposta_correta": 1
-            },
-            {
-                "pergunta": "O que uma função em programação faz?",
-                "opcoes": [
-                    "Armazena dados", 
-                    "Executa uma tarefa específica e pode retornar um valor", 
-                    "Mostra uma mensagem na tela", 
-                    "Cria uma variável"
-                ],
-                "resposta_correta": 1
-            },
-            {
-                "pergunta": "O que significa 'tipagem dinâmica' em Python?",
-                "opcoes": [
-                    "É preciso declarar tipos de dados antes de usar variáveis", 
-                    "O tipo da variável é inferido durante a execução e pode mudar", 
-                    "Variáveis não podem ser alteradas", 
-                    "Python não usa variáveis"
-                ],
-                "resposta_correta": 1
-            },
-            {
-                "pergunta": "O que é 'orientação a objetos' na programação?",
-                "opcoes": [
-                    "Uma forma de pensar programas baseada em objetos que possuem dados e comportamentos", 
-                    "Programas que só trabalham com imagens", 
-                    "Um tipo específico de linguagem de marcação", 
-                    "Um software para desenhar"
-                ],
-                "resposta_correta": 0
-            },
-            {
-                "pergunta": "Qual destas é uma vantagem de aprender Python?",
-                "opcoes": [
-                    "É difícil e serve só para programadores experientes", 
-                    "Possui uma comunidade grande e muitos recursos para iniciantes", 
-                    "Só serve para matemática avançada", 
-                    "Só roda em computadores muito potentes"
-                ],
-                "resposta_correta": 1
-            },
-            {
-                "pergunta": "Para que serve um 'comentário' em código-fonte?",
-                "opcoes": [
-                    "Para explicar o que o código faz sem afetar a execução", 
-                    "Para adicionar comandos ao programa", 
-                    "Para criar animações", 
-                    "Para evitar erros"
-                ],
-                "resposta_correta": 0
-            },
-            {
-                "pergunta": "Qual dos seguintes é um comando correto para imprimir 'Olá Mundo' em Python?",
-                "opcoes": [
-                    "write('Olá Mundo')", 
-                    "echo 'Olá Mundo'", 
-                    "print('Olá Mundo')", 
-                    "output 'Olá Mundo'"
-                ],
-                "resposta_correta": 2
-            },
-            {
-                "pergunta": "O que faz a estrutura condicional (if) na programação?",
-                "opcoes": [
-                    "Repete ações várias vezes", 
-                    "Executa blocos de código diferentes dependendo de uma condição", 
-                    "Define variáveis", 
-                    "Cria funções"
-                ],
-                "resposta_correta": 1
-            },
-            {
-                "pergunta": "O que é um 'bug' na programação?",
-                "opcoes": [
-                    "Um recurso novo da linguagem", 
-                    "Um erro ou defeito no código que faz o programa se comportar incorretamente", 
-                    "Uma linha de código comentada", 
-                    "Um tipo de dado"
-                ],
-                "resposta_correta": 1
-            },
-            {
-                "pergunta": "Qual destes é um ambiente integrado de desenvolvimento (IDE)?",
-                "opcoes": [
-                    "VS Code", 
-                    "GitHub", 
-                    "Google Chrome", 
-                    "Python"
-                ],
-                "resposta_correta": 0
-            },
-            {
-                "pergunta": "O que é um 'algoritmo'?",
-                "opcoes": [
-                    "Um conjunto de passos para resolver um problema ou realizar uma tarefa", 
-                    "Um tipo de dado", 
-                    "Um erro no programa", 
-                    "Um sistema operacional"
-                ],
-                "resposta_correta": 0
-            },
-            {
-                "pergunta": "O que significa 'open source'?",
-                "opcoes": [
-                    "Software de código aberto, que permite acesso e modificação do seu código-fonte", 
-                    "Software pago e protegido por segredo", 
-                    "Software que não funciona sem internet", 
-                    "Software sem suporte oficial"
-                ],
-                "resposta_correta": 0
-            },
-            {
-                "pergunta": "O que é 'Git'?",
-                "opcoes": [
-                    "Uma linguagem de programação", 
-                    "Um sistema de controle de versões para gerenciar e acompanhar alterações em arquivos de código", 
-                    "Um compilador", 
-                    "Um tipo de banco de dados"
-                ],
-                "resposta_correta": 1
-            },
-            {
-                "pergunta": "Qual é o papel principal de um 'framework' na programação?",
-                "opcoes": [
-                    "Gerenciar bancos de dados automaticamente", 
-                    "Fornecer uma estrutura pronta para facilitar o desenvolvimento de aplicativos", 
-                    "Compilar código em máquina", 
-                    "Substituir linguagens de programação"
-                ],
-                "resposta_correta": 1
-            }
-        ]
-        
-        # Variáveis do jogo
-        self.current_topic = "kpop"
-        self.score = 0
-        self.question_count = 0
-        self.lives = 3  # Sistema de vidas
-        self.current_question = None
-        self.kpop_shuffled = self.kpop_questions.copy()
-        self.programacao_shuffled = self.programacao_questions.copy()
-        self.kpop_index = 0
-        self.programacao_index = 0
-        self.game_state = "question"  # "question" ou "topic_choice"
-        
-        # Embaralhar as perguntas
-        random.shuffle(self.kpop_shuffled)
-        random.shuffle(self.programacao_shuffled)
-        
+        splash = tk.Label(self.root, text="🎵 TRIVIA GAME 🧪\n\nCarregando...",
+                          font=("Arial", 20, "bold"),
+                          bg='#2c3e50', fg='white')  # Cor fixa para compatibilidade
+        splash.pack(expand=True)
+        self.root.update()
+        self.startup.mark("janela na tela")
+        
+        self.load_theme()
+        
+        # Regras do jogo (sem Tk); usa o banco compilado se existir
+        self.mode = mode
+        self.player = player
+        self.difficulty_stats = None
+        self.seen_store = None
+        # Todo sorteio da sessão sai deste gerador; a partida só se repete se o histórico salvo também for o mesmo
+        self.seed = random.getrandbits(64) if seed is None else seed
+        rng = random.Random(self.seed)
+        sampler_factory = None
+        topics = None
+        self.recording = record is not None
+        if self.recording:
+            # Sessão gravada: só a semente e as ações definem as perguntas (sem histórico do jogador)
+            replay = self.startup.timed_import("replay")
+            self.engine = replay.RecordedGame(record, self.seed, max_lives=max_lives, shuffle_options=shuffle)
+        elif search:
+            # Só perguntas que casam com a busca; tópicos sem nenhuma ficam de fora
+            topics, sampler_factory = self.search_mode(search, rng)
+        elif mode == "normal":
+            # Sem repetir perguntas já vistas pelo jogador, mesmo entre partidas e execuções
+            seen = self.startup.timed_import("seen")
+            self.seen_store = seen.SeenStore(player)
+            sampler_factory = self.seen_store.sampler_factory(rng)
+        elif mode == "adaptativo":
+            # Perguntas sorteadas perto da dificuldade alvo, com estatísticas salvas entre execuções
+            difficulty = self.startup.timed_import("difficulty")
+            self.difficulty_stats = difficulty.DifficultyStats()
+            sampler_factory = self.difficulty_stats.sampler_factory(target_difficulty, rng)
+        elif mode == "revisao":
+            # Repetição espaçada: perguntas erradas voltam antes, agenda salva por jogador
+            spaced = self.startup.timed_import("spaced")
+            sampler_factory = spaced.spaced_factory(player, rng=rng)
+        if not self.recording:
+            # Com diário, o motor repassa cada ação ao log de escrita antecipada
+            engine_class = self.startup.timed_import("replay").LoggedGame if journal else GameEngine
+            self.engine = engine_class(topics, sampler_factory=sampler_factory, max_lives=max_lives, rng=rng,
+                                       shuffle_options=shuffle)
+        if check_duplicates:
+            # Avisa (warnings) sobre perguntas quase duplicadas quando cada banco é carregado
+            self.startup.timed_import("dedup").validate_on_load(self.engine.topics)
+        self.journal = None
+        recovered = None
+        if journal:
+            # Partidas com e sem filtro têm sorteadores diferentes: uma não recupera a outra
+            self.journal = self.startup.timed_import("journal").player_journal(player, variant=(mode, search))
+            if self.journal.exists():
+                # A última partida não foi encerrada normalmente: volta ao estado gravado
+                recovered = self.journal.recover(self.engine)
+                if recovered is not None and self.seen_store is not None:
+                    for topic, sampler in self.engine.samplers.items():
+                        self.seen_store.sets[topic] = sampler.seen
+        self.startup.mark("motor do jogo")
+        # Placar persistente, aberto no primeiro game over (ver `leaderboard`)
+        self._leaderboard = None
+        # Log colunar das respostas para `python analytics.py`, aberto na primeira resposta
+        self._answer_log = None
+        self.question_shown_at = time.perf_counter()
+        self.layout_stats = layout_stats
+        # Resultado fica na tela por um instante antes de avançar; no modo rápido avança na hora
+        self.feedback_delay = 0 if rapid else self.FEEDBACK_DELAY_MS
+        self.game_over_delay = 0 if rapid else self.GAME_OVER_DELAY_MS
+        self._pending_advance = None
+        
+        # Instrumentação opcional: sem --profile nada é trocado e o custo é zero
+        self.profile = profile
+        self.profiler = None
+        if profile:
+            self.profiler = self.startup.timed_import("profiling").Profiler()
+            self.profiler.instrument(self.engine, "get_current_question", "next_question", prefix="engine")
+            # Antes de setup_ui, para que o botão "Responder" já chame a versão medida
+            self.profiler.instrument(self, "check_answer", "draw_hearts", prefix="ui")
+            self.profiler.until_idle(self.root, self, "check_answer", "ui.check_answer → tela ociosa")
+        
+        splash.destroy()
         self.setup_ui()
-        self.next_question()
-    
-    def draw_heart(self, canvas, color):
-        """Desenha um coração no canvas com a cor especificada"""
-        canvas.delete("all")
-        # Coordenadas para desenhar um coração maior (30x30)
-        # Parte superior (dois círculos)
-        canvas.create_oval(4, 6, 15, 17, fill=color, outline=color)
-        canvas.create_oval(15, 6, 26, 17, fill=color, outline=color)
-        # Parte inferior (triângulo)
-        canvas.create_polygon(4, 12, 26, 12, 15, 26, fill=color, outline=color, smooth=True)
+        if self.profiler is not None:
+            self.profiler.instrument(self.layout, "callback", prefix="layout")
+        self.startup.mark("interface")
+        if recovered is None:
+            self.next_question()
+        else:
+            self.show_current_state()
+            self.show_feedback(f"♻️ Partida recuperada ({recovered} ações reaplicadas)", "lightblue")
+        if self.journal is not None:
+            self.journal.start(self.engine)
+        self.startup.mark("primeira pergunta (inclui leitura do banco)")
+        self.root.update_idletasks()
+        self.startup.mark("primeira pergunta na tela")
+    
+    def search_mode(self, text, rng):
+        """Registro só com os tópicos que têm perguntas com `text` e a fábrica que sorteia entre elas"""
+        search = self.startup.timed_import("search")
+        topics = self.startup.timed_import("topics")
+        registry = topics.default_registry()
+        matches = search.index_all(registry, search.open_index(registry)).query(text)
+        if not matches:
+            raise SystemExit(f"Nenhuma pergunta encontrada para '{text}'")
+        sampler = self.startup.timed_import("sampler")
+        filtered = topics.TopicRegistry([topic for topic in registry if topic.id in matches], registry.banks)
+        
+        def factory(topic, size):
+            return sampler.SubsetSampler(matches[topic], rng)
+        return filtered, factory
+    
+    def load_theme(self):
+        """Importa o ttkbootstrap e aplica o tema "superhero" à janela já visível"""
+        global ttk
+        ttk = self.startup.timed_import("ttkbootstrap")
+        # O mesmo que ttk.Window(themename="superhero") faria, aplicado à janela existente
+        ttk.window.apply_class_bindings(self.root)
+        ttk.window.apply_all_bindings(self.root)
+        ttk.Style(theme="superhero")
+        self.startup.mark("tema ttkbootstrap")
+    
+    @property
+    def leaderboard(self):
+        """Placar em SQLite, criado no primeiro uso para não atrasar a abertura"""
+        if self._leaderboard is None:
+            self._leaderboard = self.startup.timed_import("leaderboard").Leaderboard()
+        return self._leaderboard
+    
+    @property
+    def answer_log(self):
+        """Registro das respostas (analytics.py), criado no primeiro uso"""
+        if self._answer_log is None:
+            self._answer_log = self.startup.timed_import("analytics").AnswerLog()
+        return self._answer_log
+    
+    FEEDBACK_DELAY_MS = 1200   # Tempo com o resultado na tela antes da próxima pergunta
+    GAME_OVER_DELAY_MS = 3000  # Tempo com o resumo da partida antes de reiniciar
+    
+    HEART_SPACING = 38  # Largura de cada coração (30) mais o espaçamento
+    
+    def setup_hearts(self, parent):
+        """Cria os corações (vidas) uma única vez em um só canvas"""
+        max_lives = self.engine.max_lives
+        self.hearts_canvas = tk.Canvas(parent, width=self.HEART_SPACING * max_lives, height=30,
+                                       highlightthickness=0, bg='#2c3e50')
+        self.hearts_canvas.pack(side=LEFT)
+        for i in range(max_lives):
+            x = i * self.HEART_SPACING + 4
+            tag = f"heart{i}"
+            # Coordenadas para desenhar um coração maior (30x30)
+            # Parte superior (dois círculos)
+            self.hearts_canvas.create_oval(x + 4, 6, x + 15, 17, fill="red", outline="red", tags=tag)
+            self.hearts_canvas.create_oval(x + 15, 6, x + 26, 17, fill="red", outline="red", tags=tag)
+            # Parte inferior (triângulo)
+            self.hearts_canvas.create_polygon(x + 4, 12, x + 26, 12, x + 15, 26, fill="red", outline="red",
+                                              smooth=True, tags=tag)
+        self.hearts_shown = max_lives
     
     def draw_hearts(self):
-        """Desenha todos os corações baseado nas vidas atuais"""
-        for i in range(3):
-            if i < self.lives:
-                self.draw_heart(self.heart_canvases[i], "red")  # Coração vermelho
-            else:
-                self.draw_heart(self.heart_canvases[i], "black")  # Coração preto
+        """Recolore só os corações que mudaram desde a última atualização"""
+        lives = max(0, self.engine.lives)
+        if lives == self.hearts_shown:
+            return
+        # Vermelho = vida, preto = vida perdida
+        color = "red" if lives > self.hearts_shown else "black"
+        for i in range(min(lives, self.hearts_shown), max(lives, self.hearts_shown)):
+            self.hearts_canvas.itemconfig(f"heart{i}", fill=color, outline=color)
+        self.hearts_shown = lives
     
     def setup_ui(self):
         # Container principal para centralização
@@ -671,7 +224,7 @@ class TriviaGame:
         self.scrollable_frame.pack(expand=True)
         
         # Configurar scroll
-        def configure_scroll_region(event=None):
+        def configure_scroll_region():
             main_canvas.configure(scrollregion=main_canvas.bbox("all"))
             # Centralizar horizontalmente
             canvas_width = main_canvas.winfo_width()
@@ -679,8 +232,10 @@ class TriviaGame:
             x_position = max(0, (canvas_width - frame_width) // 2)
             main_canvas.coords("center_window", x_position, 0)
         
-        center_frame.bind("<Configure>", configure_scroll_region)
-        main_canvas.bind("<Configure>", configure_scroll_region)
+        # Rajadas de <Configure> viram uma única passada de layout quando o Tk fica ocioso
+        self.layout = LayoutScheduler(main_canvas, configure_scroll_region, verbose=self.layout_stats)
+        center_frame.bind("<Configure>", self.layout.request)
+        main_canvas.bind("<Configure>", self.layout.request)
         
         main_canvas.create_window((0, 0), window=center_frame, anchor="nw", tags="center_window")
         main_canvas.configure(yscrollcommand=scrollbar.set)
@@ -724,11 +279,7 @@ class TriviaGame:
         lives_label.pack(side=LEFT)
         
         # Criar corações coloridos usando Canvas (maiores)
-        self.heart_canvases = []
-        for i in range(3):
-            canvas = tk.Canvas(lives_frame, width=30, height=30, highlightthickness=0, bg='#2c3e50')
-            canvas.pack(side=LEFT, padx=4)
-            self.heart_canvases.append(canvas)
+        self.setup_hearts(lives_frame)
         
         # Score - centro
         self.score_label = tk.Label(info_frame, text="Pontuação: 0",
@@ -748,6 +299,12 @@ class TriviaGame:
                                    bg='#2c3e50', fg='lightblue')  # Cor fixa para compatibilidade
         self.topic_label.pack(pady=(0, 25))
         
+        # Resultado da última resposta, no lugar das caixas de diálogo
+        self.feedback_label = tk.Label(self.scrollable_frame, text="", wraplength=800,
+                                      font=("Arial", 14, "bold"),
+                                      bg='#2c3e50', fg='white')  # Cor fixa para compatibilidade
+        self.feedback_label.pack(pady=(0, 15))
+        
         # Frame da pergunta
         self.question_frame = ttk.LabelFrame(self.scrollable_frame, text="Pergunta", padding="25")
         self.question_frame.pack(fill=X, pady=(0, 25))
@@ -770,38 +327,38 @@ class TriviaGame:
             btn.pack(anchor=W, pady=8)
             self.option_buttons.append(btn)
         
-        # Frame de escolha de tópico
-        self.topic_choice_frame = ttk.LabelFrame(self.scrollable_frame, text="✅ Você acertou! Escolha o próximo tópico:", padding="25")
-        
-        self.topic_var = tk.StringVar(value="kpop")
-        
-        kpop_radio = ttk.Radiobutton(self.topic_choice_frame, text="🎵 K-pop", 
-                                   variable=self.topic_var, value="kpop")
-        kpop_radio.pack(anchor=W, pady=8)
-        
-        programacao_radio = ttk.Radiobutton(self.topic_choice_frame, text="💻 Programação", 
-                                     variable=self.topic_var, value="programacao")
-        programacao_radio.pack(anchor=W, pady=8)
-        
-        self.continue_btn = ttk.Button(self.topic_choice_frame, text="Próxima Pergunta", 
-                                     command=self.continue_game, bootstyle=SUCCESS)
-        self.continue_btn.pack(pady=15)
+        # O painel de escolha de tópico só é montado no primeiro acerto
+        self.topic_choice_frame = None
         
         # Frame dos botões - sempre visível na parte inferior
         button_frame = ttk.Frame(self.scrollable_frame)
         button_frame.pack(fill=X, pady=35, side=BOTTOM)  # Extra padding para evitar corte
         
         self.submit_btn = ttk.Button(button_frame, text="Responder", 
-                                   command=self.check_answer, bootstyle=PRIMARY)
+                                   command=self.check_answer, bootstyle="primary")
         self.submit_btn.pack(side=LEFT, padx=(0, 15))
         
         # Botão de reiniciar
         restart_btn = ttk.Button(button_frame, text="Reiniciar Jogo", 
-                               command=self.restart_game, bootstyle=WARNING)
+                               command=self.restart_game, bootstyle="warning")
         restart_btn.pack(side=RIGHT)
+    
+    def setup_topic_choice(self):
+        """Monta o painel de escolha de tópico"""
+        # Frame de escolha de tópico
+        self.topic_choice_frame = ttk.LabelFrame(self.scrollable_frame, text="✅ Você acertou! Escolha o próximo tópico:", padding="25")
         
-        # Desenhar corações iniciais após criar a interface
-        self.draw_hearts()
+        self.topic_var = tk.StringVar(value=self.engine.topics.default)
+        
+        # Uma opção para cada tópico registrado
+        for topic in self.engine.topics:
+            topic_radio = ttk.Radiobutton(self.topic_choice_frame, text=topic.nome, 
+                                        variable=self.topic_var, value=topic.id)
+            topic_radio.pack(anchor=W, pady=8)
+        
+        self.continue_btn = ttk.Button(self.topic_choice_frame, text="Próxima Pergunta", 
+                                     command=self.continue_game, bootstyle="success")
+        self.continue_btn.pack(pady=15)
     
     def toggle_fullscreen(self, event=None):
         """Alterna entre fullscreen e janela normal"""
@@ -813,45 +370,74 @@ class TriviaGame:
         self.is_fullscreen = False
         self.root.attributes('-fullscreen', False)
     
-    def get_current_question(self):
-        if self.current_topic == "kpop":
-            if self.kpop_index >= len(self.kpop_shuffled):
-                random.shuffle(self.kpop_shuffled)
-                self.kpop_index = 0
-            question = self.kpop_shuffled[self.kpop_index]
-            self.kpop_index += 1
-        else:
-            if self.programacao_index >= len(self.programacao_shuffled):
-                random.shuffle(self.programacao_shuffled)
-                self.programacao_index = 0
-            question = self.programacao_shuffled[self.programacao_index]
-            self.programacao_index += 1
-        
-        return question
+    def on_close(self):
+        """Grava as partidas pendentes e as estatísticas e fecha a janela"""
+        if self._leaderboard is not None:
+            self._leaderboard.close()
+        if self._answer_log is not None:
+            self._answer_log.close()
+        self.save_stats()
+        self.layout.close()
+        if self.recording:
+            self.engine.close()
+        if self.journal is not None:
+            # Partida encerrada normalmente: nada a recuperar na próxima abertura
+            self.journal.close(discard=True)
+        if self.profiler is not None:
+            self.profiler.write_trace(self.profile)
+            print(self.profiler.summary(), file=sys.stderr)
+            print(f"trace gravado em {self.profile}", file=sys.stderr)
+        self.root.destroy()
+    
+    def save_stats(self):
+        """Salva as perguntas vistas (modo normal) ou as estatísticas de dificuldade (modo adaptativo)"""
+        if self.seen_store is not None:
+            self.seen_store.save()
+        if self.difficulty_stats is not None:
+            self.difficulty_stats.save()
     
     def next_question(self):
-        self.question_count += 1
-        self.current_question = self.get_current_question()
-        self.game_state = "question"
+        """Avança o jogo para a próxima pergunta e atualiza a tela"""
+        self.engine.next_question()
+        self.show_question()
+    
+    def show_question(self):
+        """Exibe a pergunta atual do jogo"""
+        engine = self.engine
+        question = engine.current_question
+        self.layout.begin_transition(f"pergunta {engine.question_count}")
         
         # Mostrar elementos da pergunta e esconder escolha de tópico
         self.show_question_elements()
         
         # Atualizar conteúdo
-        topic_text = "🎵 K-POP" if self.current_topic == "kpop" else "💻 PROGRAMAÇÃO"
+        topic_text = engine.topics[engine.current_topic].titulo
         self.topic_label.config(text=f"Tópico: {topic_text}")
         
-        self.question_label.config(text=self.current_question["pergunta"])
+        self.question_label.config(text=question.pergunta)
         
-        for i, option in enumerate(self.current_question["opcoes"]):
+        # Opções na ordem sorteada para esta apresentação (a pergunta em si não muda)
+        for i, option in enumerate(engine.displayed_options()):
             self.option_buttons[i].config(text=f"{chr(65+i)}) {option}")
         
         self.option_var.set("")
         
         # Atualizar contadores e vidas
         self.update_lives_display()
-        self.score_label.config(text=f"Pontuação: {self.score}")
-        self.question_count_label.config(text=f"Pergunta: {self.question_count}")
+        self.score_label.config(text=f"Pontuação: {engine.score}")
+        self.question_count_label.config(text=f"Pergunta: {engine.question_count}")
+        self.question_shown_at = time.perf_counter()
+    
+    def show_current_state(self):
+        """Mostra a tela correspondente ao estado do motor (usado ao recuperar uma partida)"""
+        state = self.engine.game_state
+        if state == "game_over":
+            # A partida já tinha terminado (e entrado no placar) antes da queda
+            self.restart_game_silent()
+            return
+        self.show_question()
+        if state == "topic_choice":
+            self.show_topic_choice_elements()
     
     def update_lives_display(self):
         """Atualiza a exibição dos corações baseado nas vidas restantes"""
@@ -861,1067 +447,176 @@ class TriviaGame:
         self.question_frame.pack(fill=X, pady=(0, 20))
         self.options_frame.pack(fill=X, pady=(0, 20))
         self.submit_btn.pack(side=LEFT, padx=(0, 10))
-        self.topic_choice_frame.pack_forget()
-    
-    def game_over(self):
-        """Exibe tela de game over e reinicia o jogo"""
-        messagebox.showinfo("Game Over! 💀", 
-                          f"Suas vidas acabaram!\n\n🏆 Pontuação Final: {self.score}\n📊 Perguntas Respondidas: {self.question_count}\n\nO jogo será reiniciado!")
-        self.restart_game_silent()
-    
-    def restart_game_silent(self):
-        """Reinicia o jogo sem confirmação (usado após game over)"""
-        self.score = 0
-        self.question_count = 0
-        self.lives = 3
-        self.current_topic = "kpop"
-        self.kpop_index = 0
-        self.programacao_index = 0
-        self.game_state = "question"
-        
-        # Reembaralhar as perguntas
-        random.shuffle(self.kpop_shuffled)
-        random.shuffle(self.programacao_shuffled)
-        
-        self.update_lives_display()
-        self.next_question()
+        if self.topic_choice_frame is not None:
+            self.topic_choice_frame.pack_forget()
+    
+    def game_over(self, reason=""):
+        """Mostra o resumo da partida, registra no placar e reinicia o jogo"""
+        rank = self.leaderboard.rank(self.engine.score)
+        self.leaderboard.record_game(self.engine)
+        self.answer_log.flush()
+        self.save_stats()
+        self.show_feedback(f"{reason}\n💀 Game Over! Suas vidas acabaram!\n"
+                           f"🏆 Pontuação Final: {self.engine.score} | 📊 Perguntas Respondidas: {self.engine.question_count} | "
+                           f"🥇 Posição no Placar: {rank}º\nO jogo será reiniciado!", "tomato")
+        self.schedule_advance(self.restart_game_silent, self.game_over_delay)
+    
+    def show_feedback(self, text, color="white"):
+        """Mostra o resultado na faixa de feedback, sem abrir janelas modais"""
+        self.feedback_label.config(text=text, fg=color)
+    
+    def schedule_advance(self, callback, delay):
+        """Chama `callback` depois de `delay` ms pelo loop de eventos; com 0 chama na hora.
+
+        Com espera, a faixa de feedback é limpa ao avançar (o resultado já ficou
+        na tela); no modo rápido ela continua visível junto da próxima pergunta.
+        """
+        self.submit_btn.configure(state="disabled")
+        if delay <= 0:
+            self._finish_advance(callback)
+        else:
+            self._pending_advance = self.root.after(delay, self._finish_advance, callback, True)
+    
+    def _finish_advance(self, callback, clear_feedback=False):
+        self._pending_advance = None
+        self.submit_btn.configure(state="normal")
+        if clear_feedback:
+            self.show_feedback("")
+        callback()
+    
+    def cancel_advance(self):
+        """Descarta um avanço agendado (ex.: o jogador reiniciou antes)"""
+        if self._pending_advance is not None:
+            self.root.after_cancel(self._pending_advance)
+            self._pending_advance = None
+            self.submit_btn.configure(state="normal")
     
     def show_topic_choice_elements(self):
         """Esconde elementos da pergunta e mostra escolha de tópico"""
+        if self.topic_choice_frame is None:
+            self.setup_topic_choice()
+        self.layout.begin_transition("escolha de tópico")
         self.question_frame.pack_forget()
         self.options_frame.pack_forget()
         self.submit_btn.pack_forget()
         self.topic_choice_frame.pack(fill=X, pady=20)
-        self.topic_var.set(self.current_topic)
+        self.topic_var.set(self.engine.current_topic)
     
     def check_answer(self):
+        if self._pending_advance is not None:
+            return
+        
         selected = self.option_var.get()
         
         if not selected:
-            messagebox.showwarning("Aviso", "Por favor, selecione uma opção!")
+            self.show_feedback("⚠️ Por favor, selecione uma opção!", "gold")
             return
         
-        selected_index = int(selected)
-        correct_index = self.current_question["resposta_correta"]
+        engine = self.engine
+        selected = int(selected)
+        # Capturado antes de responder: num erro o motor já avança para a próxima pergunta
+        topic, index, option = engine.current_topic, engine.current_index, engine.option_index(selected)
+        result = engine.answer(selected)
+        self.answer_log.record(topic, index, option, result.correct, time.perf_counter() - self.question_shown_at)
+        correct_option = result.question.opcoes[result.question.resposta_correta]
         
-        if selected_index == correct_index:
-            self.score += 10
-            self.game_state = "topic_choice"
-            messagebox.showinfo("Correto! ✅", 
-                              f"Parabéns! Você acertou!\n\nResposta: {self.current_question['opcoes'][correct_index]}")
+        if result.correct:
+            self.show_feedback(f"✅ Parabéns! Você acertou! Resposta: {correct_option}", "lightgreen")
             
             # Mostrar escolha de tópico
             self.show_topic_choice_elements()
             
         else:
-            # Perder uma vida
-            self.lives -= 1
             self.update_lives_display()
             
             # Verificar se acabaram as vidas
-            if self.lives <= 0:
-                messagebox.showerror("Incorreto! ❌", 
-                                   f"Resposta errada!\n\nResposta correta: {self.current_question['opcoes'][correct_index]}")
-                self.game_over()
+            if result.game_over:
+                self.game_over(f"❌ Resposta errada! Resposta correta: {correct_option}")
                 return
             
-            messagebox.showerror("Incorreto! ❌", 
-                               f"Resposta errada!\n\nResposta correta: {self.current_question['opcoes'][correct_index]}\n\n💔 Vidas restantes: {self.lives}")
+            self.show_feedback(f"❌ Resposta errada! Resposta correta: {correct_option}\n"
+                               f"💔 Vidas restantes: {result.lives}", "tomato")
             
-            # Trocar automaticamente de tópico
-            self.current_topic = "programacao" if self.current_topic == "kpop" else "kpop"
-            self.next_question()
+            # O motor já trocou de tópico e sorteou a próxima pergunta
+            self.schedule_advance(self.show_question, self.feedback_delay)
     
     def continue_game(self):
-        self.current_topic = self.topic_var.get()
-        self.next_question()
+        self.engine.choose_topic(self.topic_var.get())
+        self.show_feedback("")
+        self.show_question()
     
     def restart_game(self):
         result = messagebox.askyesno("Reiniciar", "Tem certeza que deseja reiniciar o jogo?")
         if result:
-            self.score = 0
-            self.question_count = 0
-            self.lives = 3
-            self.current_topic = "kpop"
-            self.kpop_index = 0
-            self.programacao_index = 0
-            self.game_state = "question"
-            
-            # Reembaralhar as perguntas
-            random.shuffle(self.kpop_shuffled)
-            random.shuffle(self.programacao_shuffled)
-            
-            self.update_lives_display()
-            self.next_question()
-    
-    def restart_game_silent(self):
-        """Reinicia o jogo sem confirmação (usado após game over)"""
-        self.score = 0
-        self.question_count = 0
-        self.lives = 3
-        self.current_topic = "kpop"
-        self.kpop_index = 0
-        self.programacao_index = 0
-        self.game_state = "question"
-        
-        # Reembaralhar as perguntas
-        random.shuffle(self.kpop_shuffled)
-        random.shuffle(self.programacao_shuffled)
-        
-        self.update_lives_display()
-        self.next_question()
-
-    def setup_ui(self):
-        # Container principal para centralização
-        main_container = ttk.Frame(self.root)
-        main_container.pack(fill=BOTH, expand=True)
-        
-        # Frame principal com scrollbar caso necessário
-        main_canvas = tk.Canvas(main_container, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(main_container, orient="vertical", command=main_canvas.yview)
-        
-        # Frame para centralização horizontal
-        center_frame = ttk.Frame(main_canvas)
-        
-        # Frame do conteúdo com largura limitada para centralização
-        self.scrollable_frame = ttk.Frame(center_frame, padding="40")
-        self.scrollable_frame.pack(expand=True)
-        
-        # Configurar scroll
-        def configure_scroll_region(event=None):
-            main_canvas.configure(scrollregion=main_canvas.bbox("all"))
-            # Centralizar horizontalmente
-            canvas_width = main_canvas.winfo_width()
-            frame_width = center_frame.winfo_reqwidth()
-            x_position = max(0, (canvas_width - frame_width) // 2)
-            main_canvas.coords("center_window", x_position, 0)
-        
-        center_frame.bind("<Configure>", configure_scroll_region)
-        main_canvas.bind("<Configure>", configure_scroll_region)
-        
-        main_canvas.create_window((0, 0), window=center_frame, anchor="nw", tags="center_window")
-        main_canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Pack canvas e scrollbar
-        main_canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Bind scroll do mouse
-        def _on_mousewheel(event):
-            main_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        main_canvas.bind_all("<MouseWheel>", _on_mousewheel)
-        
-        # Título
-        title_frame = ttk.Frame(self.scrollable_frame)
-        title_frame.pack(fill=X, pady=(0, 25))
-        
-        # Usar tk.Label para poder controlar a fonte do título
-        title_label = tk.Label(title_frame, text="🎵 TRIVIA GAME 🧪", 
-                              font=("Arial", 28, "bold"), 
-                              bg='#2c3e50', fg='white')  # Cor fixa para compatibilidade
-        title_label.pack()
-        
-        # Instruções de fullscreen
-        instructions_label = tk.Label(title_frame, text="F11: Tela Cheia | ESC: Sair da Tela Cheia | Mouse: Scroll",
-                                     font=("Arial", 12),
-                                     bg='#2c3e50', fg='lightgray')  # Cor fixa para compatibilidade
-        instructions_label.pack(pady=(8, 0))
-        
-        # Score, contador e vidas
-        info_frame = ttk.Frame(self.scrollable_frame)
-        info_frame.pack(fill=X, pady=(0, 25))
-        
-        # Vidas (corações) - lado esquerdo
-        lives_frame = ttk.Frame(info_frame)
-        lives_frame.pack(side=LEFT)
-        
-        lives_label = tk.Label(lives_frame, text="Vidas: ", 
-                              font=("Arial", 14, "bold"),
-                              bg='#2c3e50', fg='white')  # Cor fixa para compatibilidade
-        lives_label.pack(side=LEFT)
-        
-        # Criar corações coloridos usando Canvas (maiores)
-        self.heart_canvases = []
-        for i in range(3):
-            canvas = tk.Canvas(lives_frame, width=30, height=30, highlightthickness=0, bg='#2c3e50')
-            canvas.pack(side=LEFT, padx=4)
-            self.heart_canvases.append(canvas)
-        
-        # Score - centro
-        self.score_label = tk.Label(info_frame, text="Pontuação: 0",
-                                   font=("Arial", 14, "bold"),
-                                   bg='#2c3e50', fg='white')  # Cor fixa para compatibilidade
-        self.score_label.pack(side=LEFT, padx=(30, 0))
-        
-        # Contador de perguntas - direita
-        self.question_count_label = tk.Label(info_frame, text="Pergunta: 0",
-                                           font=("Arial", 14, "bold"),
-                                           bg='#2c3e50', fg='white')  # Cor fixa para compatibilidade
-        self.question_count_label.pack(side=RIGHT)
-        
-        # Tópico atual
-        self.topic_label = tk.Label(self.scrollable_frame, text="",
-                                   font=("Arial", 18, "bold"),
-                                   bg='#2c3e50', fg='lightblue')  # Cor fixa para compatibilidade
-        self.topic_label.pack(pady=(0, 25))
-        
-        # Frame da pergunta
-        self.question_frame = ttk.LabelFrame(self.scrollable_frame, text="Pergunta", padding="25")
-        self.question_frame.pack(fill=X, pady=(0, 25))
-        
-        self.question_label = tk.Label(self.question_frame, text="", wraplength=900,
-                                      font=("Arial", 16),
-                                      bg='#2c3e50', fg='white')  # Cor fixa para compatibilidade
-        self.question_label.pack()
-        
-        # Frame das opções
-        self.options_frame = ttk.LabelFrame(self.scrollable_frame, text="Opções", padding="25")
-        self.options_frame.pack(fill=X, pady=(0, 25))
-        
-        self.option_var = tk.StringVar()
-        self.option_buttons = []
-        
-        for i in range(4):
-            btn = ttk.Radiobutton(self.options_frame, text="", variable=self.option_var, 
-                                value=str(i))
-            btn.pack(anchor=W, pady=8)
-            self.option_buttons.append(btn)
-        
-        # Frame de escolha de tópico
-        self.topic_choice_frame = ttk.LabelFrame(self.scrollable_frame, text="✅ Você acertou! Escolha o próximo tópico:", padding="25")
-        
-        self.topic_var = tk.StringVar(value="kpop")
-        
-        kpop_radio = ttk.Radiobutton(self.topic_choice_frame, text="🎵 K-pop", 
-                                   variable=self.topic_var, value="kpop")
-        kpop_radio.pack(anchor=W, pady=8)
-        
-        programacao_radio = ttk.Radiobutton(self.topic_choice_frame, text="💻 Programação", 
-                                     variable=self.topic_var, value="programacao")
-        programacao_radio.pack(anchor=W, pady=8)
-        
-        self.continue_btn = ttk.Button(self.topic_choice_frame, text="Próxima Pergunta", 
-                                     command=self.continue_game, bootstyle=SUCCESS)
-        self.continue_btn.pack(pady=15)
-        
-        # Frame dos botões - sempre visível na parte inferior
-        button_frame = ttk.Frame(self.scrollable_frame)
-        button_frame.pack(fill=X, pady=35, side=BOTTOM)  # Extra padding para evitar corte
-        
-        self.submit_btn = ttk.Button(button_frame, text="Responder", 
-                                   command=self.check_answer, bootstyle=PRIMARY)
-        self.submit_btn.pack(side=LEFT, padx=(0, 15))
-        
-        # Botão de reiniciar
-        restart_btn = ttk.Button(button_frame, text="Reiniciar Jogo", 
-                               command=self.restart_game, bootstyle=WARNING)
-        restart_btn.pack(side=RIGHT)
-        
-        # Desenhar corações iniciais após criar a interface
-        self.draw_hearts()
-    
-    def toggle_fullscreen(self, event=None):
-        """Alterna entre fullscreen e janela normal"""
-        self.is_fullscreen = not self.is_fullscreen
-        self.root.attributes('-fullscreen', self.is_fullscreen)
-    
-    def exit_fullscreen(self, event=None):
-        """Sai do modo fullscreen"""
-        self.is_fullscreen = False
-        self.root.attributes('-fullscreen', False)
-    
-    def get_current_question(self):
-        if self.current_topic == "kpop":
-            if self.kpop_index >= len(self.kpop_shuffled):
-                random.shuffle(self.kpop_shuffled)
-                self.kpop_index = 0
-            question = self.kpop_shuffled[self.kpop_index]
-            self.kpop_index += 1
-        else:
-            if self.programacao_index >= len(self.programacao_shuffled):
-                random.shuffle(self.programacao_shuffled)
-                self.programacao_index = 0
-            question = self.programacao_shuffled[self.programacao_index]
-            self.programacao_index += 1
-        
-        return question
-    
-    def next_question(self):
-        self.question_count += 1
-        self.current_question = self.get_current_question()
-        self.game_state = "question"
-        
-        # Mostrar elementos da pergunta e esconder escolha de tópico
-        self.show_question_elements()
-        
-        # Atualizar conteúdo
-        topic_text = "🎵 K-POP" if self.current_topic == "kpop" else "💻 PROGRAMAÇÃO"
-        self.topic_label.config(text=f"Tópico: {topic_text}")
-        
-        self.question_label.config(text=self.current_question["pergunta"])
-        
-        for i, option in enumerate(self.current_question["opcoes"]):
-            self.option_buttons[i].config(text=f"{chr(65+i)}) {option}")
-        
-        self.option_var.set("")
-        
-        # Atualizar contadores e vidas
-        self.update_lives_display()
-        self.score_label.config(text=f"Pontuação: {self.score}")
-        self.question_count_label.config(text=f"Pergunta: {self.question_count}")
-    
-    def update_lives_display(self):
-        """Atualiza a exibição dos corações baseado nas vidas restantes"""
-        self.draw_hearts()
-    def show_question_elements(self):
-        """Mostra elementos da pergunta e esconde escolha de tópico"""
-        self.question_frame.pack(fill=X, pady=(0, 20))
-        self.options_frame.pack(fill=X, pady=(0, 20))
-        self.submit_btn.pack(side=LEFT, padx=(0, 10))
-        self.topic_choice_frame.pack_forget()
-    
-    def game_over(self):
-        """Exibe tela de game over e reinicia o jogo"""
-        messagebox.showinfo("Game Over! 💀", 
-                          f"Suas vidas acabaram!\n\n🏆 Pontuação Final: {self.score}\n📊 Perguntas Respondidas: {self.question_count}\n\nO jogo será reiniciado!")
-        self.restart_game_silent()
+            self.cancel_advance()
+            self.show_feedback("")
+            self.restart_game_silent()
     
     def restart_game_silent(self):
         """Reinicia o jogo sem confirmação (usado após game over)"""
-        self.score = 0
-        self.question_count = 0
-        self.lives = 3
-        self.current_topic = "kpop"
-        self.kpop_index = 0
-        self.programacao_index = 0
-        self.game_state = "question"
-        
-        # Reembaralhar as perguntas
-        random.shuffle(self.kpop_shuffled)
-        random.shuffle(self.programacao_shuffled)
-        
-        self.update_lives_display()
-        self.next_question()
-    
-    def show_topic_choice_elements(self):
-        """Esconde elementos da pergunta e mostra escolha de tópico"""
-        self.question_frame.pack_forget()
-        self.options_frame.pack_forget()
-        self.submit_btn.pack_forget()
-        self.topic_choice_frame.pack(fill=X, pady=20)
-        self.topic_var.set(self.current_topic)
-    
-    def check_answer(self):
-        selected = self.option_var.get()
-        
-        if not selected:
-            messagebox.showwarning("Aviso", "Por favor, selecione uma opção!")
-            return
-        
-        selected_index = int(selected)
-        correct_index = self.current_question["resposta_correta"]
-        
-        if selected_index == correct_index:
-            self.score += 10
-            self.game_state = "topic_choice"
-            messagebox.showinfo("Correto! ✅", 
-                              f"Parabéns! Você acertou!\n\nResposta: {self.current_question['opcoes'][correct_index]}")
-            
-            # Mostrar escolha de tópico
-            self.show_topic_choice_elements()
-            
-        else:
-            # Perder uma vida
-            self.lives -= 1
-            self.update_lives_display()
-            
-            # Verificar se acabaram as vidas
-            if self.lives <= 0:
-                messagebox.showerror("Incorreto! ❌", 
-                                   f"Resposta errada!\n\nResposta correta: {self.current_question['opcoes'][correct_index]}")
-                self.game_over()
-                return
-            
-            messagebox.showerror("Incorreto! ❌", 
-                               f"Resposta errada!\n\nResposta correta: {self.current_question['opcoes'][correct_index]}\n\n💔 Vidas restantes: {self.lives}")
-            
-            # Trocar automaticamente de tópico
-            self.current_topic = "programacao" if self.current_topic == "kpop" else "kpop"
-            self.next_question()
-    
-    def continue_game(self):
-        self.current_topic = self.topic_var.get()
-        self.next_question()
-    
-    def restart_game(self):
-        result = messagebox.askyesno("Reiniciar", "Tem certeza que deseja reiniciar o jogo?")
-        if result:
-            self.score = 0
-            self.question_count = 0
-            self.lives = 3
-            self.current_topic = "kpop"
-            self.kpop_index = 0
-            self.programacao_index = 0
-            self.game_state = "question"
-            
-            # Reembaralhar as perguntas
-            random.shuffle(self.kpop_shuffled)
-            random.shuffle(self.programacao_shuffled)
-            
-            self.update_lives_display()
-            self.next_question()
-    
-    def restart_game_silent(self):
-        """Reinicia o jogo sem confirmação (usado após game over)"""
-        self.score = 0
-        self.question_count = 0
-        self.lives = 3
-        self.current_topic = "kpop"
-        self.kpop_index = 0
-        self.programacao_index = 0
-        self.game_state = "question"
-        
-        # Reembaralhar as perguntas
-        random.shuffle(self.kpop_shuffled)
-        random.shuffle(self.programacao_shuffled)
-        
-        self.update_lives_display()
-        self.next_question()
-
-    def setup_ui(self):
-        # Container principal para centralização
-        main_container = ttk.Frame(self.root)
-        main_container.pack(fill=BOTH, expand=True)
-        
-        # Frame principal com scrollbar caso necessário
-        main_canvas = tk.Canvas(main_container, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(main_container, orient="vertical", command=main_canvas.yview)
-        
-        # Frame para centralização horizontal
-        center_frame = ttk.Frame(main_canvas)
-        
-        # Frame do conteúdo com largura limitada para centralização
-        self.scrollable_frame = ttk.Frame(center_frame, padding="40")
-        self.scrollable_frame.pack(expand=True)
-        
-        # Configurar scroll
-        def configure_scroll_region(event=None):
-            main_canvas.configure(scrollregion=main_canvas.bbox("all"))
-            # Centralizar horizontalmente
-            canvas_width = main_canvas.winfo_width()
-            frame_width = center_frame.winfo_reqwidth()
-            x_position = max(0, (canvas_width - frame_width) // 2)
-            main_canvas.coords("center_window", x_position, 0)
-        
-        center_frame.bind("<Configure>", configure_scroll_region)
-        main_canvas.bind("<Configure>", configure_scroll_region)
-        
-        main_canvas.create_window((0, 0), window=center_frame, anchor="nw", tags="center_window")
-        main_canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Pack canvas e scrollbar
-        main_canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Bind scroll do mouse
-        def _on_mousewheel(event):
-            main_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        main_canvas.bind_all("<MouseWheel>", _on_mousewheel)
-        
-        # Título
-        title_frame = ttk.Frame(self.scrollable_frame)
-        title_frame.pack(fill=X, pady=(0, 25))
-        
-        # Usar tk.Label para poder controlar a fonte do título
-        title_label = tk.Label(title_frame, text="🎵 TRIVIA GAME 🧪", 
-                              font=("Arial", 28, "bold"), 
-                              bg='#2c3e50', fg='white')  # Cor fixa para compatibilidade
-        title_label.pack()
-        
-        # Instruções de fullscreen
-        instructions_label = tk.Label(title_frame, text="F11: Tela Cheia | ESC: Sair da Tela Cheia | Mouse: Scroll",
-                                     font=("Arial", 12),
-                                     bg='#2c3e50', fg='lightgray')  # Cor fixa para compatibilidade
-        instructions_label.pack(pady=(8, 0))
-        
-        # Score, contador e vidas
-        info_frame = ttk.Frame(self.scrollable_frame)
-        info_frame.pack(fill=X, pady=(0, 25))
-        
-        # Vidas (corações) - lado esquerdo
-        lives_frame = ttk.Frame(info_frame)
-        lives_frame.pack(side=LEFT)
-        
-        lives_label = tk.Label(lives_frame, text="Vidas: ", 
-                              font=("Arial", 14, "bold"),
-                              bg='#2c3e50', fg='white')  # Cor fixa para compatibilidade
-        lives_label.pack(side=LEFT)
-        
-        # Criar corações coloridos usando Canvas (maiores)
-        self.heart_canvases = []
-        for i in range(3):
-            canvas = tk.Canvas(lives_frame, width=30, height=30, highlightthickness=0, bg='#2c3e50')
-            canvas.pack(side=LEFT, padx=4)
-            self.heart_canvases.append(canvas)
-        
-        # Score - centro
-        self.score_label = tk.Label(info_frame, text="Pontuação: 0",
-                                   font=("Arial", 14, "bold"),
-                                   bg='#2c3e50', fg='white')  # Cor fixa para compatibilidade
-        self.score_label.pack(side=LEFT, padx=(30, 0))
-        
-        # Contador de perguntas - direita
-        self.question_count_label = tk.Label(info_frame, text="Pergunta: 0",
-                                           font=("Arial", 14, "bold"),
-                                           bg='#2c3e50', fg='white')  # Cor fixa para compatibilidade
-        self.question_count_label.pack(side=RIGHT)
-        
-        # Tópico atual
-        self.topic_label = tk.Label(self.scrollable_frame, text="",
-                                   font=("Arial", 18, "bold"),
-                                   bg='#2c3e50', fg='lightblue')  # Cor fixa para compatibilidade
-        self.topic_label.pack(pady=(0, 25))
-        
-        # Frame da pergunta
-        self.question_frame = ttk.LabelFrame(self.scrollable_frame, text="Pergunta", padding="25")
-        self.question_frame.pack(fill=X, pady=(0, 25))
-        
-        self.question_label = tk.Label(self.question_frame, text="", wraplength=900,
-                                      font=("Arial", 16),
-                                      bg='#2c3e50', fg='white')  # Cor fixa para compatibilidade
-        self.question_label.pack()
-        
-        # Frame das opções
-        self.options_frame = ttk.LabelFrame(self.scrollable_frame, text="Opções", padding="25")
-        self.options_frame.pack(fill=X, pady=(0, 25))
-        
-        self.option_var = tk.StringVar()
-        self.option_buttons = []
-        
-        for i in range(4):
-            btn = ttk.Radiobutton(self.options_frame, text="", variable=self.option_var, 
-                                value=str(i))
-            btn.pack(anchor=W, pady=8)
-            self.option_buttons.append(btn)
-        
-        # Frame de escolha de tópico
-        self.topic_choice_frame = ttk.LabelFrame(self.scrollable_frame, text="✅ Você acertou! Escolha o próximo tópico:", padding="25")
-        
-        self.topic_var = tk.StringVar(value="kpop")
-        
-        kpop_radio = ttk.Radiobutton(self.topic_choice_frame, text="🎵 K-pop", 
-                                   variable=self.topic_var, value="kpop")
-        kpop_radio.pack(anchor=W, pady=8)
-        
-        programacao_radio = ttk.Radiobutton(self.topic_choice_frame, text="💻 Programação", 
-                                     variable=self.topic_var, value="programacao")
-        programacao_radio.pack(anchor=W, pady=8)
-        
-        self.continue_btn = ttk.Button(self.topic_choice_frame, text="Próxima Pergunta", 
-                                     command=self.continue_game, bootstyle=SUCCESS)
-        self.continue_btn.pack(pady=15)
-        
-        # Frame dos botões - sempre visível na parte inferior
-        button_frame = ttk.Frame(self.scrollable_frame)
-        button_frame.pack(fill=X, pady=35, side=BOTTOM)  # Extra padding para evitar corte
-        
-        self.submit_btn = ttk.Button(button_frame, text="Responder", 
-                                   command=self.check_answer, bootstyle=PRIMARY)
-        self.submit_btn.pack(side=LEFT, padx=(0, 15))
-        
-        # Botão de reiniciar
-        restart_btn = ttk.Button(button_frame, text="Reiniciar Jogo", 
-                               command=self.restart_game, bootstyle=WARNING)
-        restart_btn.pack(side=RIGHT)
-        
-        # Desenhar corações iniciais após criar a interface
-        self.draw_hearts()
-    
-    def toggle_fullscreen(self, event=None):
-        """Alterna entre fullscreen e janela normal"""
-        self.is_fullscreen = not self.is_fullscreen
-        self.root.attributes('-fullscreen', self.is_fullscreen)
-    
-    def exit_fullscreen(self, event=None):
-        """Sai do modo fullscreen"""
-        self.is_fullscreen = False
-        self.root.attributes('-fullscreen', False)
-    
-    def get_current_question(self):
-        if self.current_topic == "kpop":
-            if self.kpop_index >= len(self.kpop_shuffled):
-                random.shuffle(self.kpop_shuffled)
-                self.kpop_index = 0
-            question = self.kpop_shuffled[self.kpop_index]
-            self.kpop_index += 1
-        else:
-            if self.programacao_index >= len(self.programacao_shuffled):
-                random.shuffle(self.programacao_shuffled)
-                self.programacao_index = 0
-            question = self.programacao_shuffled[self.programacao_index]
-            self.programacao_index += 1
-        
-        return question
-    
-    def next_question(self):
-        self.question_count += 1
-        self.current_question = self.get_current_question()
-        self.game_state = "question"
-        
-        # Mostrar elementos da pergunta e esconder escolha de tópico
-        self.show_question_elements()
-        
-        # Atualizar conteúdo
-        topic_text = "🎵 K-POP" if self.current_topic == "kpop" else "💻 PROGRAMAÇÃO"
-        self.topic_label.config(text=f"Tópico: {topic_text}")
-        
-        self.question_label.config(text=self.current_question["pergunta"])
-        
-        for i, option in enumerate(self.current_question["opcoes"]):
-            self.option_buttons[i].config(text=f"{chr(65+i)}) {option}")
-        
-        self.option_var.set("")
-        
-        # Atualizar contadores e vidas
-        self.update_lives_display()
-        self.score_label.config(text=f"Pontuação: {self.score}")
-        self.question_count_label.config(text=f"Pergunta: {self.question_count}")
-    
-    def update_lives_display(self):
-        """Atualiza a exibição dos corações baseado nas vidas restantes"""
-        self.draw_hearts()
-    def show_question_elements(self):
-        """Mostra elementos da pergunta e esconde escolha de tópico"""
-        self.question_frame.pack(fill=X, pady=(0, 20))
-        self.options_frame.pack(fill=X, pady=(0, 20))
-        self.submit_btn.pack(side=LEFT, padx=(0, 10))
-        self.topic_choice_frame.pack_forget()
-    
-    def game_over(self):
-        """Exibe tela de game over e reinicia o jogo"""
-        messagebox.showinfo("Game Over! 💀", 
-                          f"Suas vidas acabaram!\n\n🏆 Pontuação Final: {self.score}\n📊 Perguntas Respondidas: {self.question_count}\n\nO jogo será reiniciado!")
-        self.restart_game_silent()
-    
-    def restart_game_silent(self):
-        """Reinicia o jogo sem confirmação (usado após game over)"""
-        self.score = 0
-        self.question_count = 0
-        self.lives = 3
-        self.current_topic = "kpop"
-        self.kpop_index = 0
-        self.programacao_index = 0
-        self.game_state = "question"
-        
-        # Reembaralhar as perguntas
-        random.shuffle(self.kpop_shuffled)
-        random.shuffle(self.programacao_shuffled)
-        
-        self.update_lives_display()
-        self.next_question()
-    
-    def show_topic_choice_elements(self):
-        """Esconde elementos da pergunta e mostra escolha de tópico"""
-        self.question_frame.pack_forget()
-        self.options_frame.pack_forget()
-        self.submit_btn.pack_forget()
-        self.topic_choice_frame.pack(fill=X, pady=20)
-        self.topic_var.set(self.current_topic)
-    
-    def check_answer(self):
-        selected = self.option_var.get()
-        
-        if not selected:
-            messagebox.showwarning("Aviso", "Por favor, selecione uma opção!")
-            return
-        
-        selected_index = int(selected)
-        correct_index = self.current_question["resposta_correta"]
-        
-        if selected_index == correct_index:
-            self.score += 10
-            self.game_state = "topic_choice"
-            messagebox.showinfo("Correto! ✅", 
-                              f"Parabéns! Você acertou!\n\nResposta: {self.current_question['opcoes'][correct_index]}")
-            
-            # Mostrar escolha de tópico
-            self.show_topic_choice_elements()
-            
-        else:
-            # Perder uma vida
-            self.lives -= 1
-            self.update_lives_display()
-            
-            # Verificar se acabaram as vidas
-            if self.lives <= 0:
-                messagebox.showerror("Incorreto! ❌", 
-                                   f"Resposta errada!\n\nResposta correta: {self.current_question['opcoes'][correct_index]}")
-                self.game_over()
-                return
-            
-            messagebox.showerror("Incorreto! ❌", 
-                               f"Resposta errada!\n\nResposta correta: {self.current_question['opcoes'][correct_index]}\n\n💔 Vidas restantes: {self.lives}")
-            
-            # Trocar automaticamente de tópico
-            self.current_topic = "programacao" if self.current_topic == "kpop" else "kpop"
-            self.next_question()
-    
-    def continue_game(self):
-        self.current_topic = self.topic_var.get()
-        self.next_question()
-    
-    def restart_game(self):
-        result = messagebox.askyesno("Reiniciar", "Tem certeza que deseja reiniciar o jogo?")
-        if result:
-            self.score = 0
-            self.question_count = 0
-            self.lives = 3
-            self.current_topic = "kpop"
-            self.kpop_index = 0
-            self.programacao_index = 0
-            self.game_state = "question"
-            
-            # Reembaralhar as perguntas
-            random.shuffle(self.kpop_shuffled)
-            random.shuffle(self.programacao_shuffled)
-            
-            self.update_lives_display()
-            self.next_question()
-    
-    def restart_game_silent(self):
-        """Reinicia o jogo sem confirmação (usado após game over)"""
-        self.score = 0
-        self.question_count = 0
-        self.lives = 3
-        self.current_topic = "kpop"
-        self.kpop_index = 0
-        self.programacao_index = 0
-        self.game_state = "question"
-        
-        # Reembaralhar as perguntas
-        random.shuffle(self.kpop_shuffled)
-        random.shuffle(self.programacao_shuffled)
-        
-        self.update_lives_display()
-        self.next_question()
-
-    def setup_ui(self):
-        # Container principal para centralização
-        main_container = ttk.Frame(self.root)
-        main_container.pack(fill=BOTH, expand=True)
-        
-        # Frame principal com scrollbar caso necessário
-        main_canvas = tk.Canvas(main_container, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(main_container, orient="vertical", command=main_canvas.yview)
-        
-        # Frame para centralização horizontal
-        center_frame = ttk.Frame(main_canvas)
-        
-        # Frame do conteúdo com largura limitada para centralização
-        self.scrollable_frame = ttk.Frame(center_frame, padding="40")
-        self.scrollable_frame.pack(expand=True)
-        
-        # Configurar scroll
-        def configure_scroll_region(event=None):
-            main_canvas.configure(scrollregion=main_canvas.bbox("all"))
-            # Centralizar horizontalmente
-            canvas_width = main_canvas.winfo_width()
-            frame_width = center_frame.winfo_reqwidth()
-            x_position = max(0, (canvas_width - frame_width) // 2)
-            main_canvas.coords("center_window", x_position, 0)
-        
-        center_frame.bind("<Configure>", configure_scroll_region)
-        main_canvas.bind("<Configure>", configure_scroll_region)
-        
-        main_canvas.create_window((0, 0), window=center_frame, anchor="nw", tags="center_window")
-        main_canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Pack canvas e scrollbar
-        main_canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Bind scroll do mouse
-        def _on_mousewheel(event):
-            main_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        main_canvas.bind_all("<MouseWheel>", _on_mousewheel)
-        
-        # Título
-        title_frame = ttk.Frame(self.scrollable_frame)
-        title_frame.pack(fill=X, pady=(0, 25))
-        
-        # Usar tk.Label para poder controlar a fonte do título
-        title_label = tk.Label(title_frame, text="🎵 TRIVIA GAME 🧪", 
-                              font=("Arial", 28, "bold"), 
-                              bg='#2c3e50', fg='white')  # Cor fixa para compatibilidade
-        title_label.pack()
-        
-        # Instruções de fullscreen
-        instructions_label = tk.Label(title_frame, text="F11: Tela Cheia | ESC: Sair da Tela Cheia | Mouse: Scroll",
-                                     font=("Arial", 12),
-                                     bg='#2c3e50', fg='lightgray')  # Cor fixa para compatibilidade
-        instructions_label.pack(pady=(8, 0))
-        
-        # Score, contador e vidas
-        info_frame = ttk.Frame(self.scrollable_frame)
-        info_frame.pack(fill=X, pady=(0, 25))
-        
-        # Vidas (corações) - lado esquerdo
-        lives_frame = ttk.Frame(info_frame)
-        lives_frame.pack(side=LEFT)
-        
-        lives_label = tk.Label(lives_frame, text="Vidas: ", 
-                              font=("Arial", 14, "bold"),
-                              bg='#2c3e50', fg='white')  # Cor fixa para compatibilidade
-        lives_label.pack(side=LEFT)
-        
-        # Criar corações coloridos usando Canvas (maiores)
-        self.heart_canvases = []
-        for i in range(3):
-            canvas = tk.Canvas(lives_frame, width=30, height=30, highlightthickness=0, bg='#2c3e50')
-            canvas.pack(side=LEFT, padx=4)
-            self.heart_canvases.append(canvas)
-        
-        # Score - centro
-        self.score_label = tk.Label(info_frame, text="Pontuação: 0",
-                                   font=("Arial", 14, "bold"),
-                                   bg='#2c3e50', fg='white')  # Cor fixa para compatibilidade
-        self.score_label.pack(side=LEFT, padx=(30, 0))
-        
-        # Contador de perguntas - direita
-        self.question_count_label = tk.Label(info_frame, text="Pergunta: 0",
-                                           font=("Arial", 14, "bold"),
-                                           bg='#2c3e50', fg='white')  # Cor fixa para compatibilidade
-        self.question_count_label.pack(side=RIGHT)
-        
-        # Tópico atual
-        self.topic_label = tk.Label(self.scrollable_frame, text="",
-                                   font=("Arial", 18, "bold"),
-                                   bg='#2c3e50', fg='lightblue')  # Cor fixa para compatibilidade
-        self.topic_label.pack(pady=(0, 25))
-        
-        # Frame da pergunta
-        self.question_frame = ttk.LabelFrame(self.scrollable_frame, text="Pergunta", padding="25")
-        self.question_frame.pack(fill=X, pady=(0, 25))
-        
-        self.question_label = tk.Label(self.question_frame, text="", wraplength=900,
-                                      font=("Arial", 16),
-                                      bg='#2c3e50', fg='white')  # Cor fixa para compatibilidade
-        self.question_label.pack()
-        
-        # Frame das opções
-        self.options_frame = ttk.LabelFrame(self.scrollable_frame, text="Opções", padding="25")
-        self.options_frame.pack(fill=X, pady=(0, 25))
-        
-        self.option_var = tk.StringVar()
-        self.option_buttons = []
-        
-        for i in range(4):
-            btn = ttk.Radiobutton(self.options_frame, text="", variable=self.option_var, 
-                                value=str(i))
-            btn.pack(anchor=W, pady=8)
-            self.option_buttons.append(btn)
-        
-        # Frame de escolha de tópico
-        self.topic_choice_frame = ttk.LabelFrame(self.scrollable_frame, text="✅ Você acertou! Escolha o próximo tópico:", padding="25")
-        
-        self.topic_var = tk.StringVar(value="kpop")
-        
-        kpop_radio = ttk.Radiobutton(self.topic_choice_frame, text="🎵 K-pop", 
-                                   variable=self.topic_var, value="kpop")
-        kpop_radio.pack(anchor=W, pady=8)
-        
-        programacao_radio = ttk.Radiobutton(self.topic_choice_frame, text="💻 Programação", 
-                                     variable=self.topic_var, value="programacao")
-        programacao_radio.pack(anchor=W, pady=8)
-        
-        self.continue_btn = ttk.Button(self.topic_choice_frame, text="Próxima Pergunta", 
-                                     command=self.continue_game, bootstyle=SUCCESS)
-        self.continue_btn.pack(pady=15)
-        
-        # Frame dos botões - sempre visível na parte inferior
-        button_frame = ttk.Frame(self.scrollable_frame)
-        button_frame.pack(fill=X, pady=35, side=BOTTOM)  # Extra padding para evitar corte
-        
-        self.submit_btn = ttk.Button(button_frame, text="Responder", 
-                                   command=self.check_answer, bootstyle=PRIMARY)
-        self.submit_btn.pack(side=LEFT, padx=(0, 15))
-        
-        # Botão de reiniciar
-        restart_btn = ttk.Button(button_frame, text="Reiniciar Jogo", 
-                               command=self.restart_game, bootstyle=WARNING)
-        restart_btn.pack(side=RIGHT)
-        
-        # Desenhar corações iniciais após criar a interface
-        self.draw_hearts()
-    
-    def toggle_fullscreen(self, event=None):
-        """Alterna entre fullscreen e janela normal"""
-        self.is_fullscreen = not self.is_fullscreen
-        self.root.attributes('-fullscreen', self.is_fullscreen)
-    
-    def exit_fullscreen(self, event=None):
-        """Sai do modo fullscreen"""
-        self.is_fullscreen = False
-        self.root.attributes('-fullscreen', False)
-    
-    def get_current_question(self):
-        if self.current_topic == "kpop":
-            if self.kpop_index >= len(self.kpop_shuffled):
-                random.shuffle(self.kpop_shuffled)
-                self.kpop_index = 0
-            question = self.kpop_shuffled[self.kpop_index]
-            self.kpop_index += 1
-        else:
-            if self.programacao_index >= len(self.programacao_shuffled):
-                random.shuffle(self.programacao_shuffled)
-                self.programacao_index = 0
-            question = self.programacao_shuffled[self.programacao_index]
-            self.programacao_index += 1
-        
-        return question
-    
-    def next_question(self):
-        self.question_count += 1
-        self.current_question = self.get_current_question()
-        self.game_state = "question"
-        
-        # Mostrar elementos da pergunta e esconder escolha de tópico
-        self.show_question_elements()
-        
-        # Atualizar conteúdo
-        topic_text = "🎵 K-POP" if self.current_topic == "kpop" else "💻 PROGRAMAÇÃO"
-        self.topic_label.config(text=f"Tópico: {topic_text}")
-        
-        self.question_label.config(text=self.current_question["pergunta"])
-        
-        for i, option in enumerate(self.current_question["opcoes"]):
-            self.option_buttons[i].config(text=f"{chr(65+i)}) {option}")
-        
-        self.option_var.set("")
-        
-        # Atualizar contadores e vidas
-        self.update_lives_display()
-        self.score_label.config(text=f"Pontuação: {self.score}")
-        self.question_count_label.config(text=f"Pergunta: {self.question_count}")
-    
-    def update_lives_display(self):
-        """Atualiza a exibição dos corações baseado nas vidas restantes"""
-        self.draw_hearts()
-    def show_question_elements(self):
-        """Mostra elementos da pergunta e esconde escolha de tópico"""
-        self.question_frame.pack(fill=X, pady=(0, 20))
-        self.options_frame.pack(fill=X, pady=(0, 20))
-        self.submit_btn.pack(side=LEFT, padx=(0, 10))
-        self.topic_choice_frame.pack_forget()
-    
-    def game_over(self):
-        """Exibe tela de game over e reinicia o jogo"""
-        messagebox.showinfo("Game Over! 💀", 
-                          f"Suas vidas acabaram!\n\n🏆 Pontuação Final: {self.score}\n📊 Perguntas Respondidas: {self.question_count}\n\nO jogo será reiniciado!")
-        self.restart_game_silent()
-    
-    def restart_game_silent(self):
-        """Reinicia o jogo sem confirmação (usado após game over)"""
-        self.score = 0
-        self.question_count = 0
-        self.lives = 3
-        self.current_topic = "kpop"
-        self.kpop_index = 0
-        self.programacao_index = 0
-        self.game_state = "question"
-        
-        # Reembaralhar as perguntas
-        random.shuffle(self.kpop_shuffled)
-        random.shuffle(self.programacao_shuffled)
-        
-        self.update_lives_display()
-        self.next_question()
-    
-    def show_topic_choice_elements(self):
-        """Esconde elementos da pergunta e mostra escolha de tópico"""
-        self.question_frame.pack_forget()
-        self.options_frame.pack_forget()
-        self.submit_btn.pack_forget()
-        self.topic_choice_frame.pack(fill=X, pady=20)
-        self.topic_var.set(self.current_topic)
-    
-    def check_answer(self):
-        selected = self.option_var.get()
-        
-        if not selected:
-            messagebox.showwarning("Aviso", "Por favor, selecione uma opção!")
-            return
-        
-        selected_index = int(selected)
-        correct_index = self.current_question["resposta_correta"]
-        
-        if selected_index == correct_index:
-            self.score += 10
-            self.game_state = "topic_choice"
-            messagebox.showinfo("Correto! ✅", 
-                              f"Parabéns! Você acertou!\n\nResposta: {self.current_question['opcoes'][correct_index]}")
-            
-            # Mostrar escolha de tópico
-            self.show_topic_choice_elements()
-            
-        else:
-            # Perder uma vida
-            self.lives -= 1
-            self.update_lives_display()
-            
-            # Verificar se acabaram as vidas
-            if self.lives <= 0:
-                messagebox.showerror("Incorreto! ❌", 
-                                   f"Resposta errada!\n\nResposta correta: {self.current_question['opcoes'][correct_index]}")
-                self.game_over()
-                return
-            
-            messagebox.showerror("Incorreto! ❌", 
-                               f"Resposta errada!\n\nResposta correta: {self.current_question['opcoes'][correct_index]}\n\n💔 Vidas restantes: {self.lives}")
-            
-            # Trocar automaticamente de tópico
-            self.current_topic = "programacao" if self.current_topic == "kpop" else "kpop"
-            self.next_question()
-    
-    def continue_game(self):
-        self.current_topic = self.topic_var.get()
-        self.next_question()
-    
-    def restart_game(self):
-        result = messagebox.askyesno("Reiniciar", "Tem certeza que deseja reiniciar o jogo?")
-        if result:
-            self.score = 0
-            self.question_count = 0
-            self.lives = 3
-            self.current_topic = "kpop"
-            self.kpop_index = 0
-            self.programacao_index = 0
-            self.game_state = "question"
-            
-            # Reembaralhar as perguntas
-            random.shuffle(self.kpop_shuffled)
-            random.shuffle(self.programacao_shuffled)
-            
-            self.update_lives_display()
-            self.next_question()
-    
-    def restart_game_silent(self):
-        """Reinicia o jogo sem confirmação (usado após game over)"""
-        self.score = 0
-        self.question_count = 0
-        self.lives = 3
-        self.current_topic = "kpop"
-        self.kpop_index = 0
-        self.programacao_index = 0
-        self.game_state = "question"
-        
-        # Reembaralhar as perguntas
-        random.shuffle(self.kpop_shuffled)
-        random.shuffle(self.programacao_shuffled)
-        
-        self.update_lives_display()
-        self.next_question()
+        self.engine.restart()
+        if self._answer_log is not None:
+            self._answer_log.new_session()
+        self.show_question()
 
 if __name__ == "__main__":
-    game = TriviaGame()
-    game.root.mainloop()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Trivia Game - K-pop vs Programação")
+    parser.add_argument("--modo", choices=["normal", "adaptativo", "revisao"], default="normal",
+                        help="adaptativo: prioriza perguntas perto da dificuldade alvo; "
+                             "revisao: repetição espaçada das perguntas do jogador")
+    parser.add_argument("--dificuldade", type=float, default=0.5,
+                        help="dificuldade alvo do modo adaptativo (0 = fácil, 1 = difícil)")
+    parser.add_argument("--jogador", default="jogador",
+                        help="nome do jogador (perguntas já vistas e agenda do modo revisao)")
+    parser.add_argument("--vidas", type=int, default=GameEngine.MAX_LIVES,
+                        help="número de vidas (corações) por partida")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="mostra o tempo de cada fase da abertura até a primeira pergunta")
+    parser.add_argument("--layout-stats", action="store_true",
+                        help="mostra quantas passadas de layout cada troca de tela provocou")
+    parser.add_argument("--rapido", action="store_true",
+                        help="avança para a próxima pergunta imediatamente após cada resposta")
+    parser.add_argument("--semente", type=int,
+                        help="semente do sorteio da sessão; repete as perguntas só com --gravar ou --filtro "
+                             "(nos modos o sorteio também usa o histórico salvo do jogador)")
+    parser.add_argument("--gravar", metavar="ARQUIVO",
+                        help="grava a sessão para reproduzir depois com `python replay.py ARQUIVO`")
+    parser.add_argument("--diario", action="store_true",
+                        help="registra cada jogada em journal/<jogador>/ para recuperar a partida após uma queda")
+    parser.add_argument("--filtro", metavar="TERMOS",
+                        help="joga só com as perguntas que contêm os termos (ver search.py)")
+    parser.add_argument("--validar-duplicatas", action="store_true",
+                        help="avisa sobre perguntas quase duplicadas ao carregar cada banco (ver dedup.py)")
+    parser.add_argument("--ordem-fixa", action="store_true",
+                        help="mostra as opções sempre na ordem do banco, sem embaralhar")
+    parser.add_argument("--profile", nargs="?", const="1", metavar="ARQUIVO",
+                        help="mede os caminhos quentes e grava um trace do Chrome ao fechar "
+                             "(também ligado por TRIVIA_PROFILE=1 ou TRIVIA_PROFILE=ARQUIVO)")
+    args = parser.parse_args()
+    
+    if args.vidas < 1:
+        parser.error("--vidas deve ser pelo menos 1")
+    if args.gravar and args.modo != "normal":
+        parser.error("--gravar só está disponível no modo normal")
+    if args.diario and (args.modo != "normal" or args.gravar):
+        parser.error("--diario só está disponível no modo normal, sem --gravar")
+    if args.filtro and (args.modo != "normal" or args.gravar):
+        parser.error("--filtro só está disponível no modo normal, sem --gravar")
+    
+    profile = args.profile or os.environ.get("TRIVIA_PROFILE")
+    if profile == "1":
+        # Arquivo padrão; o módulo só é importado com a instrumentação ligada
+        from profiling import DEFAULT_TRACE
+        profile = DEFAULT_TRACE
+    elif profile == "0":
+        profile = None
+    
+    game = TriviaGame(mode=args.modo, target_difficulty=args.dificuldade, player=args.jogador,
+                      max_lives=args.vidas, layout_stats=args.layout_stats,
+                      rapid=args.rapido, seed=args.semente, record=args.gravar,
+                      journal=args.diario, profile=profile,
+                      search=args.filtro, check_duplicates=args.validar_duplicatas,
+                      shuffle=not args.ordem_fixa)
+    if args.startup_report:
+        game.startup.report()
+    game.root.mainloop()
@@ -0,0 +1,118 @@
+"""Instrumentação opcional dos caminhos quentes do jogo.
+
+Quando ligada (`python main.py --profile` ou a variável de ambiente
+`TRIVIA_PROFILE`), os métodos escolhidos são trocados, só na instância,
+por versões que medem cada chamada com `time.perf_counter_ns` (relógio
+monotônico). Desligada, nada é trocado e este módulo nem é importado:
+o custo é zero.
+
+Cada chamada vira um intervalo (span), conta no contador do método e cai
+em um histograma de potências de dois (em microssegundos). No fim, os
+dados são exportados como trace JSON do Chrome (abra em chrome://tracing
+ou https://ui.perfetto.dev) e como um resumo em texto.
+"""
+import functools
+import json
+import os
+import time
+
+DEFAULT_TRACE = "trivia-trace.json"
+
+# Faixa k do histograma: duração em [2^(k-1), 2^k) µs; a faixa 0 é < 1 µs
+BUCKETS = 24
+
+
+class Profiler:
+    def __init__(self):
+        self.origin = time.perf_counter_ns()
+        self.spans = []        # (nome, início em ns, duração em ns)
+        self.counters = {}
+        self.histograms = {}
+
+    def record(self, name, start, duration):
+        self.spans.append((name, start, duration))
+        self.counters[name] = self.counters.get(name, 0) + 1
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = [0] * BUCKETS
+        histogram[min((duration // 1000).bit_length(), BUCKETS - 1)] += 1
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def wrap(self, name, func):
+        """Versão medida de `func`: cada chamada grava um intervalo `name`"""
+        clock = time.perf_counter_ns
+        record = self.record
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, start, clock() - start)
+        return timed
+
+    def instrument(self, obj, *attributes, prefix=None):
+        """Troca os atributos chamáveis de `obj` (só nesta instância) por versões medidas"""
+        prefix = prefix or type(obj).__name__
+        for attribute in attributes:
+            setattr(obj, attribute, self.wrap(f"{prefix}.{attribute}", getattr(obj, attribute)))
+
+    def until_idle(self, widget, obj, attribute, name):
+        """Mede de cada chamada a `obj.attribute` até o Tk ficar ocioso (tela já atualizada)"""
+        func = getattr(obj, attribute)
+        clock = time.perf_counter_ns
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                widget.after_idle(lambda: self.record(name, start, clock() - start))
+        setattr(obj, attribute, timed)
+
+    def chrome_trace(self):
+        """Eventos no formato "Trace Event" do Chrome (intervalos completos e contadores)"""
+        pid = os.getpid()
+        events = [{"name": name, "cat": name.split(".")[0], "ph": "X", "pid": pid, "tid": 0,
+                   "ts": (start - self.origin) / 1000, "dur": duration / 1000}
+                  for name, start, duration in self.spans]
+        end = (time.perf_counter_ns() - self.origin) / 1000
+        events.extend({"name": name, "ph": "C", "pid": pid, "tid": 0, "ts": end, "args": {"chamadas": value}}
+                      for name, value in self.counters.items())
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, path=DEFAULT_TRACE):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+
+    def summary(self):
+        """Resumo em texto: chamadas, tempo total e percentis de cada intervalo, e os histogramas"""
+        durations = {}
+        for name, _, duration in self.spans:
+            durations.setdefault(name, []).append(duration)
+        lines = [f"{'intervalo':<40} {'chamadas':>8} {'total ms':>10} {'p50 µs':>9} {'p90 µs':>9} "
+                 f"{'p99 µs':>9} {'máx µs':>9}"]
+        for name, values in sorted(durations.items(), key=lambda item: -sum(item[1])):
+            values.sort()
+            n = len(values)
+            lines.append(f"{name:<40} {n:8d} {sum(values) / 1e6:10.2f} {values[n // 2] / 1000:9.1f} "
+                         f"{values[n * 9 // 10] / 1000:9.1f} {values[n * 99 // 100] / 1000:9.1f} "
+                         f"{values[-1] / 1000:9.1f}")
+        others = {name: value for name, value in self.counters.items() if name not in durations}
+        if others:
+            lines.append("")
+            lines.extend(f"{name:<40} {value:8d}" for name, value in sorted(others.items()))
+        for name, histogram in sorted(self.histograms.items()):
+            lines.append("")
+            lines.append(f"{name} (µs)")
+            peak = max(histogram)
+            for k, value in enumerate(histogram):
+                if value:
+                    low = 0 if k == 0 else 1 << (k - 1)
+                    lines.append(f"  {low:>8} - {1 << k:<8} {value:8d} {'#' * max(1, 40 * value // peak)}")
+        return "\n".join(lines)
+
@@ -0,0 +1,85 @@
+"""Representação compacta das perguntas.
+
+`Question` usa `__slots__` em vez de um dicionário por pergunta, e o
+`QuestionStore` guarda um banco inteiro como estrutura de arrays: uma tabela
+de strings sem repetição, um array de ids de largura fixa (pergunta + 4
+opções) e um `bytearray` com o índice da resposta correta de cada pergunta.
+"""
+from array import array
+from itertools import permutations
+
+OPTIONS_PER_QUESTION = 4
+_STRIDE = 1 + OPTIONS_PER_QUESTION  # id da pergunta seguido dos ids das opções
+
+# As 24 ordens possíveis das opções: a ordem k mostra na posição i a opção OPTION_ORDERS[k][i].
+# A ordem 0 é a original.
+OPTION_ORDERS = tuple(permutations(range(OPTIONS_PER_QUESTION)))
+# Posição em que cada opção original aparece na ordem k (inversa de OPTION_ORDERS[k])
+OPTION_POSITIONS = tuple(tuple(order.index(i) for i in range(OPTIONS_PER_QUESTION)) for order in OPTION_ORDERS)
+
+
+class Question:
+    __slots__ = ("pergunta", "opcoes", "resposta_correta")
+
+    def __init__(self, pergunta, opcoes, resposta_correta):
+        self.pergunta = pergunta
+        self.opcoes = tuple(opcoes)
+        self.resposta_correta = resposta_correta
+
+    def __eq__(self, other):
+        if not isinstance(other, Question):
+            return NotImplemented
+        return (self.pergunta, self.opcoes, self.resposta_correta) == \
+               (other.pergunta, other.opcoes, other.resposta_correta)
+
+    def __hash__(self):
+        return hash((self.pergunta, self.opcoes, self.resposta_correta))
+
+    def __repr__(self):
+        return f"Question({self.pergunta!r}, {list(self.opcoes)!r}, {self.resposta_correta})"
+
+
+class QuestionStore:
+    """Banco de perguntas em estrutura de arrays; `store[i]` devolve um `Question`"""
+
+    def __init__(self, questions=()):
+        self.strings = []
+        self._string_ids = {}
+        self.text_ids = array("I")
+        self.correct = bytearray()
+        for question in questions:
+            self.append(question)
+
+    def _intern(self, text):
+        sid = self._string_ids.get(text)
+        if sid is None:
+            sid = self._string_ids[text] = len(self.strings)
+            self.strings.append(text)
+        return sid
+
+    def append(self, question):
+        self.text_ids.append(self._intern(question.pergunta))
+        self.text_ids.extend(self._intern(option) for option in question.opcoes)
+        self.correct.append(question.resposta_correta)
+
+    def __len__(self):
+        return len(self.correct)
+
+    def __getitem__(self, index):
+        if not 0 <= index < len(self.correct):
+            raise IndexError(index)
+        strings = self.strings
+        start = index * _STRIDE
+        ids = self.text_ids[start:start + _STRIDE]
+        return Question(strings[ids[0]], tuple(strings[sid] for sid in ids[1:]), self.correct[index])
+
+    def pergunta(self, index):
+        """Texto da pergunta `index`, sem montar o objeto inteiro"""
+        return self.strings[self.text_ids[index * _STRIDE]]
+
+    def resposta_correta(self, index):
+        return self.correct[index]
+
+    def compact(self):
+        """Libera o índice usado para deduplicar strings depois que o banco termina de carregar"""
+        self._string_ids = {}
@@ -0,0 +1,216 @@
+"""Gravação e reprodução de partidas.
+
+Uma sessão gravada guarda só a semente do gerador da sessão e as ações do
+jogador; como todo sorteio passa pelo `random.Random` da sessão, refazer as
+mesmas ações com a mesma semente e o mesmo banco reproduz a partida inteira
+(perguntas, pontos, vidas e trocas de tópico).
+
+Formato do arquivo (inteiros little-endian):
+
+    cabeçalho     magic "TRVR", versão, semente (64 bits), nº de vidas,
+                  nº de tópicos, opções (1 byte: bit 0 = ordem das opções
+                  sorteada a cada pergunta)
+    tópicos       para cada tópico: tamanho do id (1 byte) e o id em UTF-8;
+                  a posição na tabela é o número usado nos eventos
+    eventos       1 byte de código seguido dos argumentos:
+                    ANSWER  posição exibida da opção escolhida (1 byte)
+                    TOPIC   posição do tópico escolhido (2 bytes)
+                    RESTART sem argumentos
+
+A primeira pergunta é sorteada ao abrir a sessão e não vira evento. Um
+evento incompleto no fim do arquivo (queda no meio da escrita) é ignorado.
+Arquivos da versão 1 (sem o byte de opções, opções sempre na ordem do
+banco) continuam sendo lidos.
+
+Uso:
+    python main.py --gravar partida.trv       # grava a sessão da interface
+    python replay.py partida.trv [outra.trv]  # reproduz sem interface
+"""
+import argparse
+import random
+import struct
+import sys
+import time
+
+from engine import GameEngine
+
+MAGIC = b"TRVR"
+VERSION = 2
+
+HEADER = struct.Struct("<4sHQHHB")
+HEADER_V1 = struct.Struct("<4sHQHH")
+SHUFFLE_OPTIONS = 1
+TOPIC_INDEX = struct.Struct("<H")
+
+ANSWER = 1
+TOPIC = 2
+RESTART = 3
+
+EVENT_SIZE = {ANSWER: 2, TOPIC: 3, RESTART: 1}
+
+
+def new_seed():
+    return random.getrandbits(64)
+
+
+class EventWriter:
+    """Grava o cabeçalho e os eventos de uma sessão em `path`"""
+
+    def __init__(self, path, seed, topic_ids, max_lives, flags=0):
+        self.topic_index = {topic: i for i, topic in enumerate(topic_ids)}
+        self.file = open(path, "wb")
+        self.file.write(encode_header(seed, topic_ids, max_lives, flags))
+
+    def answer(self, selected_index):
+        self.file.write(bytes((ANSWER, selected_index)))
+
+    def topic(self, topic):
+        self.file.write(bytes((TOPIC,)) + TOPIC_INDEX.pack(self.topic_index[topic]))
+
+    def restart(self):
+        self.file.write(bytes((RESTART,)))
+
+    def close(self):
+        self.file.close()
+
+
+def encode_header(seed, topic_ids, max_lives, flags=0):
+    parts = [HEADER.pack(MAGIC, VERSION, seed, max_lives, len(topic_ids), flags)]
+    for topic in topic_ids:
+        encoded = topic.encode("utf-8")
+        parts.append(bytes((len(encoded),)) + encoded)
+    return b"".join(parts)
+
+
+def decode_header(data, name="log"):
+    """Lê o cabeçalho: (semente, ids dos tópicos, vidas, opções, posição do primeiro evento)"""
+    if len(data) < HEADER_V1.size:
+        raise ValueError(f"{name}: arquivo de partida truncado")
+    magic, version, seed, max_lives, n_topics = HEADER_V1.unpack_from(data)
+    if magic != MAGIC or version not in (1, VERSION):
+        raise ValueError(f"{name}: arquivo de partida inválido (versão {version})")
+    if version == 1:
+        flags, pos = 0, HEADER_V1.size
+    else:
+        flags, pos = data[HEADER_V1.size], HEADER.size
+    topic_ids = []
+    for _ in range(n_topics):
+        size = data[pos]
+        topic_ids.append(data[pos + 1:pos + 1 + size].decode("utf-8"))
+        pos += 1 + size
+    return seed, topic_ids, max_lives, flags, pos
+
+
+def iter_events(data, pos=0):
+    """Gera (código, argumento) para cada evento em `data` a partir de `pos`"""
+    end = len(data)
+    while pos < end:
+        op = data[pos]
+        if pos + EVENT_SIZE.get(op, 1) > end:
+            return
+        if op == ANSWER:
+            yield op, data[pos + 1]
+            pos += 2
+        elif op == TOPIC:
+            yield op, data[pos + 1] | data[pos + 2] << 8
+            pos += 3
+        elif op == RESTART:
+            yield op, None
+            pos += 1
+        else:
+            raise ValueError(f"evento desconhecido {op} na posição {pos}")
+
+
+class LoggedGame(GameEngine):
+    """`GameEngine` que repassa cada ação, já aplicada, para `log` (um `EventWriter` ou `journal.Journal`)"""
+
+    log = None
+
+    def answer(self, selected_index):
+        result = super().answer(selected_index)
+        if self.log is not None:
+            self.log.answer(selected_index)
+        return result
+
+    def choose_topic(self, topic):
+        question = super().choose_topic(topic)
+        if self.log is not None:
+            self.log.topic(topic)
+        return question
+
+    def restart(self):
+        question = super().restart()
+        if self.log is not None:
+            self.log.restart()
+        return question
+
+
+class RecordedGame(LoggedGame):
+    """`LoggedGame` com gerador semeado que grava a sessão em `path`"""
+
+    def __init__(self, path, seed=None, **kwargs):
+        self.seed = new_seed() if seed is None else seed
+        super().__init__(rng=random.Random(self.seed), **kwargs)
+        flags = SHUFFLE_OPTIONS if self.shuffle_options else 0
+        self.log = EventWriter(path, self.seed, self.topics.order, self.max_lives, flags)
+
+    def close(self):
+        self.log.close()
+
+
+def apply_event(engine, topic_ids, op, arg):
+    """Aplica um evento gravado a `engine`"""
+    if op == ANSWER:
+        engine.answer(arg)
+    elif op == TOPIC:
+        engine.choose_topic(topic_ids[arg])
+    else:
+        engine.restart()
+
+
+def replay(path, topics=None):
+    """Reproduz a sessão gravada em `path`; devolve o motor no estado final e as pontuações de cada partida"""
+    with open(path, "rb") as f:
+        data = f.read()
+    seed, topic_ids, max_lives, flags, pos = decode_header(data, path)
+    engine = GameEngine(topics, max_lives=max_lives, rng=random.Random(seed),
+                        shuffle_options=bool(flags & SHUFFLE_OPTIONS))
+    missing = [topic for topic in topic_ids if topic not in engine.topics]
+    if missing:
+        raise ValueError(f"{path}: tópicos ausentes no banco atual: {', '.join(missing)}")
+    engine.next_question()
+    scores = []
+    events = 0
+    for op, arg in iter_events(data, pos):
+        if op == RESTART:
+            scores.append(engine.score)
+        try:
+            apply_event(engine, topic_ids, op, arg)
+        except ValueError as error:
+            # Ação impossível no estado reproduzido: o banco ou as regras mudaram desde a gravação
+            raise ValueError(f"{path}: evento {events} diverge da gravação: {error}") from None
+        events += 1
+    return engine, scores, events
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reproduz partidas gravadas com --gravar, sem interface")
+    parser.add_argument("logs", nargs="+", help="arquivos de partida")
+    args = parser.parse_args()
+
+    total_events = 0
+    start = time.perf_counter()
+    for path in args.logs:
+        try:
+            engine, scores, events = replay(path)
+        except (OSError, ValueError) as error:
+            print(error, file=sys.stderr)
+            sys.exit(1)
+        total_events += events
+        summary = f"{len(scores)} partidas encerradas"
+        if scores:
+            summary += f" (média {sum(scores) / len(scores):.1f}, máximo {max(scores)} pontos)"
+        print(f"{path}: {events} eventos, {summary}; "
+              f"atual: {engine.score} pontos, {engine.question_count} perguntas, {engine.lives} vidas")
+    elapsed = time.perf_counter() - start
+    print(f"{total_events} eventos em {elapsed:.3f}s ({total_events / max(elapsed, 1e-9):,.0f} eventos/s)")
@@ -0,0 +1,62 @@
+"""Sorteio de perguntas sem cópias nem reembaralhamentos completos.
+
+`LazyPermutation` percorre uma permutação aleatória de `range(n)` gerada
+sob demanda: cada sorteio é um passo do Fisher–Yates, e só as posições já
+trocadas ficam guardadas em um dicionário esparso. Sortear é O(1) e
+recomeçar (reinício do jogo ou banco esgotado) também é O(1), mesmo em
+bancos com milhões de perguntas.
+"""
+import random
+
+
+class LazyPermutation:
+    def __init__(self, size, rng=random):
+        self.size = size
+        self.rng = rng
+        self.reset()
+
+    def reset(self):
+        """Recomeça com uma nova permutação, sem tocar nos índices"""
+        self._swaps = {}
+        self._drawn = 0
+
+    def remaining(self):
+        return self.size - self._drawn
+
+    def draw(self):
+        """Próximo índice da permutação; ao esgotar, começa uma nova"""
+        if self.size <= 0:
+            raise IndexError("não há perguntas para sortear")
+        if self._drawn >= self.size:
+            self.reset()
+
+        i = self._drawn
+        j = self.rng.randrange(i, self.size)
+        swaps = self._swaps
+        # Posições < i nunca mais são lidas, então a entrada de i pode sair do dicionário
+        value = swaps.pop(i, i)
+        if j != i:
+            value, swaps[j] = swaps.get(j, j), value
+        self._drawn = i + 1
+        return value
+
+    def record(self, index, correct):
+        """A ordem não depende das respostas"""
+
+
+class SubsetSampler:
+    """Sorteia só entre os índices de `indices` (ex.: perguntas que casam com uma busca), sem repetir até esgotar"""
+
+    def __init__(self, indices, rng=random):
+        self.indices = indices
+        self.size = len(indices)
+        self._order = LazyPermutation(self.size, rng)
+
+    def reset(self):
+        self._order.reset()
+
+    def draw(self):
+        return self.indices[self._order.draw()]
+
+    def record(self, index, correct):
+        """A ordem não depende das respostas"""
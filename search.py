@@ -0,0 +1,307 @@
+"""Busca por palavras-chave nos bancos de perguntas.
+
+Índice invertido por tópico: cada termo aponta para a lista ordenada
+(`array("I")`) das perguntas em que aparece, no texto da pergunta ou de
+alguma opção. Os termos são normalizados para a busca em português
+ignorar maiúsculas e acentos ("programação" acha "Programacao"): NFKD,
+remoção das marcas combinantes e `casefold`. Palavras muito comuns
+("de", "que", "qual"...) não são indexadas.
+
+O índice de um tópico é montado quando o banco do tópico é carregado
+(`ShardedBanks.on_load`) e gravado ao lado do banco: `banks/search.idx`
+para os shards, `questions.bin.idx` para o banco compilado. Cada tópico
+guarda o tamanho e a data do arquivo de origem; se o banco mudar, só
+aquele tópico é reindexado.
+
+Uma consulta intersecta as listas dos termos começando pela menor, com
+busca binária nas demais, então o custo depende das listas curtas e não
+do tamanho do banco. Um termo terminado em `*` busca por prefixo.
+
+Uso:
+    python search.py "blackpink debut"      # perguntas com todos os termos
+    python search.py "program*" --limite 5
+"""
+import argparse
+import functools
+import os
+import re
+import struct
+import sys
+import time
+import unicodedata
+from array import array
+from bisect import bisect_left
+
+from topics import BANK_FILE, default_registry
+
+MAGIC = b"TRVI"
+VERSION = 1
+
+HEADER = struct.Struct("<4sHH")
+TOPIC = struct.Struct("<qQII")   # data de modificação (ns) e tamanho da origem, nº de perguntas, nº de termos
+NAME = struct.Struct("<H")
+TERM = struct.Struct("<HI")      # tamanho do termo, nº de perguntas
+
+INDEX_NAME = "search.idx"
+
+_WORD = re.compile(r"\w+")
+# Marcas combinantes (acentos) que sobram depois da decomposição NFKD
+_ACCENTS = dict.fromkeys(range(0x300, 0x370))
+
+STOPWORDS = frozenset("""
+    a o e os as um uma uns umas de da do das dos em no na nos nas ao aos
+    por para com sem que qual quais quem se sao foi ser ou the of
+""".split())
+
+
+def fold(text):
+    """Texto sem acentos e sem diferença entre maiúsculas e minúsculas"""
+    return unicodedata.normalize("NFKD", text).translate(_ACCENTS).casefold()
+
+
+@functools.lru_cache(maxsize=65536)
+def terms(text):
+    """Termos indexáveis de `text` (as opções se repetem muito entre perguntas, daí o cache)"""
+    return frozenset(word for word in _WORD.findall(fold(text)) if word not in STOPWORDS)
+
+
+def question_terms(question):
+    found = set(terms(question.pergunta))
+    for option in question.opcoes:
+        found |= terms(option)
+    return found
+
+
+def _contains(postings, index):
+    i = bisect_left(postings, index)
+    return i < len(postings) and postings[i] == index
+
+
+class TopicIndex:
+    """Termo -> perguntas do tópico que o contêm, em ordem crescente"""
+
+    def __init__(self, stamp=(0, 0), size=0, postings=None):
+        self.stamp = stamp
+        self.size = size
+        self.postings = postings if postings is not None else {}
+        self._sorted_terms = None
+
+    @classmethod
+    def build(cls, questions, stamp=(0, 0)):
+        index = cls(stamp)
+        for i in range(len(questions)):
+            index.add(i, questions[i])
+        return index
+
+    def add(self, i, question):
+        """Acrescenta a pergunta `i` (os índices devem chegar em ordem crescente)"""
+        postings = self.postings
+        for term in question_terms(question):
+            found = postings.get(term)
+            if found is None:
+                found = postings[term] = array("I")
+            found.append(i)
+        self.size = max(self.size, i + 1)
+        self._sorted_terms = None
+
+    def lookup(self, term):
+        """Perguntas com `term`; `prefixo*` junta todos os termos com o prefixo"""
+        if not term.endswith("*"):
+            return self.postings.get(term, ())
+        prefix = term[:-1]
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self.postings)
+        found = set()
+        keys = self._sorted_terms
+        for k in range(bisect_left(keys, prefix), len(keys)):
+            if not keys[k].startswith(prefix):
+                break
+            found.update(self.postings[keys[k]])
+        return array("I", sorted(found))
+
+    def query(self, query_terms):
+        """Perguntas que contêm todos os termos"""
+        lists = sorted((self.lookup(term) for term in query_terms), key=len)
+        if not lists or not lists[0]:
+            return []
+        first, rest = lists[0], lists[1:]
+        if not rest:
+            return list(first)
+        return [i for i in first if all(_contains(postings, i) for postings in rest)]
+
+
+def parse_query(text):
+    """Termos da consulta, normalizados como no índice (o `*` de prefixo é mantido)"""
+    found = []
+    for word in text.split():
+        word_terms = _WORD.findall(fold(word))
+        for k, term in enumerate(word_terms):
+            if word.endswith("*") and k == len(word_terms) - 1:
+                # O `*` vale só para o último termo da própria palavra, mesmo que seja uma
+                # palavra comum: "de*" busca "desenvolvimento"
+                found.append(term + "*")
+            elif term not in STOPWORDS:
+                found.append(term)
+    return found
+
+
+class SearchIndex:
+    def __init__(self, path):
+        self.path = path
+        self.topics = {}
+        self.dirty = False
+        if os.path.exists(path):
+            self._load()
+
+    def add_topic(self, topic, questions, stamp=(0, 0)):
+        """Indexa (ou reindexa) o tópico inteiro"""
+        self.topics[topic] = TopicIndex.build(questions, stamp)
+        self.dirty = True
+
+    def is_current(self, topic, stamp):
+        index = self.topics.get(topic)
+        return index is not None and index.stamp == stamp
+
+    def query(self, text, topics=None):
+        """{tópico: [índices]} das perguntas com todos os termos de `text`; tópicos sem resultado ficam de fora"""
+        query_terms = parse_query(text)
+        if not query_terms:
+            return {}
+        results = {}
+        for topic, index in self.topics.items():
+            if topics is None or topic in topics:
+                found = index.query(query_terms)
+                if found:
+                    results[topic] = found
+        return results
+
+    def _load(self):
+        with open(self.path, "rb") as f:
+            data = f.read()
+        magic, version, n_topics = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            # Índice de outra versão: é só reconstruir
+            return
+        pos = HEADER.size
+        for _ in range(n_topics):
+            (name_len,) = NAME.unpack_from(data, pos)
+            pos += NAME.size
+            name = data[pos:pos + name_len].decode("utf-8")
+            pos += name_len
+            mtime, source_size, size, n_terms = TOPIC.unpack_from(data, pos)
+            pos += TOPIC.size
+            postings = {}
+            for _ in range(n_terms):
+                term_len, count = TERM.unpack_from(data, pos)
+                pos += TERM.size
+                term = data[pos:pos + term_len].decode("utf-8")
+                pos += term_len
+                found = array("I")
+                found.frombytes(data[pos:pos + 4 * count])
+                if sys.byteorder == "big":
+                    found.byteswap()
+                postings[term] = found
+                pos += 4 * count
+            self.topics[name] = TopicIndex((mtime, source_size), size, postings)
+
+    def save(self):
+        parts = [HEADER.pack(MAGIC, VERSION, len(self.topics))]
+        for name, index in self.topics.items():
+            encoded = name.encode("utf-8")
+            parts.append(NAME.pack(len(encoded)) + encoded)
+            parts.append(TOPIC.pack(*index.stamp, index.size, len(index.postings)))
+            for term, found in index.postings.items():
+                encoded = term.encode("utf-8")
+                if sys.byteorder == "big":
+                    found = array("I", found)
+                    found.byteswap()
+                parts.append(TERM.pack(len(encoded), len(found)) + encoded)
+                parts.append(found.tobytes())
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.writelines(parts)
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+
+def _stamp(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def open_index(registry):
+    """Índice dos bancos de `registry`, ao lado do banco, atualizado à medida que cada banco carrega.
+
+    Nos shards, só os tópicos que ainda não estão no índice (ou cujo arquivo
+    mudou) são indexados, quando o shard é lido. `index_all` garante todos.
+    """
+    banks = registry.banks
+    paths = getattr(banks, "paths", None)
+    if paths is None:
+        # Banco compilado: uma única origem para todos os tópicos
+        index = SearchIndex(BANK_FILE + ".idx")
+        stamp = _stamp(BANK_FILE)
+        for topic in registry.order:
+            if not index.is_current(topic, stamp):
+                index.add_topic(topic, banks[topic], stamp)
+        return index
+
+    index = SearchIndex(os.path.join(banks.directory, INDEX_NAME))
+
+    def on_load(topic, questions):
+        stamp = _stamp(paths[topic])
+        if not index.is_current(topic, stamp):
+            index.add_topic(topic, questions, stamp)
+            index.save()
+    banks.on_load.append(on_load)
+    for topic in paths:
+        if banks.is_loaded(topic):
+            on_load(topic, banks[topic])
+    return index
+
+
+def index_all(registry, index):
+    """Garante que todos os tópicos de `registry` estão no índice e atualizados"""
+    banks = registry.banks
+    paths = getattr(banks, "paths", None)
+    for topic in registry.order:
+        stamp = _stamp(paths[topic] if paths is not None else BANK_FILE)
+        if not index.is_current(topic, stamp):
+            # Carregar o shard já indexa o tópico (on_load)
+            questions = banks[topic]
+            if not index.is_current(topic, stamp):
+                index.add_topic(topic, questions, stamp)
+    # Tópicos que saíram do banco não ficam no índice
+    for topic in list(index.topics):
+        if topic not in registry:
+            del index.topics[topic]
+            index.dirty = True
+    if index.dirty:
+        index.save()
+    return index
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Busca perguntas por palavras-chave (sem acentos, sem caixa)")
+    parser.add_argument("consulta", help="termos que devem aparecer na pergunta ou nas opções; `prefixo*` vale")
+    parser.add_argument("--limite", type=int, default=20, help="máximo de perguntas exibidas")
+    args = parser.parse_args()
+
+    registry = default_registry()
+    start = time.perf_counter()
+    index = index_all(registry, open_index(registry))
+    loaded = time.perf_counter()
+    results = index.query(args.consulta)
+    elapsed = time.perf_counter() - loaded
+
+    total = sum(len(found) for found in results.values())
+    shown = 0
+    for topic, found in results.items():
+        bank = registry.bank(topic)
+        for i in found:
+            if shown >= args.limite:
+                break
+            print(f"{topic} #{i}: {bank[i].pergunta}")
+            shown += 1
+    print(f"{total} pergunta(s) em {elapsed * 1000:.2f} ms (índice pronto em {(loaded - start) * 1000:.0f} ms)",
+          file=sys.stderr)
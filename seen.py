@@ -0,0 +1,173 @@
+"""Perguntas já vistas por jogador, entre partidas e entre execuções.
+
+Cada tópico tem um bitset (`bytearray`, um bit por pergunta) com as
+perguntas que o jogador já viu. Reiniciar o jogo não apaga o conjunto: ele
+só é zerado quando o jogador viu todas as perguntas do tópico. Para achar
+uma pergunta ainda não vista, o sorteio tenta algumas posições aleatórias e,
+se todas já foram vistas, procura o próximo bit zerado a partir de uma
+posição aleatória, pulando blocos de bytes 0xFF de uma vez.
+
+Os bitsets de um jogador são salvos juntos em `seen/<jogador>.bin`.
+"""
+import os
+import random
+import struct
+
+from spaced import player_directory
+
+SEEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "seen")
+
+MAGIC = b"TRVS"
+VERSION = 1
+HEADER = struct.Struct("<4sHH")
+TOPIC = struct.Struct("<HI")
+
+PROBES = 4          # Tentativas aleatórias antes da busca pelo próximo bit zerado
+CHUNK = 4096        # Bytes examinados por vez na busca
+
+
+class SeenSet:
+    def __init__(self, size, data=None):
+        self.size = size
+        n_bytes = (size + 7) // 8
+        if data is None or len(data) != n_bytes:
+            self.bits = bytearray(n_bytes)
+            self._fill_padding()
+            self.count = 0
+        else:
+            self.bits = bytearray(data)
+            self._fill_padding()
+            self.count = sum(bin(byte).count("1") for byte in self.bits) - (n_bytes * 8 - size)
+
+    def _fill_padding(self):
+        # Os bits depois do fim do banco ficam sempre ligados e nunca são sorteados
+        extra = len(self.bits) * 8 - self.size
+        if extra:
+            self.bits[-1] |= (0xFF << (8 - extra)) & 0xFF
+
+    def __contains__(self, index):
+        return self.bits[index >> 3] >> (index & 7) & 1
+
+    def add(self, index):
+        mask = 1 << (index & 7)
+        byte = self.bits[index >> 3]
+        if not byte & mask:
+            self.bits[index >> 3] = byte | mask
+            self.count += 1
+
+    def clear(self):
+        self.bits = bytearray(len(self.bits))
+        self._fill_padding()
+        self.count = 0
+
+    def is_full(self):
+        return self.count >= self.size
+
+    def next_unset(self, start):
+        """Primeira posição não vista a partir de `start`, dando a volta no fim; None se todas vistas"""
+        found = self._scan(start, self.size)
+        if found is None and start:
+            found = self._scan(0, start)
+        return found
+
+    def _scan(self, start, end):
+        bits = self.bits
+        byte_i = start >> 3
+        # No primeiro byte, ignora os bits antes de `start`
+        byte = bits[byte_i] | ((1 << (start & 7)) - 1)
+        last_byte = (end - 1) >> 3
+        while True:
+            if byte != 0xFF:
+                bit = byte_i * 8 + ((~byte) & (byte + 1)).bit_length() - 1
+                return bit if bit < end else None
+            byte_i += 1
+            if byte_i > last_byte:
+                return None
+            # Pula de uma vez os bytes completamente vistos
+            chunk = bits[byte_i:min(byte_i + CHUNK, last_byte + 1)]
+            skipped = len(chunk) - len(chunk.lstrip(b"\xff"))
+            byte_i += skipped
+            if byte_i > last_byte:
+                return None
+            byte = bits[byte_i]
+
+
+class NoRepeatSampler:
+    """Sorteia só perguntas ainda não vistas pelo jogador"""
+
+    def __init__(self, seen, rng=random):
+        self.seen = seen
+        self.size = seen.size
+        self.rng = rng
+
+    def reset(self):
+        """Reiniciar o jogo não esquece o que o jogador já viu"""
+
+    def draw(self):
+        if self.size <= 0:
+            raise IndexError("não há perguntas para sortear")
+        seen = self.seen
+        if seen.is_full():
+            # Tópico realmente esgotado: só agora as perguntas podem se repetir
+            seen.clear()
+        for _ in range(PROBES):
+            index = self.rng.randrange(self.size)
+            if index not in seen:
+                break
+        else:
+            index = seen.next_unset(self.rng.randrange(self.size))
+        seen.add(index)
+        return index
+
+    def record(self, index, correct):
+        """O conjunto é marcado quando a pergunta é sorteada"""
+
+
+class SeenStore:
+    """Bitsets de um jogador, um por tópico, salvos em um único arquivo"""
+
+    def __init__(self, player, base=SEEN_DIR):
+        self.path = player_directory(player, base) + ".bin"
+        self.sets = {}
+        self._saved = {}
+        if os.path.exists(self.path):
+            self._load()
+
+    def _load(self):
+        with open(self.path, "rb") as f:
+            magic, version, n_topics = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{self.path}: arquivo de perguntas vistas inválido")
+            for _ in range(n_topics):
+                name_len, size = TOPIC.unpack(f.read(TOPIC.size))
+                name = f.read(name_len).decode("utf-8")
+                self._saved[name] = (size, f.read((size + 7) // 8))
+
+    def get(self, topic, size):
+        seen = self.sets.get(topic)
+        if seen is None:
+            saved_size, data = self._saved.pop(topic, (size, None))
+            # Se o banco mudou de tamanho, o conjunto salvo não vale mais
+            seen = self.sets[topic] = SeenSet(size, data if saved_size == size else None)
+        return seen
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        topics = {name: (seen.size, bytes(seen.bits)) for name, seen in self.sets.items()}
+        for name, saved in self._saved.items():
+            topics.setdefault(name, saved)
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, len(topics)))
+            for name, (size, data) in topics.items():
+                encoded = name.encode("utf-8")
+                f.write(TOPIC.pack(len(encoded), size))
+                f.write(encoded)
+                f.write(data)
+        os.replace(tmp, self.path)
+
+    def sampler_factory(self, rng=random):
+        """Fábrica de `NoRepeatSampler` no formato esperado por `GameEngine`"""
+        def factory(topic, size):
+            return NoRepeatSampler(self.get(topic, size), rng)
+        return factory
@@ -0,0 +1,222 @@
+"""Servidor multijogador de trivia sobre asyncio (somente biblioteca padrão).
+
+Cada conexão TCP é uma sessão com as mesmas regras do jogo (`GameEngine`):
+vidas, pontuação, troca automática de tópico no erro e escolha de tópico
+após um acerto. Os jogadores entram em salas; cada sala sorteia uma única
+sequência de perguntas por tópico e guarda cada pergunta já serializada,
+então a pergunta é codificada uma vez por sala e não uma vez por jogador.
+
+Protocolo: uma mensagem JSON por linha, nos dois sentidos.
+
+    cliente -> servidor
+        {"op": "entrar", "sala": "nome"}       sempre a primeira mensagem
+        {"op": "responder", "opcao": 0-3}
+        {"op": "topico", "topico": "kpop"}     depois de um acerto
+        {"op": "reiniciar"}
+
+    servidor -> cliente
+        {"tipo": "pergunta", "topico", "titulo", "pergunta", "opcoes"}
+        {"tipo": "estado", "pontos", "vidas", "numero", "estado"}
+        {"tipo": "resultado", "correto", "resposta_correta", "pontos", "vidas", "estado"}
+        {"tipo": "erro", "mensagem"}
+
+Uso:
+    python server.py [--host 127.0.0.1] [--port 8765]
+"""
+import argparse
+import asyncio
+import json
+
+from engine import GameEngine
+from sampler import LazyPermutation
+from topics import default_registry
+
+
+def encode(message):
+    return json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+class Room:
+    """Sala: sequência de perguntas compartilhada e perguntas já serializadas"""
+
+    def __init__(self, name, topics):
+        self.name = name
+        self.topics = topics
+        self.players = 0
+        self._sequences = {}
+        self._samplers = {}
+        self._payloads = {}
+
+    def question_at(self, topic, position):
+        """Índice da pergunta na posição `position` da sequência do tópico.
+
+        A sequência é uma única permutação do banco, estendida sob demanda e
+        repetida quando o jogador chega ao fim dela.
+        """
+        sequence = self._sequences.get(topic)
+        if sequence is None:
+            sequence = self._sequences[topic] = []
+            self._samplers[topic] = LazyPermutation(len(self.topics.bank(topic)))
+        size = self._samplers[topic].size
+        position %= size
+        while len(sequence) <= position:
+            sequence.append(self._samplers[topic].draw())
+        return sequence[position]
+
+    def payload(self, topic, index):
+        """Mensagem "pergunta" serializada, montada uma vez por sala"""
+        key = (topic, index)
+        data = self._payloads.get(key)
+        if data is None:
+            question = self.topics.bank(topic)[index]
+            data = self._payloads[key] = encode({
+                "tipo": "pergunta",
+                "topico": topic,
+                "titulo": self.topics[topic].titulo,
+                "pergunta": question.pergunta,
+                "opcoes": list(question.opcoes),
+            })
+        return data
+
+
+class Session(GameEngine):
+    """Partida de um jogador; as perguntas seguem a sequência da sala"""
+
+    def __init__(self, room):
+        self.room = room
+        # Posição do jogador na sequência de cada tópico; continua após reiniciar
+        self.cursors = {}
+        super().__init__(room.topics)
+
+    def get_current_question(self):
+        topic = self.current_topic
+        position = self.cursors.get(topic, 0)
+        self.cursors[topic] = position + 1
+        self.current_index = self.room.question_at(topic, position)
+        return self.topics.bank(topic)[self.current_index]
+
+    def question_messages(self):
+        return self.room.payload(self.current_topic, self.current_index) + self.state_message()
+
+    def state_message(self):
+        return encode({
+            "tipo": "estado",
+            "pontos": self.score,
+            "vidas": self.lives,
+            "numero": self.question_count,
+            "estado": self.game_state,
+        })
+
+
+class TriviaServer:
+    def __init__(self, topics=None):
+        self.topics = default_registry() if topics is None else topics
+        self.rooms = {}
+        self.connections = 0
+        self.answers = 0
+
+    def join(self, name):
+        room = self.rooms.get(name)
+        if room is None:
+            room = self.rooms[name] = Room(name, self.topics)
+        room.players += 1
+        return room
+
+    def leave(self, room):
+        room.players -= 1
+        if room.players == 0:
+            del self.rooms[room.name]
+
+    def handle(self, session, message):
+        """Aplica uma mensagem do cliente à sessão e devolve os bytes de resposta"""
+        op = message.get("op")
+        if op == "responder":
+            opcao = message.get("opcao")
+            if not isinstance(opcao, int) or not 0 <= opcao < 4:
+                return encode({"tipo": "erro", "mensagem": "opção inválida"})
+            if session.game_state != "question":
+                return encode({"tipo": "erro", "mensagem": "não há pergunta aguardando resposta"})
+            result = session.answer(opcao)
+            self.answers += 1
+            reply = encode({
+                "tipo": "resultado",
+                "correto": result.correct,
+                "resposta_correta": result.question.resposta_correta,
+                "pontos": result.score,
+                "vidas": result.lives,
+                "estado": session.game_state,
+            })
+            if result.game_over:
+                # Assim como na interface, o jogo recomeça após o game over
+                session.restart()
+                return reply + session.question_messages()
+            if session.game_state == "question":
+                return reply + session.question_messages()
+            return reply
+        if op == "topico":
+            if session.game_state != "topic_choice":
+                return encode({"tipo": "erro", "mensagem": "escolha de tópico só após um acerto"})
+            if message.get("topico") not in session.topics:
+                return encode({"tipo": "erro", "mensagem": "tópico desconhecido"})
+            session.choose_topic(message["topico"])
+            return session.question_messages()
+        if op == "reiniciar":
+            session.restart()
+            return session.question_messages()
+        return encode({"tipo": "erro", "mensagem": f"operação desconhecida: {op}"})
+
+    async def serve_client(self, reader, writer):
+        self.connections += 1
+        room = None
+        try:
+            line = await reader.readline()
+            try:
+                message = json.loads(line)
+            except ValueError:
+                message = None
+            if not isinstance(message, dict) or message.get("op") != "entrar":
+                writer.write(encode({"tipo": "erro", "mensagem": "envie {\"op\": \"entrar\"} primeiro"}))
+                return
+            room = self.join(str(message.get("sala", "")))
+            session = Session(room)
+            session.next_question()
+            writer.write(session.question_messages())
+
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    writer.write(encode({"tipo": "erro", "mensagem": "JSON inválido"}))
+                    continue
+                if not isinstance(message, dict):
+                    writer.write(encode({"tipo": "erro", "mensagem": "mensagem deve ser um objeto"}))
+                    continue
+                writer.write(self.handle(session, message))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            if room is not None:
+                self.leave(room)
+            writer.close()
+
+    async def serve(self, host, port):
+        # backlog alto para aceitar rajadas de milhares de conexões
+        server = await asyncio.start_server(self.serve_client, host, port, backlog=4096)
+        async with server:
+            await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor multijogador do Trivia Game")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    try:
+        asyncio.run(TriviaServer().serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,171 @@
+"""Modo de treino com repetição espaçada (caixas de Leitner).
+
+Cada pergunta respondida vai para uma caixa: um acerto a promove para a
+próxima caixa, um erro a devolve para a primeira. A caixa define depois de
+quantas respostas naquele tópico a pergunta volta a aparecer. As perguntas
+pendentes ficam em um heap ordenado pelo momento de revisão, então a
+próxima pergunta sai em O(log n) sem percorrer o banco; quando nada está
+pendente, entra uma pergunta ainda não vista. Para as perguntas erradas
+(sempre pendentes de novo logo) não impedirem que o resto do banco
+apareça, pelo menos uma a cada `NEW_EVERY` perguntas é nova enquanto
+houver perguntas não vistas.
+
+O agendamento de cada jogador é salvo em um log só de acréscimos (um
+arquivo por tópico), com um registro pequeno por resposta. O log é
+compactado de tempos em tempos para não crescer sem limite.
+"""
+import heapq
+import os
+import random
+import re
+import struct
+
+from sampler import LazyPermutation
+
+SRS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "srs")
+
+# Intervalo de revisão de cada caixa, em respostas dadas no tópico
+INTERVALS = (3, 6, 12, 24, 48, 96)
+# Uma pergunta nova a cada tantas sorteadas, mesmo com revisões pendentes
+NEW_EVERY = 4
+
+RECORD = struct.Struct("<IIB")  # relógio, índice da pergunta, caixa
+
+
+class ReviewLog:
+    """Log de acréscimos com o estado (caixa, relógio) das perguntas de um tópico"""
+
+    def __init__(self, path):
+        self.path = path
+        self.records = 0
+
+    def load(self):
+        """Lê o log e devolve ({índice: (caixa, relógio da última resposta)}, relógio atual)"""
+        boxes = {}
+        clock = 0
+        if not os.path.exists(self.path):
+            return boxes, clock
+        with open(self.path, "rb") as f:
+            data = f.read()
+        # Um registro incompleto no fim (queda no meio da escrita) é ignorado
+        usable = len(data) - len(data) % RECORD.size
+        for when, index, box in RECORD.iter_unpack(data[:usable]):
+            boxes[index] = (box, when)
+            clock = max(clock, when)
+        self.records = usable // RECORD.size
+        return boxes, clock
+
+    def append(self, clock, index, box):
+        with open(self.path, "ab") as f:
+            f.write(RECORD.pack(clock, index, box))
+        self.records += 1
+
+    def compact(self, boxes):
+        """Reescreve o log só com o estado atual de cada pergunta"""
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(b"".join(RECORD.pack(when, index, box) for index, (box, when) in boxes.items()))
+        os.replace(tmp, self.path)
+        self.records = len(boxes)
+
+
+class SpacedRepetitionSampler:
+    def __init__(self, size, log, rng=random):
+        self.size = size
+        self.log = log
+        self.rng = rng
+        self.boxes, self.clock = log.load()
+        self._new = LazyPermutation(size, rng)
+        self._due = []
+        self._due_at = {}
+        for index, (box, when) in self.boxes.items():
+            if index < size:
+                self._schedule(index, when + INTERVALS[box])
+        self._pending = None
+        self._since_new = 0  # Revisões seguidas desde a última pergunta nova
+
+    def _schedule(self, index, due):
+        self._due_at[index] = due
+        heapq.heappush(self._due, (due, index))
+
+    def _pop_due(self, only_ready):
+        """Remove e devolve a pergunta com revisão mais próxima (ou None)"""
+        due = self._due
+        while due:
+            when, index = due[0]
+            if self._due_at.get(index) != when:
+                heapq.heappop(due)  # Entrada antiga: a pergunta foi reagendada depois
+                continue
+            if only_ready and when > self.clock:
+                return None
+            heapq.heappop(due)
+            del self._due_at[index]
+            return index
+        return None
+
+    def _pop_new(self):
+        """Uma pergunta ainda não vista, ou None se todas já foram vistas"""
+        if len(self.boxes) >= self.size:
+            return None
+        while True:
+            if self._new.remaining() == 0:
+                self._new.reset()
+            index = self._new.draw()
+            if index not in self.boxes:
+                return index
+
+    def reset(self):
+        """O agendamento continua entre partidas; só devolve a pergunta sorteada e não respondida"""
+        self._restore_pending()
+
+    def _restore_pending(self):
+        pending = self._pending
+        self._pending = None
+        if pending is not None and pending in self.boxes:
+            box, when = self.boxes[pending]
+            self._schedule(pending, when + INTERVALS[box])
+
+    def draw(self):
+        if self.size <= 0:
+            raise IndexError("não há perguntas para sortear")
+        self._restore_pending()
+        index = None
+        if self._since_new < NEW_EVERY - 1:
+            index = self._pop_due(only_ready=True)
+        if index is None:
+            index = self._pop_new()
+        if index is None:
+            index = self._pop_due(only_ready=False)
+        self._since_new = 0 if index not in self.boxes else self._since_new + 1
+        self._pending = index
+        return index
+
+    def record(self, index, correct):
+        """Move a pergunta de caixa e agenda a próxima revisão"""
+        self.clock += 1
+        box = self.boxes.get(index, (0, 0))[0]
+        box = min(box + 1, len(INTERVALS) - 1) if correct else 0
+        self.boxes[index] = (box, self.clock)
+        if self._pending == index:
+            self._pending = None
+        self._schedule(index, self.clock + INTERVALS[box])
+
+        self.log.append(self.clock, index, box)
+        if self.log.records > 4 * len(self.boxes) + 1024:
+            self.log.compact(self.boxes)
+
+
+def player_directory(player, base=SRS_DIR):
+    """Pasta com os logs do jogador (o nome vira um nome de arquivo seguro)"""
+    safe = re.sub(r"[^\w.-]+", "_", player).strip("._") or "jogador"
+    return os.path.join(base, safe)
+
+
+def spaced_factory(player, base=SRS_DIR, rng=random):
+    """Fábrica de `SpacedRepetitionSampler` no formato esperado por `GameEngine`"""
+    directory = player_directory(player, base)
+    os.makedirs(directory, exist_ok=True)
+
+    def factory(topic, size):
+        return SpacedRepetitionSampler(size, ReviewLog(os.path.join(directory, f"{topic}.log")), rng)
+    return factory
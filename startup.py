@@ -0,0 +1,47 @@
+"""Medição do tempo de inicialização do jogo.
+
+Inspirado no `python -X importtime`: registra quanto tempo cada fase da
+inicialização levou (e quanto tempo cada import tardio custou) até a
+primeira pergunta aparecer na tela, e imprime um relatório no mesmo estilo.
+
+    python main.py --startup-report
+"""
+import importlib
+import sys
+import time
+
+
+class StartupTimer:
+    def __init__(self, started=None):
+        self.started = time.perf_counter() if started is None else started
+        self._last = self.started
+        self.phases = []
+        self.imports = []
+
+    def mark(self, phase):
+        """Fecha a fase atual: tempo desde a marca anterior e desde o início"""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last, now - self.started))
+        self._last = now
+
+    def timed_import(self, name):
+        """Importa `name` registrando o tempo gasto (zero se já estava carregado)"""
+        cached = name in sys.modules
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        self.imports.append((name, time.perf_counter() - start, cached))
+        return module
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def report(self, file=None):
+        file = file or sys.stderr
+        print("startup: self [us] | cumulative | fase", file=file)
+        for phase, own, cumulative in self.phases:
+            print(f"startup: {own * 1e6:9.0f} | {cumulative * 1e6:10.0f} | {phase}", file=file)
+        if self.imports:
+            print("import:  self [us] | módulo", file=file)
+            for name, own, cached in self.imports:
+                note = " (já carregado)" if cached else ""
+                print(f"import:  {own * 1e6:9.0f} | {name}{note}", file=file)
@@ -0,0 +1,42 @@
+"""Validação de duplicatas ao carregar, inclusive de bancos já carregados."""
+import json
+import os
+import sys
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bankloader import ShardedBanks  # noqa: E402
+from dedup import DuplicateQuestionWarning, validate_on_load  # noqa: E402
+from topics import Topic, TopicRegistry  # noqa: E402
+
+QUESTIONS = [
+    {"pergunta": "Em que ano o BTS estreou?", "opcoes": ["2011", "2012", "2013", "2014"], "resposta_correta": 2},
+    {"pergunta": "Em que ano o BTS estreou oficialmente?", "opcoes": ["2011", "2012", "2013", "2014"],
+     "resposta_correta": 2},
+    {"pergunta": "Qual linguagem usa indentação como bloco?", "opcoes": ["C", "Python", "Java", "Go"],
+     "resposta_correta": 1},
+]
+
+
+def registry(tmp_path):
+    for topic in ("alfa", "beta"):
+        with open(tmp_path / f"{topic}.jsonl", "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(record) + "\n" for record in QUESTIONS)
+    return TopicRegistry([Topic("alfa"), Topic("beta")], ShardedBanks(str(tmp_path)))
+
+
+def duplicate_warnings(caught):
+    return [w for w in caught if issubclass(w.category, DuplicateQuestionWarning)]
+
+
+def test_validates_loaded_and_later_banks(tmp_path):
+    topics = registry(tmp_path)
+    topics.bank("alfa")  # Já carregado antes do gancho (como faz o índice do --filtro)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        validate_on_load(topics)
+        assert len(duplicate_warnings(caught)) == 1
+        topics.bank("beta")
+        assert len(duplicate_warnings(caught)) == 2
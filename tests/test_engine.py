@@ -0,0 +1,36 @@
+"""Regras do motor que valem para todos os clientes (interface, servidor, cluster)."""
+import os
+import random
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from cluster import _apply  # noqa: E402
+from engine import GameEngine  # noqa: E402
+from topics import default_registry  # noqa: E402
+
+
+def test_choose_topic_only_after_correct_answer():
+    engine = GameEngine(rng=random.Random(1))
+    engine.next_question()
+    with pytest.raises(ValueError):
+        engine.choose_topic(engine.topics.order[-1])
+    assert engine.game_state == "question"
+    assert engine.question_count == 1
+
+    engine.answer(engine.displayed_correct())
+    engine.choose_topic(engine.topics.order[-1])
+    assert engine.question_count == 2
+
+
+def test_cluster_rejects_topic_while_question_pending():
+    sessions = {}
+    topics = default_registry()
+    before = _apply(sessions, topics, ("entrar", "b", None))
+    with pytest.raises(ValueError):
+        _apply(sessions, topics, ("topico", "b", topics.order[-1]))
+    assert sessions["b"].question_count == 1
+    assert (sessions["b"].current_topic, sessions["b"].current_index) == before[4:]
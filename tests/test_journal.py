@@ -0,0 +1,44 @@
+"""Recuperação do diário só na mesma variante do jogo."""
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from journal import Journal  # noqa: E402
+from replay import LoggedGame  # noqa: E402
+from sampler import SubsetSampler  # noqa: E402
+
+
+def filtered_game(seed):
+    rng = random.Random(seed)
+    return LoggedGame(None, sampler_factory=lambda topic, size: SubsetSampler([1, 2, 3], rng), rng=rng)
+
+
+def interrupted(directory, variant):
+    engine = filtered_game(1)
+    engine.next_question()
+    journal = Journal(str(directory), variant=variant)
+    journal.start(engine)
+    engine.answer(engine.displayed_correct())
+    journal.close()
+    return engine
+
+
+def test_recover_same_variant(tmp_path):
+    played = interrupted(tmp_path, ("normal", "python"))
+    engine = filtered_game(2)
+    assert Journal(str(tmp_path), variant=("normal", "python")).recover(engine) == 1
+    assert engine.score == played.score
+    assert engine.current_index == played.current_index
+
+
+def test_other_variant_is_discarded(tmp_path):
+    interrupted(tmp_path, ("normal", "python"))
+    engine = LoggedGame(None, rng=random.Random(2))
+    journal = Journal(str(tmp_path), variant=("normal", None))
+    assert journal.recover(engine) is None
+    assert engine.score == 0 and not engine.samplers
+    # Não volta a ser oferecida na próxima abertura
+    assert not Journal(str(tmp_path), variant=("normal", None)).exists()
@@ -0,0 +1,41 @@
+"""Posição no ranking pelo histograma de pontuações."""
+import os
+import sqlite3
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from leaderboard import Leaderboard  # noqa: E402
+
+
+def test_rank_counts_better_scores(tmp_path):
+    board = Leaderboard(str(tmp_path / "placar.db"))
+    for score in (30, 10, 30, 50, 0):
+        board.record(score, 3, {"kpop": [1, 2]})
+    board.flush()
+    assert board.rank(60) == 1
+    assert board.rank(50) == 1
+    assert board.rank(30) == 2
+    assert board.rank(20) == 4
+    assert board.rank(0) == 5
+    board.close()
+
+
+def test_histogram_built_from_existing_games(tmp_path):
+    # Banco de antes do histograma: só a tabela de partidas
+    path = str(tmp_path / "antigo.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE partidas (id INTEGER PRIMARY KEY, pontos INTEGER NOT NULL, "
+                 "perguntas INTEGER NOT NULL, precisao TEXT NOT NULL, criado_em REAL NOT NULL)")
+    conn.executemany("INSERT INTO partidas (pontos, perguntas, precisao, criado_em) VALUES (?, 1, '{}', 0)",
+                     [(20,), (20,), (40,)])
+    conn.commit()
+    conn.close()
+
+    board = Leaderboard(path)
+    assert board.rank(10) == 4
+    board.record(100, 1, {})
+    board.flush()
+    assert board.rank(30) == 3
+    board.close()
@@ -0,0 +1,28 @@
+"""Consultas: normalização e o `*` de prefixo."""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from question import Question  # noqa: E402
+from search import TopicIndex, parse_query  # noqa: E402
+
+
+def test_prefix_marks_only_its_own_word():
+    assert parse_query("program*") == ["program*"]
+    # Um `*` solto não transforma a palavra anterior em prefixo
+    assert parse_query("exo *") == ["exo"]
+    # Palavra comum usada como prefixo continua na consulta
+    assert parse_query("blackpink de*") == ["blackpink", "de*"]
+    assert parse_query("de exo") == ["exo"]
+
+
+def test_stopword_prefix_matches():
+    index = TopicIndex.build([
+        Question("Qual o papel do desenvolvimento ágil?", ("A", "B", "C", "D"), 0),
+        Question("Quem canta no grupo?", ("A", "B", "C", "D"), 0),
+    ])
+    assert index.query(parse_query("de*")) == [0]
+    assert index.query(parse_query("papel de*")) == [0]
+    assert index.query(parse_query("grupo de*")) == []
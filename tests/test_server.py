@@ -0,0 +1,58 @@
+"""Partida completa pelo servidor, sem rede: mensagens direto em `TriviaServer.handle`."""
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from server import Session, TriviaServer  # noqa: E402
+
+
+def decode(data):
+    return [json.loads(line) for line in data.decode("utf-8").splitlines()]
+
+
+def start():
+    server = TriviaServer()
+    session = Session(server.join("teste"))
+    session.next_question()
+    return server, session
+
+
+def test_correct_answer_then_topic_choice():
+    server, session = start()
+    correct = session.current_question.resposta_correta
+    replies = decode(server.handle(session, {"op": "responder", "opcao": correct}))
+    assert replies[0]["tipo"] == "resultado"
+    assert replies[0]["correto"] is True
+    assert replies[0]["pontos"] == Session.POINTS_PER_ANSWER
+    assert session.game_state == "topic_choice"
+
+    topic = session.topics.order[-1]
+    replies = decode(server.handle(session, {"op": "topico", "topico": topic}))
+    assert [reply["tipo"] for reply in replies] == ["pergunta", "estado"]
+    assert replies[0]["topico"] == topic
+    assert server.answers == 1
+
+
+def test_wrong_answers_until_game_over_restart():
+    server, session = start()
+    for lives in range(Session.MAX_LIVES - 1, -1, -1):
+        wrong = (session.current_question.resposta_correta + 1) % 4
+        replies = decode(server.handle(session, {"op": "responder", "opcao": wrong}))
+        assert replies[0]["correto"] is False
+        assert replies[0]["vidas"] == lives
+        # Depois de um erro (e também do game over, que reinicia) já vem a próxima pergunta
+        assert replies[1]["tipo"] == "pergunta"
+    assert replies[0]["estado"] == "game_over"
+    assert session.game_state == "question"
+    assert session.lives == Session.MAX_LIVES
+    assert server.answers == Session.MAX_LIVES
+
+
+def test_invalid_messages():
+    server, session = start()
+    assert decode(server.handle(session, {"op": "responder", "opcao": 9}))[0]["tipo"] == "erro"
+    assert decode(server.handle(session, {"op": "topico", "topico": "kpop"}))[0]["tipo"] == "erro"
+    assert decode(server.handle(session, {"op": "voar"}))[0]["tipo"] == "erro"
@@ -0,0 +1,38 @@
+"""Repetição espaçada: perguntas erradas não impedem as novas de aparecer."""
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from spaced import NEW_EVERY, ReviewLog, SpacedRepetitionSampler  # noqa: E402
+
+
+def test_new_questions_keep_coming_with_many_wrong_answers(tmp_path):
+    sampler = SpacedRepetitionSampler(10, ReviewLog(str(tmp_path / "t.log")), random.Random(3))
+    hard = set()
+    drawn = []
+    for _ in range(300):
+        index = sampler.draw()
+        drawn.append(index)
+        # As quatro primeiras perguntas vistas são sempre erradas
+        if len(hard) < 4:
+            hard.add(index)
+        sampler.record(index, index not in hard)
+    assert set(drawn) == set(range(10))
+    # Enquanto há perguntas não vistas, entra uma nova a cada NEW_EVERY sorteios
+    first_seen = sorted(drawn.index(i) for i in range(10))
+    assert all(b - a <= NEW_EVERY for a, b in zip(first_seen, first_seen[1:]))
+
+
+def test_due_reviews_still_come_back(tmp_path):
+    sampler = SpacedRepetitionSampler(1000, ReviewLog(str(tmp_path / "t.log")), random.Random(1))
+    wrong = sampler.draw()
+    sampler.record(wrong, False)
+    drawn = []
+    for _ in range(20):
+        index = sampler.draw()
+        drawn.append(index)
+        sampler.record(index, index != wrong)
+    assert drawn.count(wrong) >= 3
@@ -0,0 +1,48 @@
+"""Banco compilado só é usado se estiver atualizado em relação aos shards."""
+import json
+import os
+import sys
+import warnings
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bankfile import compile_bank  # noqa: E402
+from bankloader import ShardedBanks  # noqa: E402
+from topics import StaleBankWarning, compiled_bank_is_current  # noqa: E402
+
+RECORD = {"pergunta": "Qual linguagem?", "opcoes": ["C", "Python", "Java", "Go"], "resposta_correta": 1}
+
+
+@pytest.fixture
+def bank(tmp_path):
+    shards = tmp_path / "banks"
+    shards.mkdir()
+    shard = shards / "alfa.jsonl"
+    shard.write_text(json.dumps(RECORD) + "\n", encoding="utf-8")
+    compiled = tmp_path / "questions.bin"
+    compile_bank(dict(ShardedBanks(str(shards)).items()), str(compiled))
+    # O compilado é mais novo que o shard
+    os.utime(shard, ns=(10 ** 18, 10 ** 18))
+    os.utime(compiled, ns=(2 * 10 ** 18, 2 * 10 ** 18))
+    return str(compiled), str(shards), shard
+
+
+def test_current_bank(bank):
+    compiled, shards, _ = bank
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert compiled_bank_is_current(compiled, shards)
+
+
+def test_edited_shard_makes_bank_stale(bank):
+    compiled, shards, shard = bank
+    os.utime(shard, ns=(3 * 10 ** 18, 3 * 10 ** 18))
+    with pytest.warns(StaleBankWarning):
+        assert not compiled_bank_is_current(compiled, shards)
+
+
+def test_missing_bank(tmp_path):
+    assert not compiled_bank_is_current(str(tmp_path / "nada.bin"), str(tmp_path))
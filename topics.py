@@ -0,0 +1,109 @@
+"""Registro de tópicos do jogo.
+
+O registro associa o id de cada tópico ao seu banco de perguntas e aos
+textos exibidos na interface, e define a ordem usada na troca automática
+de tópico após um erro. Os textos vêm de `banks/topics.json`; um shard sem
+entrada no manifesto vira um tópico com textos derivados do próprio id.
+"""
+import json
+import os
+import warnings
+
+from bankfile import MappedBank
+from bankloader import BANKS_DIR, SHARD_EXTENSIONS, ShardedBanks
+
+MANIFEST = "topics.json"
+
+# Banco compilado opcional (gerado com `python bankfile.py questions.bin`)
+BANK_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "questions.bin")
+
+
+class StaleBankWarning(UserWarning):
+    """O banco compilado é mais antigo que algum shard de `banks/`"""
+
+
+class Topic:
+    __slots__ = ("id", "nome", "titulo")
+
+    def __init__(self, id, nome=None, titulo=None):
+        self.id = id
+        self.nome = nome or id.capitalize()      # Texto da opção na escolha de tópico
+        self.titulo = titulo or id.upper()       # Texto exibido acima da pergunta
+
+
+class TopicRegistry:
+    def __init__(self, topics, banks):
+        if not topics:
+            raise ValueError("nenhum tópico registrado")
+        self.banks = banks
+        self.topics = {}
+        for topic in topics:
+            if topic.id not in banks:
+                raise ValueError(f"tópico '{topic.id}' não tem banco de perguntas")
+            self.topics[topic.id] = topic
+        self.order = list(self.topics)
+        self.default = self.order[0]
+        # Próximo tópico na troca automática, em ordem circular
+        self._next = dict(zip(self.order, self.order[1:] + self.order[:1]))
+
+    def __contains__(self, topic_id):
+        return topic_id in self.topics
+
+    def __iter__(self):
+        return iter(self.topics.values())
+
+    def __len__(self):
+        return len(self.topics)
+
+    def __getitem__(self, topic_id):
+        return self.topics[topic_id]
+
+    def bank(self, topic_id):
+        return self.banks[topic_id]
+
+    def next_topic(self, topic_id):
+        return self._next[topic_id]
+
+
+def load_registry(banks=None, directory=BANKS_DIR):
+    """Monta o registro a partir dos bancos e do manifesto `topics.json` de `directory`"""
+    if banks is None:
+        banks = ShardedBanks(directory)
+
+    entries = []
+    manifest = os.path.join(directory, MANIFEST)
+    if os.path.exists(manifest):
+        with open(manifest, encoding="utf-8") as f:
+            entries = json.load(f)
+
+    topics = [Topic(entry["id"], entry.get("nome"), entry.get("titulo"))
+              for entry in entries if entry["id"] in banks]
+    listed = {topic.id for topic in topics}
+    topics.extend(Topic(topic_id) for topic_id in banks if topic_id not in listed)
+    return TopicRegistry(topics, banks)
+
+
+def compiled_bank_is_current(path=BANK_FILE, directory=BANKS_DIR):
+    """O banco compilado existe e nenhum shard de `directory` foi alterado depois dele?"""
+    try:
+        compiled = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return False
+    try:
+        entries = list(os.scandir(directory))
+    except FileNotFoundError:
+        return True
+    for entry in entries:
+        if os.path.splitext(entry.name)[1] in SHARD_EXTENSIONS and entry.stat().st_mtime_ns > compiled:
+            warnings.warn(f"{path} é mais antigo que {entry.path}; usando os shards "
+                          f"(recompile com `python bankfile.py {os.path.basename(path)}`)",
+                          StaleBankWarning, stacklevel=2)
+            return False
+    return True
+
+
+def default_registry():
+    """Registro padrão: o banco compilado se `questions.bin` existir e estiver atualizado, senão os shards"""
+    if compiled_bank_is_current():
+        return load_registry(MappedBank(BANK_FILE).topics)
+    return load_registry()